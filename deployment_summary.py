@@ -1,5 +1,5 @@
 # Generate final summary and file listing
-from pathlib import Path
+import os
 
 print("=" * 70)
 print("FORENSIC TIME PLUGIN MODULE - DEPLOYMENT PACKAGE")
@@ -25,9 +25,13 @@ files = [
     ("ISS_MODULE_V2_SPEC.md", "ISS Module v2 Specification")
 ]
 
+# One directory read answers existence for every deliverable
+entries = {entry.name: entry for entry in os.scandir(".")}
+
 for path, desc in files:
-    exists = "✅" if Path(path).exists() else "❌"
-    size = Path(path).stat().st_size if Path(path).exists() else 0
+    entry = entries.get(path)
+    exists = "✅" if entry is not None else "❌"
+    size = entry.stat().st_size if entry is not None else 0
     print(f"{exists} {desc}")
     print(f"   📁 {path}")
     if size:
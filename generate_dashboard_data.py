@@ -15,11 +15,18 @@ from src.models import DALSRecord, GOATRecord, TrueMarkNFTMint, NFTRecord
 from datetime import datetime
 import json
 
+# Shared sample contract and minter addresses
+NFT_CONTRACT = "0x1234567890123456789012345678901234567890"
+MINTER_ADDRESS = "0xabcdef1234567890abcdef1234567890abcdef12"
+
 def generate_sample_data():
     """Generate sample data for dashboard testing"""
 
     dashboard = DashboardService()
 
+    # One timestamp for the whole sample set
+    now_iso = datetime.now().isoformat()
+
     print("🔄 Generating sample dashboard data...")
 
     # Sample DALS Records
@@ -33,8 +40,8 @@ def generate_sample_data():
                 {"from": "creator", "to": "user_001", "timestamp": "2024-01-01T10:00:00Z"}
             ],
             metadata={"title": "Digital Masterpiece", "artist": "Artist One"},
-            created_at=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat()
+            created_at=now_iso,
+            last_updated=now_iso
         ),
         DALSRecord(
             record_id="",
@@ -45,13 +52,13 @@ def generate_sample_data():
                 {"from": "creator", "to": "user_002", "timestamp": "2024-01-02T14:30:00Z"}
             ],
             metadata={"title": "Epic Symphony", "artist": "Composer Two"},
-            created_at=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat()
+            created_at=now_iso,
+            last_updated=now_iso
         )
     ]
 
-    for record in dals_records:
-        record_id = dashboard.create_dals_record(record)
+    for record_id in dashboard.append_records(
+            dashboard.dals_file, [record.model_dump() for record in dals_records]):
         print(f"✅ Created DALS record: {record_id}")
 
     # Sample GOAT Records
@@ -63,8 +70,8 @@ def generate_sample_data():
             parameters={"input_size": 1024, "algorithm": "fft"},
             result={"output_size": 512, "processing_time": 2.5},
             execution_time=2.5,
-            created_at=datetime.now().isoformat(),
-            completed_at=datetime.now().isoformat()
+            created_at=now_iso,
+            completed_at=now_iso
         ),
         GOATRecord(
             record_id="",
@@ -73,7 +80,7 @@ def generate_sample_data():
             parameters={"image_url": "https://example.com/image.jpg", "model": "resnet50"},
             result=None,
             execution_time=None,
-            created_at=datetime.now().isoformat(),
+            created_at=now_iso,
             completed_at=None
         ),
         GOATRecord(
@@ -83,43 +90,43 @@ def generate_sample_data():
             parameters={"text_length": 5000, "language": "en"},
             result=None,
             execution_time=None,
-            created_at=datetime.now().isoformat(),
+            created_at=now_iso,
             completed_at=None
         )
     ]
 
-    for record in goat_records:
-        record_id = dashboard.create_goat_record(record)
+    for record_id in dashboard.append_records(
+            dashboard.goat_file, [record.model_dump() for record in goat_records]):
         print(f"✅ Created GOAT record: {record_id}")
 
     # Sample True Mark NFT Mints
     nft_mints = [
         TrueMarkNFTMint(
             mint_id="",
-            nft_contract="0x1234567890123456789012345678901234567890",
+            nft_contract=NFT_CONTRACT,
             token_id="1",
             serial_number="TM-2024-001",
             metadata_uri="ipfs://QmExample123...",
-            minter_address="0xabcdef1234567890abcdef1234567890abcdef12",
+            minter_address=MINTER_ADDRESS,
             royalty_percentage=5.0,
             attributes={"rarity": "legendary", "edition": "1/1"},
-            created_at=datetime.now().isoformat()
+            created_at=now_iso
         ),
         TrueMarkNFTMint(
             mint_id="",
-            nft_contract="0x1234567890123456789012345678901234567890",
+            nft_contract=NFT_CONTRACT,
             token_id="2",
             serial_number="TM-2024-002",
             metadata_uri="ipfs://QmExample456...",
-            minter_address="0xabcdef1234567890abcdef1234567890abcdef12",
+            minter_address=MINTER_ADDRESS,
             royalty_percentage=2.5,
             attributes={"rarity": "rare", "edition": "50/100"},
-            created_at=datetime.now().isoformat()
+            created_at=now_iso
         )
     ]
 
-    for mint in nft_mints:
-        mint_id = dashboard.create_nft_mint(mint)
+    for mint_id in dashboard.append_records(
+            dashboard.nft_mint_file, [mint.model_dump() for mint in nft_mints]):
         print(f"✅ Created NFT mint: {mint_id}")
 
     # Sample NFT Records with internal serial numbers
@@ -134,7 +141,7 @@ def generate_sample_data():
                 {"owner": "user_001", "timestamp": "2024-01-02T15:30:00Z"}
             ],
             verification_status="verified",
-            last_verified=datetime.now().isoformat(),
+            last_verified=now_iso,
             metadata={"collection": "Digital Art Masters", "license": "CC BY-SA"}
         ),
         NFTRecord(
@@ -146,15 +153,18 @@ def generate_sample_data():
                 {"owner": "minter", "timestamp": "2024-01-03T09:15:00Z"}
             ],
             verification_status="pending_verification",
-            last_verified=datetime.now().isoformat(),
+            last_verified=now_iso,
             metadata={"collection": "Music NFTs", "genre": "classical"}
         )
     ]
 
-    for record in nft_records:
-        record_id = dashboard.create_nft_record(record)
+    for record_id in dashboard.append_records(
+            dashboard.nft_records_file, [record.model_dump() for record in nft_records]):
         print(f"✅ Created NFT record: {record_id}")
 
+    # Write any SPICE descriptors still queued by the service
+    dashboard.close()
+
     print("\n🎉 Sample data generation complete!")
     print("📊 Dashboard should now show populated data")
     print("🔍 Try searching for serial numbers: TM-2024-001, DALS-ART-001, etc.")
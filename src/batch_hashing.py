@@ -0,0 +1,33 @@
+"""
+Batch SHA-256 over many preimages
+=================================
+
+Shared by the forensic timekeeper and the immutable SPICE layer for
+whole-chain verification. Hashing stays in-process unless the caller
+asks for worker processes, which only offline tools should do: forking
+a server that already runs threads is unsafe.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from typing import List
+
+# Fewest preimages worth spreading over worker processes, and the smallest
+# chunk handed to one worker; short inputs hold the GIL, so threads won't do
+PARALLEL_HASH_MIN = 32768
+PARALLEL_HASH_CHUNK = 1024
+
+
+def sha256_hex(inputs: List[bytes]) -> List[str]:
+    """SHA-256 hex digests of preimages, in this process (worker entry point)"""
+    return [sha256(b).hexdigest() for b in inputs]
+
+
+def batch_sha256(inputs: List[bytes], workers: int = 1) -> List[str]:
+    """SHA-256 hex digests of many preimages, in up to workers processes when there are enough"""
+    if workers <= 1 or len(inputs) < PARALLEL_HASH_MIN:
+        return sha256_hex(inputs)
+    size = max(PARALLEL_HASH_CHUNK, -(-len(inputs) // workers))
+    chunks = [inputs[i:i + size] for i in range(0, len(inputs), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [h for part in pool.map(sha256_hex, chunks) for h in part]
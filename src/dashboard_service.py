@@ -6,12 +6,27 @@ Provides monitoring and record management for DALS, GOAT, True Mark NFT Mint,
 and NFT records with internal serial number references.
 """
 
+import os
 import json
+import time
+import asyncio
+import atexit
+import heapq
+import sqlite3
 import hashlib
+import threading
+from collections import defaultdict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, BinaryIO, Iterator
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 from .models import (
     DALSRecord, GOATRecord, TrueMarkNFTMint, NFTRecord,
     DashboardSummary, SystemStatus, DashboardData
@@ -19,10 +34,108 @@ from .models import (
 from .immutable_spice_layer import ImmutableSPICELayer
 
 
+# Read size used when streaming JSONL files
+_READ_CHUNK = 1 << 20
+
+# Most list endpoint bodies kept in the JSON cache, least recently used
+# evicted first
+_JSON_CACHE_MAX = 64
+
+# Initial per-record byte guess when reading the tail of a JSONL file
+_TAIL_BYTES_PER_RECORD = 512
+
+# Pre-initialized record id hasher; copy() skips re-running the BLAKE2b
+# parameter block setup for every record
+_ID_HASHER = hashlib.blake2b(digest_size=8, person=b"iss_dash_v1")
+
+# GOAT statuses counted as active operations
+_ACTIVE_GOAT_STATUSES = ("pending", "running")
+
+# Smallest chunk worth shipping to a worker process in bulk appends
+_BULK_MIN_CHUNK = 1000
+
+
+def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    # Match orjson's output: no whitespace, raw UTF-8
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"),
+                      ensure_ascii=False).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# (monotonic stamp, ISO string) of the last datetime.now() call
+_now_cache = [float("-inf"), ""]
+
+
+def _now_iso() -> str:
+    """datetime.now().isoformat(), reused for up to a millisecond.
+
+    Good enough for dashboard metadata; record entries keep exact
+    timestamps since they feed the record id hash.
+    """
+    now = time.monotonic()
+    if now - _now_cache[0] >= 0.001:
+        _now_cache[0] = now
+        _now_cache[1] = datetime.now().isoformat()
+    return _now_cache[1]
+
+
+def _record_line(record: Dict[str, Any]) -> Tuple[str, str, bytes]:
+    """Build the record id, timestamp and JSONL entry bytes for one record"""
+    timestamp = datetime.now().isoformat()
+    ts_bytes = timestamp.encode()
+    payload = _dumps(record, sort_keys=True)
+    # 64-bit id straight from BLAKE2b; SHA-256 lineage lives in the SPICE chain
+    h = _ID_HASHER.copy()
+    h.update(ts_bytes)
+    h.update(payload)
+    record_id = h.hexdigest()
+
+    # The record is serialized exactly once; the entry envelope is
+    # spliced around the same bytes that fed the record id hash
+    line = b''.join((
+        b'{"record_id":"', record_id.encode(),
+        b'","timestamp":"', ts_bytes,
+        b'","data":', payload, b'}\n'
+    ))
+    return record_id, timestamp, line
+
+
+def _serialize_chunk(records: List[Dict[str, Any]]) -> Tuple[List[str], List[str], bytes]:
+    """Serialize a chunk of records into one JSONL fragment (worker entry point);
+    returns the record ids, their timestamps and the fragment"""
+    record_ids = []
+    timestamps = []
+    lines = []
+    for record in records:
+        record_id, timestamp, line = _record_line(record)
+        record_ids.append(record_id)
+        timestamps.append(timestamp)
+        lines.append(line)
+    return record_ids, timestamps, b''.join(lines)
+
+
+def _goat_override(overrides: Dict[str, Dict[str, Any]],
+                   record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Status override for a GOAT entry, keyed by entry id or GOAT record id"""
+    override = overrides.get(record["record_id"])
+    if override is None:
+        override = overrides.get(record["data"].get("record_id"))
+    return override
+
+
 class DashboardService:
     """Service for dashboard operations and system monitoring"""
 
-    def __init__(self, data_dir: str = "data/dashboard"):
+    def __init__(self, data_dir: str = "data/dashboard", spice_batch_size: int = 16):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -33,140 +146,528 @@ class DashboardService:
         self.nft_records_file = self.data_dir / "nft_records.jsonl"
         self.alerts_file = self.data_dir / "system_alerts.jsonl"
 
-        # Initialize files if they don't exist
-        for file_path in [self.dals_file, self.goat_file, self.nft_mint_file,
-                         self.nft_records_file, self.alerts_file]:
-            if not file_path.exists():
-                file_path.touch()
+        # GOAT status sidecar: record_id -> current status. Base records stay
+        # append-only; status updates overwrite a single keyed row.
+        self.goat_status_file = self.data_dir / "goat_status.index"
+        # One WAL connection per thread, opened on first use and then reused:
+        # endpoints read statuses from worker threads while writes come from
+        # the event loop, and WAL lets those readers run alongside the writer
+        self._status_local = threading.local()
+        self._status_conns: List[sqlite3.Connection] = []
+        self._status_conns_lock = threading.Lock()
+        with self._status_db:
+            self._status_db.execute(
+                "CREATE TABLE IF NOT EXISTS goat_status ("
+                "record_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+                "result TEXT, updated_at TEXT NOT NULL)"
+            )
+
+        # Parsed records per file: (mtime_ns, size, records). Files are
+        # append-only, so a cached list stays valid until the file grows.
+        self._cache: Dict[Path, Tuple[int, int, List[Dict[str, Any]]]] = {}
+        # Guards the record cache and the descriptor queue: appends run in
+        # RecordWriteCoalescer's worker thread while endpoints read records
+        # from the event loop and the threadpool
+        self._records_lock = threading.RLock()
+
+        # Serial number -> NFT record ids, caught up lazily from the cache
+        self._serial_index: Dict[str, List[str]] = defaultdict(list)
+        self._nft_by_id: Dict[str, Dict[str, Any]] = {}
+        self._serial_source: Optional[List[Dict[str, Any]]] = None
+        self._serial_indexed = 0
+
+        # List endpoint bodies per (file, limit, cursor): (cached records
+        # list, its length, GOAT status version, JSON bytes, row count), in
+        # least recently used order and at most _JSON_CACHE_MAX of them
+        self._json_cache: Dict[Tuple[Path, Optional[int], int],
+                               Tuple[List[Dict[str, Any]], int, int, bytes, int]] = {}
+        self._goat_status_version = 0
+
+        # Long-lived unbuffered append handles; O_APPEND keeps each record
+        # write atomic, so no per-record open/close is needed. Opening in
+        # 'ab' mode also creates any missing file.
+        self._handles: Dict[Path, BinaryIO] = {
+            file_path: open(file_path, 'ab', buffering=0)
+            for file_path in [self.dals_file, self.goat_file, self.nft_mint_file,
+                              self.nft_records_file, self.alerts_file]
+        }
 
-        # SPICE layer for tamper-evident logging
+        # SPICE layer for tamper-evident logging; descriptors are queued and
+        # written in batches of spice_batch_size
         self.spice_layer = ImmutableSPICELayer()
+        self.spice_batch_size = max(1, spice_batch_size)
+        self._pending_descriptors: List[Tuple[Path, str]] = []
+
+        # Invariant descriptor fields per file; only the record id range varies
+        self._desc_templates: Dict[Path, Dict[str, Any]] = {}
+        self._bulk_desc_templates: Dict[Path, Dict[str, Any]] = {}
+        for file_path in self._handles:
+            self._desc_templates[file_path] = self._descriptor_template(
+                f"dashboard_record_{file_path.stem}", "jsonl_append")
+            self._bulk_desc_templates[file_path] = self._descriptor_template(
+                f"dashboard_bulk_{file_path.stem}", "jsonl_bulk_append")
+        self._desc_templates[self.goat_status_file] = self._descriptor_template(
+            f"dashboard_status_{self.goat_file.stem}", "status_index_upsert")
+        atexit.register(self.close)
+
+    @property
+    def _status_db(self) -> sqlite3.Connection:
+        """This thread's connection to the GOAT status sidecar"""
+        conn = getattr(self._status_local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.goat_status_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; fsync at checkpoints
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._status_local.conn = conn
+            with self._status_conns_lock:
+                self._status_conns.append(conn)
+        return conn
+
+    @staticmethod
+    def _descriptor_template(process_name: str, append_evidence: str) -> Dict[str, Any]:
+        """Descriptor fields shared by every record appended to one file"""
+        return {
+            "process_name": process_name,
+            "process_version": "1.0",
+            "capability_level": 3,
+            "process_outcome": "compliant",
+            "compliance_score": 1.0,
+            "apriori_refs": [],
+            "evidence_required": ["record_creation"],
+            "evidence_provided": [append_evidence, "spice_logging"],
+            "assessed_by": "dashboard_service",
+            "assessment_method": "automated",
+            "active_constraints": []
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def flush(self):
+        """Write any queued SPICE descriptors, as one group commit"""
+        with self._records_lock:
+            pending, self._pending_descriptors = self._pending_descriptors, []
+            self.spice_layer.create_descriptors_batch([
+                ImmutableSPICELayer.template_args(self._desc_templates[file_path], record_id)
+                for file_path, record_id in pending
+            ])
+
+    def close(self):
+        """Flush queued descriptors and release file handles"""
+        self.flush()
+        for handle in self._handles.values():
+            handle.close()
+        with self._status_conns_lock:
+            for conn in self._status_conns:
+                conn.close()
+            self._status_conns.clear()
+        self._status_local = threading.local()
+        self.spice_layer.close()
+        atexit.unregister(self.close)
 
     def _append_record(self, file_path: Path, record: Dict[str, Any]) -> str:
         """Append a record to a JSONL file with tamper-evident logging"""
-        record_id = hashlib.sha256(
-            f"{datetime.now().isoformat()}{json.dumps(record, sort_keys=True)}".encode()
-        ).hexdigest()[:16]
-
-        record_entry = {
-            "record_id": record_id,
-            "timestamp": datetime.now().isoformat(),
-            "data": record
-        }
-
-        with open(file_path, 'a') as f:
-            f.write(json.dumps(record_entry) + '\n')
-
-        # Log to SPICE layer for tamper-evident audit trail
-        descriptor = self.spice_layer.create_descriptor(
-            process_name=f"dashboard_record_{file_path.stem}",
-            process_version="1.0",
-            capability_level=3,
-            process_outcome="compliant",
-            compliance_score=1.0,
-            apriori_refs=[],
-            aposteriori_refs=[record_id],
-            glyph_range_start=record_id,
-            glyph_range_end=record_id,
-            glyph_count=1,
-            evidence_required=["record_creation"],
-            evidence_provided=["jsonl_append", "spice_logging"],
-            assessed_by="dashboard_service",
-            assessment_method="automated",
-            active_constraints=[]
-        )
+        return self.append_records(file_path, [record])[0]
+
+    def append_records(self, file_path: Path, records: List[Dict[str, Any]]) -> List[str]:
+        """Append records to a JSONL file in one write, each with its own
+        SPICE descriptor as if appended one by one"""
+        record_ids = []
+        entries = []
+        lines = []
+        for record in records:
+            record_id, timestamp, line = _record_line(record)
+            record_ids.append(record_id)
+            entries.append({
+                "record_id": record_id,
+                "timestamp": timestamp,
+                "data": record
+            })
+            lines.append(line)
+        data = b"".join(lines)
+
+        with self._records_lock:
+            self._write_entries(file_path, data, entries)
+            for record_id in record_ids:
+                self._queue_descriptor(file_path, record_id)
+        return record_ids
+
+    def _write_entries(self, file_path: Path, data: bytes, entries: List[Dict[str, Any]]):
+        """Append the JSONL bytes of entries in one write and keep the
+        parsed cache warm; the caller holds _records_lock"""
+        f = self._handles[file_path]
+        f.write(data)
+        # With O_APPEND the position after the write is the end of these
+        # records, even if another writer appended in between
+        start = f.tell() - len(data)
+        st = os.fstat(f.fileno())
+
+        # Keep the cache warm instead of invalidating it
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[1] == start:
+            cached[2].extend(entries)
+            self._cache[file_path] = (st.st_mtime_ns, start + len(data), cached[2])
+
+    def _queue_descriptor(self, file_path: Path, record_id: str):
+        """Queue a SPICE descriptor, writing the batch once it is full"""
+        with self._records_lock:
+            self._pending_descriptors.append((file_path, record_id))
+            if len(self._pending_descriptors) >= self.spice_batch_size:
+                self.flush()
+
+    def bulk_append_records(self, file_path: Path, records: List[Dict[str, Any]],
+                            workers: Optional[int] = None,
+                            log_spice: bool = True) -> List[str]:
+        """Append many records at once, serializing chunks in a process pool.
+
+        JSONL splits cleanly on newlines, so each worker builds an
+        independent fragment and the fragments are appended in order. The
+        whole batch is covered by a single SPICE descriptor over its first
+        and last record ids, or none when log_spice is False (test-data
+        mode); use append_records where every record needs its own. Batches
+        below _BULK_MIN_CHUNK records are serialized in-process.
+        """
+        if not records:
+            return []
+        workers = workers or os.cpu_count() or 1
+        size = max(-(-len(records) // workers), _BULK_MIN_CHUNK)
+        chunks = [records[i:i + size] for i in range(0, len(records), size)]
+
+        if len(chunks) == 1:
+            fragments = [_serialize_chunk(chunks[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                fragments = list(pool.map(_serialize_chunk, chunks))
+
+        # One write per fragment keeps lines whole under O_APPEND
+        record_ids = []
+        with self._records_lock:
+            for chunk, (fragment_ids, timestamps, data) in zip(chunks, fragments):
+                self._write_entries(file_path, data, [
+                    {"record_id": record_id, "timestamp": timestamp, "data": record}
+                    for record_id, timestamp, record in zip(fragment_ids, timestamps, chunk)
+                ])
+                record_ids.extend(fragment_ids)
+
+        if log_spice:
+            self.flush()
+            self.spice_layer.create_descriptor_from_template(
+                self._bulk_desc_templates[file_path], record_ids[0],
+                record_ids[-1], glyph_count=len(record_ids))
+        return record_ids
+
+    def _parse_from(self, file_path: Path, offset: int, records: List[Dict[str, Any]],
+                    stop_at: Optional[int] = None) -> int:
+        """Parse complete JSONL lines from offset onwards into records.
+
+        Returns the offset just past the last complete line, so a partially
+        written trailing line is picked up on the next read. With stop_at,
+        parsing stops once records holds that many entries.
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.lseek(fd, offset, os.SEEK_SET)
+            tail = b""
+            while True:
+                chunk = os.read(fd, _READ_CHUNK)
+                if not chunk:
+                    break
+                line_end = offset - len(tail)
+                offset += len(chunk)
+                lines = (tail + chunk).split(b"\n")
+                tail = lines.pop()
+                if stop_at is not None and len(records) + len(lines) >= stop_at:
+                    # This chunk may complete the prefix; track line ends
+                    for line in lines:
+                        line_end += len(line) + 1
+                        if line and not line.isspace():
+                            records.append(_loads(line))
+                            if len(records) >= stop_at:
+                                return line_end
+                    continue
+                for line in lines:
+                    if line and not line.isspace():
+                        records.append(_loads(line))
+        finally:
+            os.close(fd)
+        return offset - len(tail)
+
+    @staticmethod
+    def _line_ends_at(file_path: Path, offset: int) -> bool:
+        """Whether the byte just before offset is still a newline (an append, not a rewrite)"""
+        if offset == 0:
+            return True
+        with open(file_path, "rb") as f:
+            f.seek(offset - 1)
+            return f.read(1) == b"\n"
+
+    def _load_records(self, file_path: Path, min_count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return all parsed records of a file, re-parsing only appended bytes.
+
+        With min_count, only the first min_count records are guaranteed:
+        the cache is extended just far enough, since appends never change
+        a prefix that has already been parsed. A file that changed without
+        growing past the parsed bytes, or whose parsed bytes no longer end
+        in a newline, was rewritten and is parsed again from the start.
+        """
+        with self._records_lock:
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                return []
+
+            cached = self._cache.get(file_path)
+            if cached is not None:
+                mtime_ns, size, records = cached
+                if st.st_size == size and st.st_mtime_ns == mtime_ns:
+                    return records
+                if st.st_size < size or (st.st_mtime_ns != mtime_ns and (
+                        st.st_size == size or not self._line_ends_at(file_path, size))):
+                    cached = None  # truncated, replaced or rewritten in place
+                elif min_count is not None and len(records) >= min_count:
+                    return records
+
+            if cached is None:
+                records, size = [], 0
+
+            size = self._parse_from(file_path, size, records, min_count)
+            self._cache[file_path] = (st.st_mtime_ns, size, records)
+            return records
+
+    def _tail_records(self, file_path: Path, n: int) -> List[Dict[str, Any]]:
+        """Return the last n records of a file without parsing the rest"""
+        if n <= 0:
+            return []
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return []
 
-        return record_id
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2][-n:]
 
-    def _read_records(self, file_path: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Read records from a JSONL file"""
-        records = []
+        fd = os.open(file_path, os.O_RDONLY)
         try:
-            with open(file_path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        records.append(json.loads(line))
-                        if limit and len(records) >= limit:
-                            break
-        except FileNotFoundError:
-            pass
-        return records
+            end = st.st_size
+            window = _TAIL_BYTES_PER_RECORD * n
+            while True:
+                start = max(0, end - window)
+                os.lseek(fd, start, os.SEEK_SET)
+                data = os.read(fd, end - start)
+                lines = data.split(b"\n")
+                lines.pop()  # empty, or a write still in progress
+                if start > 0:
+                    lines = lines[1:]  # may begin mid-record
+                lines = [line for line in lines if line and not line.isspace()]
+                if len(lines) >= n or start == 0:
+                    return [_loads(line) for line in lines[-n:]]
+                window *= 2
+        finally:
+            os.close(fd)
+
+    def _read_records(self, file_path: Path, limit: Optional[int] = None,
+                      cursor: int = 0) -> List[Dict[str, Any]]:
+        """Read records from a JSONL file, starting at position cursor in file order
+
+        Files are append-only, so a cursor (the count of records already
+        seen) stays stable under concurrent writes; only cursor + limit
+        records are parsed on a cold cache.
+        """
+        records = self._load_records(file_path, cursor + limit if limit else None)
+        return records[cursor:cursor + limit] if limit else records[cursor:]
+
+    def _scan_stats(self, file_path: Path,
+                    overrides: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Single pass over the raw records of a file for status counters"""
+        records = self._load_records(file_path)
+        count = active_ops = 0
+        for record in records:
+            data = record["data"]
+            if data.get("operation_type") == "status_update":
+                continue  # legacy GOAT status rows, folded in as overrides
+            count += 1
+            status = data.get("status")
+            if overrides:
+                override = _goat_override(overrides, record)
+                if override is not None:
+                    status = override["status"]
+            if status in _ACTIVE_GOAT_STATUSES:
+                active_ops += 1
+        return {
+            "count": count,
+            "active_ops": active_ops,
+            "first_ts": records[0]["timestamp"] if records else None,
+            "last_ts": records[-1]["timestamp"] if records else None
+        }
 
     # DALS Operations
     def create_dals_record(self, record: DALSRecord) -> str:
         """Create a new DALS record"""
-        return self._append_record(self.dals_file, record.dict())
+        return self._append_record(self.dals_file, record.model_dump())
 
-    def get_dals_records(self, limit: Optional[int] = None) -> List[DALSRecord]:
+    def get_dals_records(self, limit: Optional[int] = None, cursor: int = 0) -> List[DALSRecord]:
         """Get DALS records"""
-        records = self._read_records(self.dals_file, limit)
+        records = self._read_records(self.dals_file, limit, cursor)
         return [DALSRecord(**record["data"]) for record in records]
 
     # GOAT Operations
     def create_goat_record(self, record: GOATRecord) -> str:
         """Create a new GOAT record"""
-        return self._append_record(self.goat_file, record.dict())
-
-    def get_goat_records(self, limit: Optional[int] = None) -> List[GOATRecord]:
-        """Get GOAT records"""
-        records = self._read_records(self.goat_file, limit)
-        return [GOATRecord(**record["data"]) for record in records]
+        return self._append_record(self.goat_file, record.model_dump())
+
+    def get_goat_records(self, limit: Optional[int] = None, cursor: int = 0) -> List[GOATRecord]:
+        """Get GOAT records with their current status from the sidecar index"""
+        return [GOATRecord(**data) for data in self._goat_rows(limit, cursor)]
+
+    def _goat_rows(self, limit: Optional[int] = None, cursor: int = 0) -> List[Dict[str, Any]]:
+        """GOAT record data with current statuses folded in, from GOAT record cursor on"""
+        # Legacy status rows can follow anywhere, so GOAT always loads in full
+        overrides = self._goat_status_overrides()
+        goat_rows = []
+        skip = cursor
+        for record in self._load_records(self.goat_file):
+            data = record["data"]
+            if data.get("operation_type") == "status_update":
+                continue
+            if skip:
+                skip -= 1
+                continue
+            override = _goat_override(overrides, record)
+            if override is not None:
+                data = dict(data, status=override["status"])
+                if override["result"] is not None:
+                    data["result"] = override["result"]
+            goat_rows.append(data)
+            if limit and len(goat_rows) >= limit:
+                break
+        return goat_rows
+
+    def _goat_status_overrides(self) -> Dict[str, Dict[str, Any]]:
+        """Current status per GOAT record id: legacy update rows, then the index"""
+        overrides = {}
+        for record in self._load_records(self.goat_file):
+            data = record["data"]
+            if data.get("operation_type") == "status_update":
+                overrides[data.get("original_record_id")] = {
+                    "status": data.get("new_status"),
+                    "result": data.get("result") or None
+                }
+        for record_id, status, result in self._status_db.execute(
+                "SELECT record_id, status, result FROM goat_status"):
+            overrides[record_id] = {
+                "status": status,
+                "result": None if result is None else _loads(result)
+            }
+        return overrides
 
     def update_goat_status(self, record_id: str, status: str, result: Optional[Dict] = None) -> bool:
-        """Update GOAT record status"""
-        # This would require more complex logic to update existing records
-        # For now, we'll create a new record with updated status
-        update_record = {
-            "operation_type": "status_update",
-            "original_record_id": record_id,
-            "new_status": status,
-            "result": result or {},
-            "updated_at": datetime.now().isoformat()
-        }
-        self._append_record(self.goat_file, update_record)
+        """Update GOAT record status in the sidecar index"""
+        with self._status_db:
+            self._status_db.execute(
+                "INSERT OR REPLACE INTO goat_status (record_id, status, result, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (record_id, status, None if result is None else _dumps(result).decode(), _now_iso())
+            )
+        self._goat_status_version += 1
+        self._queue_descriptor(self.goat_status_file, record_id)
         return True
 
     # True Mark NFT Mint Operations
     def create_nft_mint(self, mint: TrueMarkNFTMint) -> str:
         """Create a new NFT mint record"""
-        return self._append_record(self.nft_mint_file, mint.dict())
+        return self._append_record(self.nft_mint_file, mint.model_dump())
 
-    def get_nft_mints(self, limit: Optional[int] = None) -> List[TrueMarkNFTMint]:
+    def get_nft_mints(self, limit: Optional[int] = None, cursor: int = 0) -> List[TrueMarkNFTMint]:
         """Get NFT mint records"""
-        records = self._read_records(self.nft_mint_file, limit)
+        records = self._read_records(self.nft_mint_file, limit, cursor)
         return [TrueMarkNFTMint(**record["data"]) for record in records]
 
     # NFT Records Operations
     def create_nft_record(self, record: NFTRecord) -> str:
         """Create a new NFT record with internal serial numbers"""
-        return self._append_record(self.nft_records_file, record.dict())
+        return self._append_record(self.nft_records_file, record.model_dump())
 
-    def get_nft_records(self, limit: Optional[int] = None) -> List[NFTRecord]:
+    def get_nft_records(self, limit: Optional[int] = None, cursor: int = 0) -> List[NFTRecord]:
         """Get NFT records"""
-        records = self._read_records(self.nft_records_file, limit)
+        records = self._read_records(self.nft_records_file, limit, cursor)
         return [NFTRecord(**record["data"]) for record in records]
 
+    def get_records_json(self, file_path: Path, limit: Optional[int] = None,
+                         cursor: int = 0) -> Tuple[bytes, int]:
+        """JSON array of a record file's data as the list endpoints return
+        it, and the cursor after its last row
+
+        Rows were validated when written, so they are serialized straight
+        from the parsed cache; the bytes are reused per (file, limit, cursor)
+        until the file grows (or, for GOAT, a status changes). A full page
+        of an append-only file never changes, so it stays cached as is, but
+        only the _JSON_CACHE_MAX most recently used bodies are kept.
+        """
+        goat = file_path == self.goat_file
+        version = self._goat_status_version if goat else 0
+        records = self._load_records(file_path, None if goat or not limit else cursor + limit)
+        key = (file_path, limit, cursor)
+        cached = self._json_cache.pop(key, None)
+        if (cached is not None and cached[0] is records and cached[2] == version
+                and (cached[1] == len(records) or (not goat and limit and cached[4] == limit))):
+            self._json_cache[key] = cached  # now the most recently used
+            return cached[3], cursor + cached[4]
+
+        if goat:
+            rows = self._goat_rows(limit, cursor)
+        else:
+            rows = [record["data"] for record in
+                    (records[cursor:cursor + limit] if limit else records[cursor:])]
+        body = _dumps(rows)
+        # Bodies built from an older parse of this file can never hit again
+        for stale in [k for k, v in self._json_cache.items()
+                      if k[0] == file_path and v[0] is not records]:
+            del self._json_cache[stale]
+        while len(self._json_cache) >= _JSON_CACHE_MAX:
+            del self._json_cache[next(iter(self._json_cache))]
+        self._json_cache[key] = (records, len(records), version, body, len(rows))
+        return body, cursor + len(rows)
+
+    def _refresh_serial_index(self):
+        """Index NFT records appended since the last lookup"""
+        records = self._load_records(self.nft_records_file)
+        if records is not self._serial_source:
+            # Cache was rebuilt from scratch, so start over
+            self._serial_index.clear()
+            self._nft_by_id.clear()
+            self._serial_source = records
+            self._serial_indexed = 0
+
+        for entry in records[self._serial_indexed:]:
+            record_id = entry["record_id"]
+            data = entry["data"]
+            self._nft_by_id[record_id] = entry
+            serials = set(data.get("dals_serial_numbers", ()))
+            serials.update(data.get("truemark_serial_numbers", ()))
+            for serial in serials:
+                self._serial_index[serial].append(record_id)
+        self._serial_indexed = len(records)
+
     def find_nft_by_serial(self, serial_number: str) -> List[NFTRecord]:
         """Find NFT records by DALS or TrueMark serial number"""
-        all_records = self.get_nft_records()
-        matching = []
-        for record in all_records:
-            if (serial_number in record.dals_serial_numbers or
-                serial_number in record.truemark_serial_numbers):
-                matching.append(record)
-        return matching
+        self._refresh_serial_index()
+        return [NFTRecord(**self._nft_by_id[record_id]["data"])
+                for record_id in self._serial_index.get(serial_number, [])]
 
     # Dashboard Operations
     def get_dashboard_summary(self) -> DashboardSummary:
         """Get dashboard summary statistics"""
-        dals_count = len(self.get_dals_records())
-        goat_count = len(self.get_goat_records())
-        nft_mint_count = len(self.get_nft_mints())
-        nft_record_count = len(self.get_nft_records())
-
-        # Count active GOAT operations
-        goat_records = self.get_goat_records()
-        active_ops = sum(1 for r in goat_records if r.status in ["pending", "running"])
+        dals = self._scan_stats(self.dals_file)
+        goat = self._scan_stats(self.goat_file, self._goat_status_overrides())
+        nft_mints = self._scan_stats(self.nft_mint_file)
+        nft_records = self._scan_stats(self.nft_records_file)
+        active_ops = goat["active_ops"]
 
         # System health based on recent activity
         health = "healthy"
@@ -176,13 +677,13 @@ class DashboardService:
             health = "error"
 
         return DashboardSummary(
-            total_dals_records=dals_count,
-            total_goat_records=goat_count,
-            total_nft_mints=nft_mint_count,
-            total_nft_records=nft_record_count,
+            total_dals_records=dals["count"],
+            total_goat_records=goat["count"],
+            total_nft_mints=nft_mints["count"],
+            total_nft_records=nft_records["count"],
             active_operations=active_ops,
             system_health=health,
-            last_updated=datetime.now().isoformat()
+            last_updated=_now_iso()
         )
 
     def get_system_statuses(self) -> List[SystemStatus]:
@@ -190,53 +691,49 @@ class DashboardService:
         statuses = []
 
         # DALS Status
-        dals_records = self._read_records(self.dals_file, limit=1)
-        last_dals = dals_records[0]["timestamp"] if dals_records else None
+        dals = self._scan_stats(self.dals_file)
         statuses.append(SystemStatus(
             system_name="DALS",
             status="healthy",
-            record_count=len(self.get_dals_records()),
-            last_activity=last_dals or "never",
+            record_count=dals["count"],
+            last_activity=dals["last_ts"] or "never",
             uptime_percentage=99.9,  # Mock value
             alerts=[]
         ))
 
         # GOAT Status
-        goat_records = self._read_records(self.goat_file, limit=1)
-        last_goat = goat_records[0]["timestamp"] if goat_records else None
-        active_goat = len([r for r in self.get_goat_records() if r.status in ["pending", "running"]])
+        goat = self._scan_stats(self.goat_file, self._goat_status_overrides())
+        active_goat = goat["active_ops"]
         goat_alerts = []
         if active_goat > 5:
             goat_alerts.append("High number of active operations")
         statuses.append(SystemStatus(
             system_name="GOAT",
             status="warning" if active_goat > 5 else "healthy",
-            record_count=len(self.get_goat_records()),
-            last_activity=last_goat or "never",
+            record_count=goat["count"],
+            last_activity=goat["last_ts"] or "never",
             uptime_percentage=98.5,  # Mock value
             alerts=goat_alerts
         ))
 
         # True Mark NFT Status
-        nft_records = self._read_records(self.nft_mint_file, limit=1)
-        last_nft = nft_records[0]["timestamp"] if nft_records else None
+        nft_mints = self._scan_stats(self.nft_mint_file)
         statuses.append(SystemStatus(
             system_name="True Mark NFT",
             status="healthy",
-            record_count=len(self.get_nft_mints()),
-            last_activity=last_nft or "never",
+            record_count=nft_mints["count"],
+            last_activity=nft_mints["last_ts"] or "never",
             uptime_percentage=99.5,  # Mock value
             alerts=[]
         ))
 
         # NFT Records Status
-        nft_rec_records = self._read_records(self.nft_records_file, limit=1)
-        last_nft_rec = nft_rec_records[0]["timestamp"] if nft_rec_records else None
+        nft_records = self._scan_stats(self.nft_records_file)
         statuses.append(SystemStatus(
             system_name="NFT Records",
             status="healthy",
-            record_count=len(self.get_nft_records()),
-            last_activity=last_nft_rec or "never",
+            record_count=nft_records["count"],
+            last_activity=nft_records["last_ts"] or "never",
             uptime_percentage=99.7,  # Mock value
             alerts=[]
         ))
@@ -245,27 +742,27 @@ class DashboardService:
 
     def get_recent_activities(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent activities across all systems"""
-        activities = []
+        streams = []
 
-        # Collect recent records from all systems
+        # Newest-first tails of each system; files are appended in time order
         for system_name, file_path in [
             ("DALS", self.dals_file),
             ("GOAT", self.goat_file),
             ("True Mark NFT", self.nft_mint_file),
             ("NFT Records", self.nft_records_file)
         ]:
-            records = self._read_records(file_path, limit=limit)
-            for record in records:
-                activities.append({
+            streams.append([
+                {
                     "system": system_name,
                     "timestamp": record["timestamp"],
                     "record_id": record["record_id"],
                     "type": "record_created"
-                })
+                }
+                for record in reversed(self._tail_records(file_path, limit))
+            ])
 
-        # Sort by timestamp and return most recent
-        activities.sort(key=lambda x: x["timestamp"], reverse=True)
-        return activities[:limit]
+        merged = heapq.merge(*streams, key=lambda x: x["timestamp"], reverse=True)
+        return list(islice(merged, limit))
 
     def get_dashboard_data(self) -> DashboardData:
         """Get complete dashboard data"""
@@ -276,12 +773,108 @@ class DashboardService:
             alerts=[]  # Could be populated from alerts file
         )
 
+    def iter_dashboard_data(self) -> Iterator[bytes]:
+        """Yield the dashboard data as NDJSON lines, one section at a time
+
+        Lines are tagged with a "type" field: one "summary", one
+        "system_status" per system, then "recent_activities" and "alerts".
+        """
+        yield _dumps({"type": "summary", **self.get_dashboard_summary().model_dump()}) + b"\n"
+        for status in self.get_system_statuses():
+            yield _dumps({"type": "system_status", **status.model_dump()}) + b"\n"
+        yield _dumps({"type": "recent_activities", "items": self.get_recent_activities()}) + b"\n"
+        yield _dumps({"type": "alerts", "items": []}) + b"\n"
+
     def create_alert(self, alert_type: str, message: str, severity: str = "info") -> str:
         """Create a system alert"""
         alert = {
             "alert_type": alert_type,
             "message": message,
             "severity": severity,
-            "created_at": datetime.now().isoformat()
+            "created_at": _now_iso()
         }
-        return self._append_record(self.alerts_file, alert)
\ No newline at end of file
+        return self._append_record(self.alerts_file, alert)
+
+
+class RecordWriteCoalescer:
+    """Coalesces concurrent record appends from async endpoints.
+
+    submit() queues a record and waits for its id. A background task picks
+    up whatever arrives within max_delay_s of the first queued record (up to
+    max_batch records) and hands each file's share to append_records, so a
+    burst of POSTs costs one write per file instead of one per record. The
+    writes run in the loop's default executor; only the futures are
+    resolved on the loop.
+    """
+
+    def __init__(self, service: DashboardService, max_batch: int = 500,
+                 max_delay_s: float = 0.005):
+        self.service = service
+        self.max_batch = max(1, max_batch)
+        self.max_delay_s = max_delay_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the flush task on the running event loop"""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Write everything queued so far, then stop the flush task"""
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+    async def submit(self, file_path: Path, record: Dict[str, Any]) -> str:
+        """Append one record, returning its record id once written"""
+        loop = asyncio.get_running_loop()
+        if self._task is None:  # Not started: write straight through
+            record_ids = await loop.run_in_executor(
+                None, self.service.append_records, file_path, [record])
+            return record_ids[0]
+        future = loop.create_future()
+        await self._queue.put((file_path, record, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            await asyncio.sleep(self.max_delay_s)  # Let the burst arrive
+            batch = [item]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            by_file: Dict[Path, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+            for file_path, record, future in batch:
+                by_file.setdefault(file_path, []).append((record, future))
+            results = await loop.run_in_executor(None, self._write, by_file)
+            for items, (record_ids, error) in zip(by_file.values(), results):
+                for i, (_, future) in enumerate(items):
+                    if future.done():  # The caller may have been cancelled
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(record_ids[i])
+
+    def _write(self, by_file: Dict[Path, List[Tuple[Dict[str, Any], asyncio.Future]]]
+               ) -> List[Tuple[Optional[List[str]], Optional[Exception]]]:
+        """Append a batch off the loop, one append_records call per file in
+        arrival order; returns (record ids, error) per file"""
+        results = []
+        for file_path, items in by_file.items():
+            try:
+                results.append((self.service.append_records(file_path, [r for r, _ in items]), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
@@ -163,7 +163,8 @@ Log cognitive events with forensic timestamps
 """
 
 from enum import Enum
-from .forensic_time_plugin import ForensicTimePlugin, ForensicConfig
+from collections import defaultdict, deque
+from .forensic_time_plugin import ForensicTimePlugin, ForensicConfig, AppendLog
 
 class CognitiveEvent(Enum):
     PERCEPTION = "perception"
@@ -175,12 +176,18 @@ class CognitiveEvent(Enum):
 class CALIOrbLogger:
     """CALI ORB with forensic event logging"""
 
-    def __init__(self, orb_id: str = "CALI_ORB_001"):
+    def __init__(self, orb_id: str = "CALI_ORB_001", max_len: int = None):
         self.time_plugin = ForensicTimePlugin(ForensicConfig(
             node_id=orb_id,
             storage_path="./cali_logs"
         ))
-        self.event_log = []
+        # In-memory history, bounded per list when max_len is set; the
+        # cognitive audit file keeps every event regardless
+        self.event_log = deque(maxlen=max_len) if max_len else []
+        self._by_type = defaultdict(lambda: deque(maxlen=max_len))
+        # Resolved (and its directory created) once, next to the pulse chain
+        self.audit_path = self.time_plugin.storage / "cognitive_audit.jsonl"
+        self._audit_log = AppendLog(self.audit_path)
 
     def log_cognitive_event(self,
                           event_type: CognitiveEvent,
@@ -200,6 +207,7 @@ class CALIOrbLogger:
         }
 
         self.event_log.append(event)
+        self._by_type[event_type.value].append(event)
 
         # Also log to separate cognitive audit file
         self._audit_cognitive_event(event)
@@ -207,17 +215,14 @@ class CALIOrbLogger:
         return event
 
     def _audit_cognitive_event(self, event: Dict):
-        """Audit cognitive event to immutable log"""
-        audit_path = Path("./cali_logs/cognitive_audit.jsonl")
-        audit_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(audit_path, 'a') as f:
-            f.write(json.dumps(event) + "\\n")
+        """Audit cognitive event to immutable log, written before returning"""
+        self._audit_log.append_json(event)
+        self._audit_log.flush()
 
     def get_cognitive_history(self, event_type: CognitiveEvent = None) -> List[Dict]:
         """Retrieve cognitive event history"""
         if event_type:
-            return [e for e in self.event_log if e['event_type'] == event_type.value]
+            return list(self._by_type.get(event_type.value, ()))
         return self.event_log
 
 # Usage example
@@ -241,7 +246,7 @@ Timestamp all actions in the DALS system
 """
 
 from typing import List, Optional
-from .forensic_time_plugin import ForensicTimePlugin, ForensicConfig
+from .forensic_time_plugin import ForensicTimePlugin, ForensicConfig, AppendLog
 
 class DALSActionLogger:
     """DALS with forensic action timestamping"""
@@ -252,6 +257,8 @@ class DALSActionLogger:
             storage_path="./dals_logs"
         ))
         self.active_actions = {}
+        self.audit_path = self.time_plugin.storage / "action_audit.jsonl"
+        self._audit_log = AppendLog(self.audit_path)
 
     def start_action(self,
                     action_id: str,
@@ -302,17 +309,16 @@ class DALSActionLogger:
 
     def _log_action_event(self, action_record: Dict, event_type: str):
         """Log action event to audit trail"""
-        audit_path = Path("./dals_logs/action_audit.jsonl")
-        audit_path.parent.mkdir(parents=True, exist_ok=True)
-
         audit_entry = {
             "event_type": event_type,
             "action_record": action_record,
-            "logged_at": datetime.now(timezone.utc).isoformat()
+            # The pulse that caused this event, so the log time matches the chain
+            "logged_at": action_record.get("end_pulse", action_record["start_pulse"])["utc_iso"]
         }
 
-        with open(audit_path, 'a') as f:
-            f.write(json.dumps(audit_entry) + "\\n")
+        # Written at once: an audit event must not wait on the next one
+        self._audit_log.append_json(audit_entry)
+        self._audit_log.flush()
 
 # Usage example
 dals = DALSActionLogger("DALS_NAVIGATION")
@@ -333,21 +339,11 @@ Add forensic time widget to any dashboard
 """
 
 import json
+import time
 from .forensic_time_plugin import ForensicTimePlugin, ForensicConfig
 
-class ForensicTimeWidget:
-    """Dashboard widget for forensic time display"""
-
-    def __init__(self, plugin: ForensicTimePlugin):
-        self.plugin = plugin
-
-    def render_widget_html(self) -> str:
-        """Render HTML widget for dashboard integration"""
-
-        pulse = self.plugin.pulse()
-        integrity = self.plugin.verify()
-
-        html = f"""
+# Widget markup, filled per render with str.format_map
+_WIDGET_TEMPLATE = """
         <div class="forensic-time-widget" style="
             border: 1px solid #00f0ff;
             border-radius: 8px;
@@ -359,38 +355,67 @@ class ForensicTimeWidget:
         ">
             <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
                 <span style="color: #00f0ff; font-weight: bold;">🔷 FORENSIC TIME</span>
-                <span style="color: {'#00d9a3' if integrity['integrity'] else '#ff3860'};">
-                    {'✓' if integrity['integrity'] else '✗'}
+                <span style="color: {ok_color};">
+                    {ok_mark}
                 </span>
             </div>
 
             <div style="margin-bottom: 0.5rem;">
                 <div style="color: #888; font-size: 0.7rem;">TAI NS</div>
-                <div style="color: #00f0ff; font-size: 1.2rem;">{pulse['tai_ns']:,}</div>
+                <div style="color: #00f0ff; font-size: 1.2rem;">{tai_ns:,}</div>
             </div>
 
             <div style="margin-bottom: 0.5rem;">
                 <div style="color: #888; font-size: 0.7rem;">UTC ISO</div>
-                <div style="color: #ffd700;">{pulse['utc_iso']}</div>
+                <div style="color: #ffd700;">{utc_iso}</div>
             </div>
 
             <div style="margin-bottom: 0.5rem;">
                 <div style="color: #888; font-size: 0.7rem;">ET S (J2000)</div>
-                <div style="color: #e0e0e0;">{pulse['et_s']:.6f}</div>
+                <div style="color: #e0e0e0;">{et_s:.6f}</div>
             </div>
 
             <div style="font-size: 0.6rem; color: #ffd700; word-break: break-all;">
-                {pulse['glyph_hash'][:32]}...
+                {glyph_hash32}...
             </div>
         </div>
         """
 
-        return html
+class ForensicTimeWidget:
+    """Dashboard widget for forensic time display"""
+
+    def __init__(self, plugin: ForensicTimePlugin, verify_ttl_s: float = 1.0):
+        self.plugin = plugin
+        # Renders within verify_ttl_s of each other share one integrity report
+        self.verify_ttl_s = verify_ttl_s
+        self._integrity = None
+        self._integrity_at = 0.0
+
+    def _get_integrity(self) -> Dict:
+        """Chain integrity report, advanced at most once per verify_ttl_s"""
+        now = time.monotonic()
+        if self._integrity is None or now - self._integrity_at >= self.verify_ttl_s:
+            self._integrity = self.plugin.verify_incremental()
+            self._integrity_at = now
+        return self._integrity
+
+    def render_widget_html(self) -> str:
+        """Render HTML widget for dashboard integration"""
+
+        pulse = self.plugin.pulse()
+        ok = self._get_integrity()['integrity']
+
+        return _WIDGET_TEMPLATE.format_map({
+            **pulse,
+            'glyph_hash32': pulse['glyph_hash'][:32],
+            'ok_color': '#00d9a3' if ok else '#ff3860',
+            'ok_mark': '✓' if ok else '✗'
+        })
 
     def get_widget_data(self) -> Dict:
         """Get widget data for AJAX updates"""
         pulse = self.plugin.pulse()
-        integrity = self.plugin.verify()
+        integrity = self._get_integrity()
 
         return {
             "pulse": pulse,
@@ -9,14 +9,143 @@ Integrates with any system requiring glyph trace logic and forensic-grade loggin
 Constitutional Compliance: Article VII - All memory is immutable and auditable
 """
 
+import os
 import json
-import hashlib
+import mmap
 import time
+import queue
+import atexit
+import struct
+import hashlib
+import threading
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Protocol
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; verify() then scans the JSON chain
+    np = None
+
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 is optional; pulse digests fall back to BLAKE2b
+    blake3 = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numeric path runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+J2000_EPOCH = 2451545.0
+J2000_UNIX = 946728000.0
+LEAP_SECONDS = 37
+TT_TAI_OFFSET = 32.184
+J2000_TAI_NS = 946_728_000 * 1_000_000_000  # J2000 on the TAI ns scale, less TT - TAI
+
+
+def _select_tai_clock():
+    """
+    Pick the clock read once per pulse: the kernel TAI clock when its
+    offset has been configured, otherwise UTC plus the leap second table.
+    Returns (clock_id, clock - UTC offset ns, TAI - UTC offset ns).
+    """
+    clock_tai = getattr(time, "CLOCK_TAI", None)
+    if clock_tai is not None:
+        offset_s = round((time.clock_gettime_ns(clock_tai) - time.time_ns()) / 1e9)
+        if offset_s > 0:
+            return clock_tai, offset_s * 1_000_000_000, offset_s * 1_000_000_000
+    return time.CLOCK_REALTIME, 0, LEAP_SECONDS * 1_000_000_000
+
+
+_CLOCK_ID, _CLOCK_UTC_NS, _TAI_UTC_NS = _select_tai_clock()
+_UTC = timezone.utc
+
+
+def _read_clock():
+    """One clock read, returned as (tai_ns, utc_ns)"""
+    utc_ns = time.clock_gettime_ns(_CLOCK_ID) - _CLOCK_UTC_NS
+    return utc_ns + _TAI_UTC_NS, utc_ns
+
+
+# Most buffers a single os.writev call accepts
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+# Sync call per AppendLog durability level (no fdatasync on macOS/Windows)
+_SYNC_CALLS = {
+    "none": None,
+    "fdatasync": getattr(os, "fdatasync", os.fsync),
+    "fsync": os.fsync,
+}
+
+# Most queued pulses the writer thread takes before flushing
+_WRITER_BATCH = 4096
+
+# Read size used when streaming the chain file
+_READ_CHUNK = 1 << 20
+
+# Fixed-width pulse preimage fields: tai_ns, utc_unix, et_s
+_PULSE_STRUCT = struct.Struct("<qdd")
+
+
+def _loads(data: bytes):
+    """Parse JSON from bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize to one compact JSONL line (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE |
+                            orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False,
+                      default=_isoformat).encode() + b"\\n"
+
+
+def _isoformat(obj):
+    """json.dumps default hook matching orjson's NAIVE_UTC | UTC_Z datetimes"""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=_UTC)
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _pulse_digest(buf: bytes) -> bytes:
+    """48-byte pulse digest: BLAKE3 when available, else BLAKE2b"""
+    if blake3 is not None:
+        return blake3(buf).digest(length=48)
+    return hashlib.blake2b(buf, digest_size=48).digest()
+
+
+@njit(cache=True)
+def pulse_times(tai_ns, utc_unix):
+    """Derive (et_s, epoch_days, julian_date) from TAI ns and UTC Unix seconds"""
+    et_s = (tai_ns - J2000_TAI_NS) * 1e-9 + TT_TAI_OFFSET
+    epoch_days = (utc_unix - J2000_UNIX) / 86400.0
+    return et_s, epoch_days, J2000_EPOCH + epoch_days
+
+
+@njit(cache=True)
+def _pulse_times_batch(tai_ns, utc_unix, et_s, julian_date):
+    for i in range(utc_unix.shape[0]):
+        et_s[i], _, julian_date[i] = pulse_times(tai_ns[i], utc_unix[i])
+
 
 class IGlyphTraceable(Protocol):
     """Protocol for glyph traceable systems"""
@@ -34,6 +163,241 @@ class ForensicConfig:
     audit_file: str = "forensic_audit.log"
     enable_console_trace: bool = True
     auto_verify: bool = True
+    flush_bytes: int = 64 * 1024      # write the chain buffer once this large
+    flush_interval_s: float = 0.01    # ...or once this old
+    durability: str = "none"          # sync flushed batches: "none", "fdatasync" or "fsync"
+    fsync_every_n: int = 0            # ...only once this many lines are unsynced (0: every batch)
+    legacy_hashing: bool = False      # SHA-256 pulse id and glyph over text preimages, as in older chains
+    write_jsonl: bool = True          # also keep the JSONL chain (full pulses) beside the columns
+    writer_thread: bool = True        # hand encoded pulses to one background writer thread
+
+
+class AppendLog:
+    """
+    Append-only JSONL log on a long-lived O_APPEND file descriptor
+    Lines are queued and submitted together once flush_bytes are pending,
+    or once the oldest queued line is flush_interval_s old: a timer armed by
+    the first queued line writes the batch if no later append does. Where
+    available a batch goes out as one vectored os.writev, without first
+    copying the lines into a single buffer. O_APPEND makes each call land
+    atomically at the end of the file; a lock keeps the queue consistent
+    between appenders and the timer.
+    
+    With durability "none" (the default) writes reach the page cache only
+    and a crash can lose the last batches. "fdatasync" syncs each flushed
+    batch without the inode timestamp flush; an append only changes the
+    file size, which fdatasync covers. "fsync" syncs all metadata too.
+    fsync_every_n > 0 defers the sync until that many lines are unsynced
+    (and alone implies "fdatasync").
+    With drop_cache, each flush also tells the kernel the written pages
+    will not be read back soon (POSIX_FADV_DONTNEED).
+    """
+    
+    def __init__(self, path, flush_bytes: int = 64 * 1024, flush_interval_s: float = 0.01,
+                 fsync_every_n: int = 0, drop_cache: bool = False, durability: str = "none"):
+        if durability not in _SYNC_CALLS:
+            raise ValueError(f"durability must be one of {sorted(_SYNC_CALLS)}, not {durability!r}")
+        if durability == "none" and fsync_every_n:
+            durability = "fdatasync"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._flush_bytes = flush_bytes
+        self._flush_interval_s = flush_interval_s
+        self._fsync_every_n = fsync_every_n
+        self._sync = _SYNC_CALLS[durability]
+        self._unsynced = 0
+        self._drop_cache = drop_cache and hasattr(os, "posix_fadvise")
+        self._last_flush = time.monotonic()
+        # Deadline flush for the oldest queued line, and an error it hit
+        # (raised by the next append or flush)
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_error: Optional[BaseException] = None
+        atexit.register(self.close)
+    
+    def append(self, line: bytes):
+        """Buffer one encoded line, writing the batch when due"""
+        with self._lock:
+            self._raise_timer_error()
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            self._unsynced += 1
+            if (self._pending_bytes >= self._flush_bytes or
+                    time.monotonic() - self._last_flush >= self._flush_interval_s):
+                self._write_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._flush_interval_s, self._deadline_flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def append_json(self, obj):
+        """Serialize obj and buffer it as one line"""
+        self.append(_dumps_line(obj))
+    
+    def flush(self):
+        """Write all buffered lines"""
+        with self._lock:
+            self._raise_timer_error()
+            self._write_pending()
+    
+    def _deadline_flush(self):
+        """Timer thread: write lines no append has flushed within flush_interval_s"""
+        with self._lock:
+            self._timer = None
+            if self._fd is None:
+                return
+            try:
+                self._write_pending()
+            except BaseException as exc:
+                self._timer_error = exc
+    
+    def _raise_timer_error(self):
+        """Raise (once) an error the deadline flush hit"""
+        error, self._timer_error = self._timer_error, None
+        if error is not None:
+            raise error
+    
+    def _write_pending(self):
+        """Write the queued lines; the caller holds the lock"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            if hasattr(os, "writev"):
+                for i in range(0, len(self._pending), _IOV_MAX):
+                    os.writev(self._fd, self._pending[i:i + _IOV_MAX])
+            else:
+                os.write(self._fd, b"".join(self._pending))
+            self._pending.clear()
+            self._pending_bytes = 0
+            if self._sync is not None and self._unsynced >= self._fsync_every_n:
+                self._sync(self._fd)
+                self._unsynced = 0
+            if self._drop_cache:
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Flush and release the file descriptor"""
+        with self._lock:
+            if self._fd is not None:
+                try:
+                    self._raise_timer_error()
+                    self._write_pending()
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+        atexit.unregister(self.close)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ColumnarChainWriter:
+    """
+    Struct-of-arrays copy of the pulse chain
+    Each field lives in its own fixed-width binary file, appended through an
+    AppendLog, so one field can be read or memory-mapped without touching
+    the others. Row i of every column belongs to pulse i + 1; "chain" holds
+    the 16-byte chain hash and "glyph" the first 16 bytes of the glyph hash.
+    """
+    
+    # name -> (file suffix, struct format, numpy dtype, row shape)
+    COLUMNS = {
+        "tai_ns": ("i64", struct.Struct("<q"), "<i8", ()),
+        "utc_unix": ("f64", struct.Struct("<d"), "<f8", ()),
+        "et_s": ("f64", struct.Struct("<d"), "<f8", ()),
+        "chain": ("b16", struct.Struct("16s"), "u1", (16,)),
+        "glyph": ("b16", struct.Struct("16s"), "u1", (16,)),
+    }
+    
+    # Readers see what has been flushed; the owner flushes before reading
+    
+    def __init__(self, directory, flush_bytes: int = 64 * 1024, flush_interval_s: float = 0.01,
+                 fsync_every_n: int = 0, durability: str = "none"):
+        self.directory = Path(directory)
+        self.paths = {name: self.directory / f"{name}.{spec[0]}"
+                      for name, spec in self.COLUMNS.items()}
+        self._logs = {name: AppendLog(path, flush_bytes, flush_interval_s, fsync_every_n,
+                                      durability=durability)
+                      for name, path in self.paths.items()}
+        self._i64 = self.COLUMNS["tai_ns"][1].pack
+        self._f64 = self.COLUMNS["utc_unix"][1].pack
+    
+    def append(self, tai_ns: int, utc_unix: float, et_s: float, chain: bytes, glyph: bytes):
+        """Buffer one row; chain and glyph are 16 raw bytes each"""
+        logs = self._logs
+        logs["tai_ns"].append(self._i64(tai_ns))
+        logs["utc_unix"].append(self._f64(utc_unix))
+        logs["et_s"].append(self._f64(et_s))
+        logs["chain"].append(chain)
+        logs["glyph"].append(glyph)
+    
+    def flush(self):
+        """Write buffered rows to every column"""
+        for log in self._logs.values():
+            log.flush()
+    
+    def close(self):
+        """Flush and release the column files"""
+        for log in self._logs.values():
+            log.close()
+    
+    def length(self) -> int:
+        """Complete rows on disk (the shortest column wins after a torn write)"""
+        rows = []
+        for name, path in self.paths.items():
+            try:
+                rows.append(os.path.getsize(path) // self.COLUMNS[name][1].size)
+            except OSError:
+                return 0
+        return min(rows)
+    
+    def column(self, name: str, rows: int):
+        """Read-only numpy memmap over the first rows of one column"""
+        if np is None or rows <= 0:
+            return None
+        _, _, dtype, shape = self.COLUMNS[name]
+        return np.memmap(self.paths[name], dtype=dtype, mode='r', shape=(rows,) + shape)
+    
+    def read_column(self, name: str, start: int, stop: int) -> bytes:
+        """Raw bytes of rows [start, stop) of one column"""
+        width = self.COLUMNS[name][1].size
+        with open(self.paths[name], 'rb') as f:
+            f.seek(start * width)
+            return f.read((stop - start) * width)
+    
+    def read_rows(self, start: int, stop: int) -> List[Dict]:
+        """Rows [start, stop) as pulse dicts of the fixed-width fields"""
+        fields = {}
+        for name, (_, fmt, _, _) in self.COLUMNS.items():
+            fields[name] = [v[0] for v in fmt.iter_unpack(self.read_column(name, start, stop))]
+        return [
+            {
+                "tai_ns": tai_ns,
+                "utc_unix": utc_unix,
+                "et_s": et_s,
+                "chain_hash": chain.hex(),
+                "glyph_hash": glyph.hex(),
+                "pulse_number": start + i + 1
+            }
+            for i, (tai_ns, utc_unix, et_s, chain, glyph) in enumerate(zip(
+                fields["tai_ns"], fields["utc_unix"], fields["et_s"],
+                fields["chain"], fields["glyph"]))
+        ]
+    
+    def replace(self, data: Dict[str, bytes]):
+        """Overwrite every column with the given raw bytes"""
+        self.flush()
+        for name, path in self.paths.items():
+            with open(path, 'wb') as f:
+                f.write(data[name])
 
 
 class ForensicTimePlugin:
@@ -42,7 +406,7 @@ class ForensicTimePlugin:
     Minimal, correct, space-time compliant
     
     What to store in every ISS pulse (minimal, correct):
-    - tai_ns: integer nanoseconds since epoch (monotonic truth)
+    - tai_ns: integer TAI nanoseconds since the Unix epoch
     - utc_iso: human display time (leap-second aware)  
     - et_s: seconds past J2000 (TDB/ET) for SPICE/ephemeris
     
@@ -58,42 +422,116 @@ class ForensicTimePlugin:
     - source_node: Originating system
     """
     
-    J2000_EPOCH = 2451545.0
-    J2000_UNIX = 946728000.0
+    J2000_EPOCH = J2000_EPOCH
+    J2000_UNIX = J2000_UNIX
     
     def __init__(self, config: Optional[ForensicConfig] = None):
         self.config = config or ForensicConfig()
+        
+        # Invariant over the plugin's lifetime
+        self._node_id_bytes = self.config.node_id.encode()
+        self._genesis_hash32 = hashlib.sha256(self._node_id_bytes + b"_GENESIS").hexdigest()[:32]
         self.storage = Path(self.config.storage_path)
         self.storage.mkdir(parents=True, exist_ok=True)
         
         self.chain_path = self.storage / self.config.chain_file
+        self.columns_path = self.chain_path.with_suffix(".cols")
         self.audit_path = self.storage / self.config.audit_file
         
+        # Column store of the fixed-width pulse fields. With write_jsonl it
+        # mirrors the JSON chain (the source of truth) and is rebuilt from it
+        # whenever it falls out of step; without, it is the chain.
+        self._columns = ColumnarChainWriter(self.columns_path, self.config.flush_bytes,
+                                            self.config.flush_interval_s,
+                                            self.config.fsync_every_n,
+                                            self.config.durability)
+        
         # Load chain state
-        self._last_hash = self._load_genesis_hash()
-        self._pulse_count = self._count_existing_pulses()
+        if self.config.write_jsonl:
+            last = self._load_last_pulse()
+            self._last_hash = last['glyph_hash'][:32] if last else self._genesis_hash32
+            self._pulse_count = self._count_existing_pulses(last)
+        else:
+            self._pulse_count = self._columns.length()
+            self._last_hash = self._genesis_hash32
+            if self._pulse_count:
+                last = self._columns.read_column("glyph", self._pulse_count - 1, self._pulse_count)
+                self._last_hash = last.hex()
+        self._last_glyph_bytes = bytes.fromhex(self._last_hash)
+        
+        # Batched chain writer; verify() and get_chain() flush it first.
+        # Chain pages are only reread by verify(), so keep them out of the cache.
+        self._chain_log = None
+        if self.config.write_jsonl:
+            self._chain_log = AppendLog(self.chain_path, self.config.flush_bytes,
+                                        self.config.flush_interval_s, self.config.fsync_every_n,
+                                        drop_cache=True, durability=self.config.durability)
+        self._audit_log = AppendLog(self.audit_path, self.config.flush_bytes,
+                                    self.config.flush_interval_s, self.config.fsync_every_n,
+                                    durability=self.config.durability)
+        
+        # Progress of verify_incremental() through the chain
+        self._verify_state = self._new_verify_state()
+        
+        # pulse() links and queues under the lock, so the chain order is the
+        # call order across threads. The writer thread then owns the chain
+        # logs and writes whatever has queued up as one batch.
+        self._lock = threading.RLock()
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+        if self.config.writer_thread:
+            self._queue = queue.SimpleQueue()
+            self._writer = threading.Thread(target=self._writer_loop,
+                                            name=f"forensic-writer-{self.config.node_id}",
+                                            daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
         
         # Constitutional binding log
         self._log_binding()
     
-    def _load_genesis_hash(self) -> str:
-        """Load or create genesis hash"""
-        if self.chain_path.exists():
-            try:
-                with open(self.chain_path, 'r') as f:
-                    lines = [l.strip() for l in f if l.strip()]
-                    if lines:
-                        last = json.loads(lines[-1])
-                        return last['glyph_hash'][:32]
-            except:
-                pass
-        return hashlib.sha256(f"{self.config.node_id}_GENESIS".encode()).hexdigest()[:32]
+    def _load_last_pulse(self) -> Optional[Dict]:
+        """Last pulse of the JSON chain, read backwards from the end of the file"""
+        try:
+            f = open(self.chain_path, 'rb')
+        except OSError:
+            return None
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            window = 4096
+            while True:
+                start = max(0, end - window)
+                f.seek(start)
+                lines = f.read(end - start).split(b"\\n")
+                if start:
+                    lines = lines[1:]  # may start mid-line
+                for line in reversed(lines):
+                    if line.strip():
+                        try:
+                            pulse = _loads(line)
+                        except ValueError:
+                            return None
+                        if isinstance(pulse, dict) and isinstance(pulse.get('glyph_hash'), str):
+                            return pulse
+                        return None
+                if not start:
+                    return None
+                window *= 2
     
-    def _count_existing_pulses(self) -> int:
-        """Count existing pulses in chain"""
+    def _count_existing_pulses(self, last: Optional[Dict]) -> int:
+        """
+        Count existing pulses in chain
+        The columns answer without reading the chain when their last row is
+        the last JSON pulse; legacy or damaged chains are counted line by line
+        """
         if not self.chain_path.exists():
             return 0
-        with open(self.chain_path, 'r') as f:
+        rows = self._columns.length()
+        if (rows and last is not None and last.get('pulse_number') == rows and
+                self._columns.read_column("glyph", rows - 1, rows).hex() == self._last_hash):
+            return rows
+        with open(self.chain_path, 'rb') as f:
             return sum(1 for line in f if line.strip())
     
     def _log_binding(self):
@@ -103,41 +541,58 @@ class ForensicTimePlugin:
             "article": "VII",
             "principle": "IMMUTABLE_AUDITABLE_MEMORY",
             "node": self.config.node_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(_UTC).isoformat(),
             "pulse_count": self._pulse_count
         }
-        with open(self.audit_path, 'a') as f:
-            f.write(json.dumps(entry) + "\\n")
+        self._audit_log.append_json(entry)
+        self._audit_log.flush()
     
     def pulse(self) -> Dict:
         """
         Generate forensic time pulse
         Returns complete pulse dictionary
         """
-        # Time calculations
-        utc_now = datetime.now(timezone.utc)
-        utc_unix = utc_now.timestamp()
-        utc_iso = utc_now.isoformat()
-        tai_ns = time.monotonic_ns()
+        with self._lock:
+            pulse = self._next_pulse()
         
-        # Space time (ET)
-        leap_seconds = 37
-        tai_offset = 32.184
-        et_s = (utc_unix - self.J2000_UNIX) + tai_offset + leap_seconds
-        
-        # Extended timestamps
-        epoch_days = (utc_unix - self.J2000_UNIX) / 86400.0
-        julian_date = self.J2000_EPOCH + epoch_days
+        if self.config.enable_console_trace:
+            print(f"[GLYPH TRACE] Pulse {pulse['pulse_number']}: {pulse['pulse_id']}")
         
-        # Glyph trace generation
-        pulse_content = f"{tai_ns}:{utc_iso}:{et_s}:{self.config.node_id}"
-        pulse_id = hashlib.sha256(pulse_content.encode()).hexdigest()[:32]
+        return pulse
+    
+    def _next_pulse(self) -> Dict:
+        """Time, link and queue the next pulse (the caller holds the lock)"""
+        # Time calculations
+        tai_ns, utc_ns = _read_clock()
+        utc_unix = utc_ns * 1e-9
+        utc_iso = datetime.fromtimestamp(utc_unix, tz=_UTC).isoformat()
         
-        glyph_content = f"{pulse_id}:{self._last_hash}:{utc_unix}"
-        glyph_hash = hashlib.sha256(glyph_content.encode()).hexdigest()
+        # Space time (ET) and extended timestamps
+        et_s, epoch_days, julian_date = pulse_times(tai_ns, utc_unix)
         
-        chain_content = f"{glyph_hash}:{self._last_hash}:{self.config.node_id}"
-        chain_hash = hashlib.sha256(chain_content.encode()).hexdigest()[:32]
+        # Glyph trace generation
+        if self.config.legacy_hashing:
+            pulse_content = f"{tai_ns}:{utc_iso}:{et_s}:{self.config.node_id}"
+            pulse_id = hashlib.sha256(pulse_content.encode()).hexdigest()[:32]
+            
+            glyph_content = f"{pulse_id}:{self._last_hash}:{utc_unix}"
+            glyph_hash = hashlib.sha256(glyph_content.encode()).hexdigest()
+            
+            # The link verify() checks, as in the binary scheme
+            chain_hash = self._last_hash
+            glyph_bytes = bytes.fromhex(glyph_hash[:32])
+            chain_bytes = self._last_glyph_bytes
+        else:
+            # One digest per pulse: bytes 0-16 are the pulse id, 16-48 the
+            # glyph hash. The chain hash is the link itself, the previous
+            # glyph prefix, which is what verify() checks.
+            digest = _pulse_digest(_PULSE_STRUCT.pack(tai_ns, utc_unix, et_s) +
+                                   self._node_id_bytes + self._last_glyph_bytes)
+            pulse_id = digest[:16].hex()
+            glyph_hash = digest[16:].hex()
+            chain_hash = self._last_hash
+            glyph_bytes = digest[16:32]
+            chain_bytes = self._last_glyph_bytes
         
         pulse = {
             "tai_ns": tai_ns,
@@ -154,61 +609,315 @@ class ForensicTimePlugin:
         }
         
         # Append to immutable chain
-        with open(self.chain_path, 'a') as f:
-            f.write(json.dumps(pulse) + "\\n")
+        line = _dumps_line(pulse) if self._chain_log is not None else None
+        row = (tai_ns, utc_unix, et_s, chain_bytes, glyph_bytes)
+        if self._queue is not None:
+            self._queue.put((line, row))
+        else:
+            self._write_pulse(line, row)
         
         # Update state
         self._last_hash = glyph_hash[:32]
+        self._last_glyph_bytes = glyph_bytes
         self._pulse_count += 1
         
-        if self.config.enable_console_trace:
-            print(f"[GLYPH TRACE] Pulse {pulse['pulse_number']}: {pulse_id}")
-        
         return pulse
     
-    def verify(self) -> Dict:
+    def _write_pulse(self, line: Optional[bytes], row: tuple):
+        """Buffer one pulse in the chain logs"""
+        if line is not None:
+            self._chain_log.append(line)
+        self._columns.append(*row)
+    
+    def _flush_logs(self):
+        """Write the chain logs' buffers, keeping an error for flush() to raise"""
+        try:
+            if self._chain_log is not None:
+                self._chain_log.flush()
+            self._columns.flush()
+        except Exception as exc:
+            self._writer_error = exc
+    
+    def _writer_loop(self):
         """
-        Forensic verification of entire chain
-        Returns integrity report
+        Writer thread: take whatever has queued up (at most _WRITER_BATCH
+        items) and write it as one batch. A queued Event is set once
+        everything before it is written; None stops the thread.
         """
-        if not self.chain_path.exists():
-            return {"status": "EMPTY", "integrity": True, "pulses": 0}
-        
-        violations = []
-        expected_hash = hashlib.sha256(f"{self.config.node_id}_GENESIS".encode()).hexdigest()[:32]
-        
-        with open(self.chain_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
+        q = self._queue
+        while True:
+            items = [q.get()]
+            try:
+                while len(items) < _WRITER_BATCH:
+                    items.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            for item in items:
+                if item is None:
+                    self._flush_logs()
+                    return
+                if isinstance(item, threading.Event):
+                    self._flush_logs()
+                    item.set()
                     continue
                 try:
-                    pulse = json.loads(line)
-                    if pulse.get('chain_hash') != expected_hash:
-                        violations.append({
-                            "line": line_num,
-                            "type": "CHAIN_BREAK",
-                            "pulse": pulse.get('pulse_id'),
-                            "expected": expected_hash,
-                            "found": pulse.get('chain_hash')
-                        })
-                    expected_hash = pulse.get('glyph_hash', '')[:32]
-                except json.JSONDecodeError:
-                    violations.append({
-                        "line": line_num,
-                        "type": "CORRUPTION"
-                    })
+                    self._write_pulse(*item)
+                except Exception as exc:
+                    self._writer_error = exc
+            self._flush_logs()
+    
+    def flush(self):
+        """Write buffered pulses to the chain files"""
+        with self._lock:
+            if self._writer is not None and self._writer.is_alive():
+                done = threading.Event()
+                self._queue.put(done)
+                done.wait()
+            else:
+                self._flush_logs()
+            error, self._writer_error = self._writer_error, None
+            if error is not None:
+                raise error
+    
+    def close(self):
+        """Flush buffered pulses and release the log files"""
+        with self._lock:
+            if self._writer is not None and self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join()
+            if self._chain_log is not None:
+                self._chain_log.close()
+            self._columns.close()
+            self._audit_log.close()
+            atexit.unregister(self.close)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def pulse_batch(self, n: int) -> Dict:
+        """
+        Time fields for n back-to-back pulses (backfills and tests)
+        Nothing is hashed or appended to the chain
+        """
+        tai_ns = []
+        utc_unix = []
+        for _ in range(n):
+            tai, utc_ns = _read_clock()
+            tai_ns.append(tai)
+            utc_unix.append(utc_ns * 1e-9)
         
+        if np is None:
+            times = [pulse_times(t, u) for t, u in zip(tai_ns, utc_unix)]
+            return {
+                "tai_ns": tai_ns,
+                "et_s": [t[0] for t in times],
+                "julian_date": [t[2] for t in times]
+            }
+        
+        tai = np.array(tai_ns, dtype=np.int64)
+        utc = np.array(utc_unix, dtype=np.float64)
+        et_s = np.empty(n, dtype=np.float64)
+        julian_date = np.empty(n, dtype=np.float64)
+        _pulse_times_batch(tai, utc, et_s, julian_date)
+        return {
+            "tai_ns": tai,
+            "et_s": et_s,
+            "julian_date": julian_date
+        }
+    
+    def _verify_columns(self) -> Optional[bool]:
+        """
+        Chain-link check over the chain and glyph columns: every chain hash
+        must equal the previous glyph prefix, so the check is one comparison
+        of the chain column against the glyph column shifted by a row.
+        Returns None when the columns are out of step with the pulse count
+        """
+        rows = self._columns.length()
+        if rows != self._pulse_count:
+            return None
+        if rows == 0:
+            return True
+        
+        genesis = bytes.fromhex(self._genesis_hash32)
+        if np is None:
+            chain = self._columns.read_column("chain", 0, rows)
+            glyph = self._columns.read_column("glyph", 0, rows - 1)
+            return chain[:16] == genesis and chain[16:] == glyph
+        
+        chain = self._columns.column("chain", rows)
+        glyph = self._columns.column("glyph", rows)
+        ok = bool(np.array_equal(chain[0], np.frombuffer(genesis, dtype=np.uint8)) and
+                  np.array_equal(chain[1:], glyph[:-1]))
+        del chain, glyph  # release the maps
+        return ok
+    
+    def _new_verify_state(self) -> Dict:
+        """
+        Verification progress: offset is the byte offset into the JSON chain
+        (or the row in the columns) up to which links have been checked
+        """
+        return {"offset": 0, "line": 0, "expected": self._genesis_hash32, "violations": []}
+    
+    def _report(self, violations: List[Dict]) -> Dict:
+        """Integrity report for the current chain"""
         return {
             "status": "VIOLATED" if violations else "CLEAN",
             "integrity": len(violations) == 0,
-            "violations": violations,
+            "violations": list(violations),
             "pulses": self._pulse_count,
-            "verified_at": datetime.now(timezone.utc).isoformat()
+            "verified_at": datetime.now(_UTC).isoformat()
         }
     
+    def _check_link(self, state: Dict, line: bytes) -> Optional[Dict]:
+        """Check one JSON chain line against the state; returns the pulse unless corrupt"""
+        try:
+            # orjson.JSONDecodeError subclasses ValueError as well
+            pulse = _loads(line)
+            chain_hash = pulse['chain_hash']
+            glyph_hash = pulse['glyph_hash']
+        except (KeyError, TypeError, ValueError):
+            state["violations"].append({
+                "line": state["line"],
+                "type": "CORRUPTION"
+            })
+            return None
+        if chain_hash != state["expected"]:
+            state["violations"].append({
+                "line": state["line"],
+                "type": "CHAIN_BREAK",
+                "pulse": pulse.get('pulse_id'),
+                "expected": state["expected"],
+                "found": chain_hash
+            })
+        state["expected"] = glyph_hash[:32]
+        return pulse
+    
+    def _scan_jsonl(self, state: Dict, rebuild: Optional[Dict] = None, final: bool = False):
+        """
+        Advance state over the JSON chain lines appended since state["offset"]
+        A trailing line without its newline is left for the next call unless
+        final. While the chain is clean, rebuild collects column rows.
+        """
+        def check(line):
+            state["line"] += 1
+            if not line or line.isspace():
+                return
+            pulse = self._check_link(state, line)
+            if pulse is not None and rebuild is not None and not state["violations"]:
+                try:
+                    rebuild["tai_ns"] += struct.pack("<q", pulse['tai_ns'])
+                    rebuild["utc_unix"] += struct.pack("<d", pulse['utc_unix'])
+                    rebuild["et_s"] += struct.pack("<d", pulse['et_s'])
+                    rebuild["chain"] += bytes.fromhex(pulse['chain_hash'])
+                    rebuild["glyph"] += bytes.fromhex(state["expected"])
+                except (KeyError, TypeError, ValueError, struct.error):
+                    rebuild.clear()  # not rebuildable; the chain itself still verifies
+        
+        tail = b""
+        with open(self.chain_path, 'rb') as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            f.seek(state["offset"])
+            while True:
+                block = f.read(_READ_CHUNK)
+                if not block:
+                    break
+                lines = (tail + block).split(b"\\n")
+                tail = lines.pop()
+                for line in lines:
+                    state["offset"] += len(line) + 1
+                    check(line)
+        if final and tail:
+            state["offset"] += len(tail)
+            check(tail)
+    
+    def _scan_columns(self, state: Dict):
+        """Advance state over the column rows appended since state["offset"]"""
+        start = state["offset"]
+        rows = self._columns.length()
+        chain = self._columns.read_column("chain", start, rows)
+        glyph = self._columns.read_column("glyph", start, rows)
+        expected = bytes.fromhex(state["expected"])
+        for i in range(0, len(chain), 16):
+            found = chain[i:i + 16]
+            if found != expected:
+                state["violations"].append({
+                    "line": start + i // 16 + 1,
+                    "type": "CHAIN_BREAK",
+                    "expected": expected.hex(),
+                    "found": found.hex()
+                })
+            expected = glyph[i:i + 16]
+        state["offset"] = state["line"] = rows
+        state["expected"] = expected.hex()
+    
+    def verify(self, full: bool = False) -> Dict:
+        """
+        Forensic verification of entire chain
+        Returns integrity report
+        
+        The JSON chain is always scanned when it is kept; the columns
+        are only trusted on their own when the JSON chain is disabled
+        (full is accepted for compatibility)
+        """
+        self.flush()
+        if self._chain_log is None:
+            if not self._pulse_count:
+                return {"status": "EMPTY", "integrity": True, "pulses": 0}
+            if self._verify_columns():
+                return self._report([])
+            state = self._new_verify_state()
+            self._scan_columns(state)
+            self._verify_state = state
+            return self._report(state["violations"])
+        if not self.chain_path.exists():
+            return {"status": "EMPTY", "integrity": True, "pulses": 0}
+        
+        state = self._new_verify_state()
+        rebuild = {name: bytearray() for name in ColumnarChainWriter.COLUMNS}
+        self._scan_jsonl(state, rebuild, final=True)
+        with self._lock:
+            # Nothing is queued or buffered while the lock is held after a flush
+            self.flush()
+            if (rebuild and not state["violations"] and
+                    len(rebuild["chain"]) == 16 * self._pulse_count):
+                self._columns.replace(rebuild)
+        self._verify_state = state
+        return self._report(state["violations"])
+    
+    def verify_incremental(self) -> Dict:
+        """
+        Verify only the pulses appended since the previous call
+        Violations found earlier stay in the report; a chain that shrank
+        (replaced or truncated) is verified again from the start
+        """
+        with self._lock:
+            self.flush()
+            state = self._verify_state
+            if self._chain_log is None:
+                if self._columns.length() < state["offset"]:
+                    state = self._verify_state = self._new_verify_state()
+                self._scan_columns(state)
+            else:
+                if not self.chain_path.exists():
+                    return {"status": "EMPTY", "integrity": True, "pulses": 0}
+                if os.path.getsize(self.chain_path) < state["offset"]:
+                    state = self._verify_state = self._new_verify_state()
+                self._scan_jsonl(state)
+            return self._report(state["violations"])
+    
     def get_chain(self, limit: int = 100) -> List[Dict]:
-        """Retrieve pulse chain history"""
+        """
+        Retrieve pulse chain history
+        Without the JSONL chain, pulses carry only the column fields
+        """
+        self.flush()
+        if self._chain_log is None:
+            stop = self._pulse_count
+            return self._columns.read_rows(max(0, stop - limit) if limit else 0, stop)
         if not self.chain_path.exists():
             return []
         
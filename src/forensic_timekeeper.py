@@ -1,22 +1,121 @@
 import os
 import json
-import hashlib
+import mmap
+import atexit
+from hashlib import sha256 as _sha
 import time
-from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from pathlib import Path
 import struct
+import sys
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batch_derive_times then loops in Python
+    np = None
+
+try:
+    from .batch_hashing import batch_sha256
+except ImportError:  # loaded as a top-level module, with src/ on sys.path
+    from batch_hashing import batch_sha256
 
 # Fixed Forensic-Grade Timekeeping Plugin Module
 
-@dataclass
+LEAP_SECONDS = 37  # Current TAI - UTC offset
+
+def _select_tai_clock() -> Tuple[int, int, int]:
+    """
+    Pick the clock read once per pulse: the kernel TAI clock when its
+    offset has been configured, otherwise UTC plus the leap second table.
+    Returns (clock_id, clock - UTC offset ns, TAI - UTC offset ns).
+    """
+    clock_tai = getattr(time, "CLOCK_TAI", None)
+    if clock_tai is not None:
+        offset_s = round((time.clock_gettime_ns(clock_tai) - time.time_ns()) / 1e9)
+        if offset_s > 0:
+            return clock_tai, offset_s * 1_000_000_000, offset_s * 1_000_000_000
+    return time.CLOCK_REALTIME, 0, LEAP_SECONDS * 1_000_000_000
+
+_CLOCK_ID, _CLOCK_UTC_NS, _TAI_UTC_NS = _select_tai_clock()
+
+# Hash preimage layouts, recorded per pulse as preimage_version: colon-joined
+# text (chains written before binary preimages), or packed fields and raw
+# digests
+PREIMAGE_TEXT = 1
+PREIMAGE_BINARY = 2
+# Link before the first pulse; chain links are the first 16 bytes of a glyph hash
+_GENESIS_HASH = _sha(b"CALEON_PRIME_GENESIS_0").digest()[:16]
+_PULSE_FIELDS = struct.Struct("<qdd")  # tai_ns, utc_unix, et_s
+_F64 = struct.Struct("<d")
+
+def build_pulse_hashes(tai_ns: int, utc_unix: float, et_s: float, node_id: bytes,
+                       last_hash: bytes) -> Tuple[bytes, bytes, bytes]:
+    """
+    Binary-preimage hashes of one pulse in a single call: the 16-byte
+    pulse id, the glyph digest and the chain digest (raw SHA-256 digests)
+    """
+    pulse_id = _sha(_PULSE_FIELDS.pack(tai_ns, utc_unix, et_s) + node_id).digest()[:16]
+    glyph = _sha(pulse_id + last_hash + _F64.pack(utc_unix)).digest()
+    return pulse_id, glyph, _sha(glyph + last_hash + node_id).digest()
+
+def _chain_preimage(pulse: Dict, last_hash: str) -> bytes:
+    """
+    Preimage of a recorded pulse's chain_hash: its glyph, the previous
+    link (hex) and its node, in the layout of its preimage_version
+    """
+    node_b = pulse['source_node'].encode()
+    if pulse.get('preimage_version', PREIMAGE_TEXT) == PREIMAGE_BINARY:
+        return bytes.fromhex(pulse['glyph_hash']) + bytes.fromhex(last_hash) + node_b
+    return b"%s:%s:%s" % (pulse['glyph_hash'].encode(), last_hash.encode(), node_b)
+
+# (Unix second, "YYYY-MM-DDTHH:MM:SS") of the last _iso_utc call, swapped as one tuple
+_iso_second = (None, "")
+
+def _iso_utc(ns: int) -> str:
+    """UTC ISO 8601 string for Unix ns, in datetime.isoformat() layout with microseconds"""
+    global _iso_second
+    sec, frac = divmod(ns, 1_000_000_000)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = "%04d-%02d-%02dT%02d:%02d:%02d" % time.gmtime(sec)[:6]
+        _iso_second = (sec, prefix)
+    return "%s.%06d+00:00" % (prefix, frac // 1000)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize to one compact JSONL line; orjson appends the newline itself"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return _dumps(obj) + b"\n"
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get dict-backed pulses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class StarDatePulse:
     """
     Minimal, correct time pulse for ISS (Inventory Service System)
     Survives real space travel with three time domains
     """
-    tai_ns: int          # Integer nanoseconds since epoch (monotonic truth)
+    tai_ns: int          # Integer TAI nanoseconds since the Unix epoch
     utc_iso: str         # Human display time (leap-second aware)
     et_s: float          # Seconds past J2000 (TDB/ET) for SPICE/ephemeris
     
@@ -30,23 +129,47 @@ class StarDatePulse:
     glyph_hash: str      # Traceable glyph signature
     chain_hash: str      # Links to previous pulse (blockchain-style)
     source_node: str     # Originating system node
+    preimage_version: int = PREIMAGE_TEXT  # How the three hashes were derived
+    
+    # to_dict() result, built on first use; the chain write and API
+    # responses then share one dict per pulse
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'tai_ns': self.tai_ns,
-            'utc_iso': self.utc_iso,
-            'et_s': self.et_s,
-            'utc_unix': self.utc_unix,
-            'epoch_days': self.epoch_days,
-            'julian_date': self.julian_date,
-            'pulse_id': self.pulse_id,
-            'glyph_hash': self.glyph_hash,
-            'chain_hash': self.chain_hash,
-            'source_node': self.source_node
-        }
+        """Field dict of the pulse, cached: treat it as read-only"""
+        if self._dict is None:
+            object.__setattr__(self, '_dict', {
+                'tai_ns': self.tai_ns,
+                'utc_iso': self.utc_iso,
+                'et_s': self.et_s,
+                'utc_unix': self.utc_unix,
+                'epoch_days': self.epoch_days,
+                'julian_date': self.julian_date,
+                'pulse_id': self.pulse_id,
+                'glyph_hash': self.glyph_hash,
+                'chain_hash': self.chain_hash,
+                'source_node': self.source_node,
+                'preimage_version': self.preimage_version
+            })
+        return self._dict
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StarDatePulse":
+        """Rebuild a pulse from its to_dict() form (e.g. a chain line)"""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.init and f.name in data})
     
     def to_json(self) -> str:
+        """Indented JSON for display; chain lines are written with to_compact_json()"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
+    
+    def to_compact_json(self) -> bytes:
+        """
+        Compact JSON bytes, as stored on one glyph chain line: no indent or
+        newlines, so chain readers can split the file on b"\n"
+        """
+        return _dumps(self.to_dict())
 
 class ForensicTimeKeeper:
     """
@@ -57,15 +180,44 @@ class ForensicTimeKeeper:
     # Epochs
     J2000_EPOCH = 2451545.0  # Julian Date of J2000.0
     J2000_UNIX = 946728000.0  # Unix timestamp of J2000.0
+    TT_TAI_OFFSET = 32.184    # TT - TAI seconds
     
-    def __init__(self, node_id: str = "CALEON_PRIME", storage_path: str = "/mnt/kimi/output/forensic_time"):
+    def __init__(self, node_id: str = "CALEON_PRIME", storage_path: str = "/mnt/kimi/output/forensic_time",
+                 flush_every_n: int = 0, legacy_preimages: bool = False,
+                 hash_workers: int = 1):
         self.node_id = node_id
+        # Worker processes for recompute=True; the default hashes in-process,
+        # as a threaded server must, offline tools may pass os.cpu_count()
+        self.hash_workers = max(1, hash_workers)
+        self.legacy_preimages = legacy_preimages
+        self._node_id_b = node_id.encode()
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
         # Glyph trace chain (immutable append-only)
         self.chain_file = self.storage_path / "glyph_chain.jsonl"
-        self.last_hash = self._load_last_hash()
+        last_pulse = self._load_last_pulse()
+        self._last_hash_b = self._load_last_hash(last_pulse)
+        # The chain's newest pulse, for readers that must not append one
+        self._latest_pulse = None
+        if last_pulse is not None:
+            try:
+                self._latest_pulse = StarDatePulse.from_dict(last_pulse)
+            except TypeError:
+                pass  # line predates some fields; wait for the next pulse
+        
+        # One long-lived buffered handle: pulses reach the file in 64 KiB
+        # writes, every flush_every_n pulses (0: no count limit), on
+        # flush(), or before the chain is read back
+        self._chain_fh = open(self.chain_file, 'ab', buffering=1 << 16)
+        self._flush_every_n = flush_every_n
+        self._unflushed = 0
+        atexit.register(self.close)
+        
+        # How far verify_chain_integrity() has got; later calls resume here
+        self._verify_state = self._new_verify_state()
+        # (monotonic time, last hash, report) of the last incremental verify
+        self._integrity_cache: Tuple[float, Optional[bytes], Dict] = (float("-inf"), None, {})
         
         # Audit log
         self.audit_file = self.storage_path / "forensic_audit.log"
@@ -73,39 +225,69 @@ class ForensicTimeKeeper:
         # Initialize with constitutional awareness
         self._log_constitutional_binding()
     
-    def _load_last_hash(self) -> str:
-        """Load last chain hash for continuity"""
+    def _load_last_pulse(self) -> Optional[Dict]:
+        """Last line of the chain, parsed, if there is one"""
         if self.chain_file.exists():
-            with open(self.chain_file, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    try:
-                        last_pulse = json.loads(lines[-1])
-                        return last_pulse['glyph_hash'][:32]
-                    except:
-                        pass
+            lines = self._tail_lines(1)
+            if lines:
+                try:
+                    last_pulse = _loads(lines[-1])
+                except ValueError:
+                    return None
+                return last_pulse if isinstance(last_pulse, dict) else None
+        return None
+    
+    def _tail_lines(self, count: int) -> List[bytes]:
+        """
+        Last count non-blank chain lines (all of them for count=0), read
+        backwards from the end: a window sized for ~512-byte lines, doubled
+        until it holds enough
+        """
+        size = os.path.getsize(self.chain_file)
+        window = count * 512 if count else size
+        with open(self.chain_file, 'rb') as f:
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                lines = f.read(size - start).split(b"\n")
+                if start:
+                    lines = lines[1:]  # may start mid-line
+                lines = [line for line in (l.strip() for l in lines) if line]
+                if start == 0 or len(lines) >= count:
+                    return lines[-count:] if count else lines
+                window *= 2
+    
+    def _load_last_hash(self, last_pulse: Optional[Dict]) -> bytes:
+        """Load last chain hash (16 raw bytes) for continuity"""
+        if last_pulse is not None:
+            try:
+                return bytes.fromhex(last_pulse['glyph_hash'][:32])
+            except (KeyError, TypeError, ValueError):
+                pass
         # Genesis hash
-        return hashlib.sha256(b"CALEON_PRIME_GENESIS_0").hexdigest()[:32]
+        return _GENESIS_HASH
+    
+    @property
+    def last_hash(self) -> str:
+        """Last chain hash as the 32 hex digits written to the chain"""
+        return self._last_hash_b.hex()
     
     def _log_constitutional_binding(self):
         """Log constitutional awareness per Memory 39"""
         constitutional_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_utc(time.time_ns()),
             "article": "VII",
             "clause": "Flow Invariants",
             "binding": "All memory is IMMUTABLE and AUDITABLE",
             "system": "ForensicTimeKeeper",
             "node": self.node_id
         }
-        with open(self.audit_file, 'a') as f:
-            f.write(json.dumps(constitutional_entry) + "\n")
+        with open(self.audit_file, 'ab') as f:
+            f.write(_dumps(constitutional_entry) + b"\n")
     
     def _calculate_et(self, utc_timestamp: float) -> float:
         """Calculate Ephemeris Time (ET/TDB) seconds past J2000"""
-        leap_seconds = 37  # Current leap seconds
-        tai_offset = 32.184
-        et = (utc_timestamp - self.J2000_UNIX) + tai_offset + leap_seconds
-        return et
+        return (utc_timestamp - self.J2000_UNIX) + self.TT_TAI_OFFSET + LEAP_SECONDS
     
     def _calculate_julian_date(self, utc_timestamp: float) -> float:
         """Convert Unix timestamp to Julian Date"""
@@ -115,25 +297,58 @@ class ForensicTimeKeeper:
         """Days since J2000 epoch"""
         return (utc_timestamp - self.J2000_UNIX) / 86400.0
     
+    @classmethod
+    def batch_derive_times(cls, utc_unix) -> Tuple[Any, Any, Any]:
+        """
+        (et_s, epoch_days, julian_date) for many Unix timestamps at once, as
+        float64 arrays (lists without numpy), for replaying or importing
+        pulses; generate_pulse keeps the scalar math
+        """
+        if np is None:
+            delta = [t - cls.J2000_UNIX for t in utc_unix]
+            epoch_days = [d / 86400.0 for d in delta]
+            return ([d + cls.TT_TAI_OFFSET + LEAP_SECONDS for d in delta], epoch_days,
+                    [cls.J2000_EPOCH + d for d in epoch_days])
+        delta = np.asarray(utc_unix, dtype=np.float64) - cls.J2000_UNIX
+        epoch_days = delta / 86400.0
+        return delta + cls.TT_TAI_OFFSET + LEAP_SECONDS, epoch_days, cls.J2000_EPOCH + epoch_days
+    
     def generate_pulse(self) -> StarDatePulse:
         """Generate forensic-grade time pulse"""
-        utc_now = datetime.now(timezone.utc)
-        utc_unix = utc_now.timestamp()
-        utc_iso = utc_now.isoformat()
-        
-        tai_ns = time.monotonic_ns()
-        et_s = self._calculate_et(utc_unix)
-        epoch_days = self._calculate_epoch_days(utc_unix)
-        julian_date = self._calculate_julian_date(utc_unix)
+        # Single clock read; UTC and TAI are both derived from it
+        utc_ns = time.clock_gettime_ns(_CLOCK_ID) - _CLOCK_UTC_NS
+        tai_ns = utc_ns + _TAI_UTC_NS
+        utc_unix = utc_ns / 1e9
+        utc_iso = _iso_utc(utc_ns)
         
-        pulse_content = f"{tai_ns}:{utc_iso}:{et_s}:{self.node_id}"
-        pulse_id = hashlib.sha256(pulse_content.encode()).hexdigest()[:32]
+        # The _calculate_* helpers, inlined over one J2000 offset
+        delta = utc_unix - self.J2000_UNIX
+        et_s = delta + self.TT_TAI_OFFSET + LEAP_SECONDS
+        epoch_days = delta / 86400.0
+        julian_date = self.J2000_EPOCH + epoch_days
         
-        glyph_content = f"{pulse_id}:{self.last_hash}:{utc_unix}"
-        glyph_hash = hashlib.sha256(glyph_content.encode()).hexdigest()
-        
-        chain_content = f"{glyph_hash}:{self.last_hash}:{self.node_id}"
-        chain_hash = hashlib.sha256(chain_content.encode()).hexdigest()[:32]
+        if self.legacy_preimages:
+            # Text preimages built as bytes directly; %r matches str() for
+            # floats, so they are byte-for-byte those of earlier chains
+            preimage_version = PREIMAGE_TEXT
+            last_hash_b = self._last_hash_b.hex().encode()
+            pulse_content = b"%d:%s:%r:%s" % (tai_ns, utc_iso.encode(), et_s, self._node_id_b)
+            pulse_id = _sha(pulse_content).hexdigest()[:32]
+            
+            glyph_content = b"%s:%s:%r" % (pulse_id.encode(), last_hash_b, utc_unix)
+            glyph_hash = _sha(glyph_content).hexdigest()
+            
+            chain_content = b"%s:%s:%s" % (glyph_hash.encode(), last_hash_b, self._node_id_b)
+            chain_hash = _sha(chain_content).hexdigest()[:32]
+        else:
+            # Packed fields and raw digests: no number formatting or hex
+            # round trips inside the hash chain
+            preimage_version = PREIMAGE_BINARY
+            pulse_digest, glyph_digest, chain_digest = build_pulse_hashes(
+                tai_ns, utc_unix, et_s, self._node_id_b, self._last_hash_b)
+            pulse_id = pulse_digest.hex()
+            glyph_hash = glyph_digest.hex()
+            chain_hash = chain_digest[:16].hex()
         
         pulse = StarDatePulse(
             tai_ns=tai_ns,
@@ -145,100 +360,278 @@ class ForensicTimeKeeper:
             pulse_id=pulse_id,
             glyph_hash=glyph_hash,
             chain_hash=chain_hash,
-            source_node=self.node_id
+            source_node=self.node_id,
+            preimage_version=preimage_version
         )
         
-        self.last_hash = glyph_hash[:32]
+        self._last_hash_b = bytes.fromhex(glyph_hash[:32]) if self.legacy_preimages else glyph_digest[:16]
+        self._latest_pulse = pulse
         self._append_to_chain(pulse)
         
         return pulse
     
+    def latest_pulse(self) -> Optional[StarDatePulse]:
+        """Newest pulse in the chain, without generating one; None for an empty chain"""
+        return self._latest_pulse
+    
+    def tick(self) -> StarDatePulse:
+        """
+        Heartbeat pulse, for the application to schedule (e.g. once a
+        second) so that readers such as the dashboard can use latest_pulse()
+        """
+        return self.generate_pulse()
+    
     def _append_to_chain(self, pulse: StarDatePulse):
-        """Append pulse to immutable glyph chain"""
-        with open(self.chain_file, 'a') as f:
-            f.write(json.dumps(pulse.to_dict()) + "\n")
+        """Append pulse to immutable glyph chain, as its to_compact_json() line"""
+        self._chain_fh.write(_dumps_line(pulse.to_dict()))
+        if self._flush_every_n:
+            self._unflushed += 1
+            if self._unflushed >= self._flush_every_n:
+                self.flush()
+    
+    def generate_pulses(self, n: int) -> List[StarDatePulse]:
+        """Generate n pulses and make them durable with a single fsync"""
+        pulses = [self.generate_pulse() for _ in range(n)]
+        self.flush(fsync=True)
+        return pulses
+    
+    def flush(self, fsync: bool = False):
+        """Write buffered pulses to the chain file, optionally fsyncing it"""
+        if self._chain_fh.closed:
+            return
+        self._chain_fh.flush()
+        self._unflushed = 0
+        if fsync:
+            os.fsync(self._chain_fh.fileno())
+    
+    def close(self):
+        """Flush buffered pulses and close the chain file"""
+        if not self._chain_fh.closed:
+            self._chain_fh.close()
+        atexit.unregister(self.close)
+    
+    @staticmethod
+    def _new_verify_state() -> Dict:
+        """Verification progress: bytes and lines checked so far, the next expected link"""
+        return {
+            "offset": 0,
+            "line": 0,
+            "pulses": 0,
+            "expected_hash": _GENESIS_HASH.hex(),
+            "violations": []
+        }
     
-    def verify_chain_integrity(self) -> Dict:
-        """Forensic verification of entire glyph chain"""
+    def verify_chain_integrity(self, recompute: bool = False, full: bool = False,
+                               cache_ttl: float = 0.0) -> Dict:
+        """
+        Forensic verification of entire glyph chain
+        
+        Lines checked by an earlier call are not read again: only pulses
+        appended since then are verified, and earlier violations carry over.
+        full=True (or a chain that shrank) starts again from the first line.
+        With cache_ttl > 0 a report younger than cache_ttl seconds is reused
+        as long as no pulse has been generated since.
+        
+        Each chain_hash is re-derived from its glyph, the previous link and
+        the node, as generate_pulse wrote it.
+        
+        recompute=True re-derives pulse_id, glyph_hash and chain_hash of
+        every pulse from its recorded fields and the previous glyph, hashing
+        the whole chain in one batch (over hash_workers processes if set)
+        """
+        if cache_ttl > 0 and not (recompute or full):
+            cached_at, cached_hash, report = self._integrity_cache
+            if cached_hash == self._last_hash_b and time.monotonic() - cached_at < cache_ttl:
+                return report
+        
+        self.flush()
         if not self.chain_file.exists():
             return {"status": "EMPTY", "pulses": 0, "integrity": True}
         
+        if recompute:
+            return self._recompute_chain()
+        
+        state = self._verify_state
+        if full or os.path.getsize(self.chain_file) < state["offset"]:
+            state = self._verify_state = self._new_verify_state()
+        violations = state["violations"]
+        pulse_count = state["pulses"]
+        expected_hash = state["expected_hash"]
+        offset = state["offset"]
+        
+        # A trailing line without its newline is still being written; it is
+        # left for the next call
+        for line_num, (offset, line) in enumerate(self._iter_chain_lines(offset),
+                                                  state["line"] + 1):
+            state["line"] = line_num
+            if not line:
+                continue
+            try:
+                pulse = _loads(line)
+                pulse_count += 1
+                
+                # The link generate_pulse wrote: chain_hash over this glyph,
+                # the previous link and the node
+                chain_hash = _sha(_chain_preimage(pulse, expected_hash)).hexdigest()[:32]
+                if pulse.get('chain_hash') != chain_hash:
+                    violations.append({
+                        "line": line_num,
+                        "pulse_id": pulse.get('pulse_id'),
+                        "expected_hash": chain_hash,
+                        "found_hash": pulse.get('chain_hash'),
+                        "violation": "CHAIN_BREAK"
+                    })
+                
+                expected_hash = pulse['glyph_hash'][:32]
+                
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                violations.append({
+                    "line": line_num,
+                    "error": str(e),
+                    "violation": "CORRUPTION"
+                })
+        
+        state.update(offset=offset, pulses=pulse_count, expected_hash=expected_hash)
+        report = {
+            "status": "VIOLATED" if violations else "CLEAN",
+            "pulses": pulse_count,
+            "violations": list(violations),
+            "integrity": len(violations) == 0,
+            "last_verified": _iso_utc(time.time_ns())
+        }
+        self._integrity_cache = (time.monotonic(), self._last_hash_b, report)
+        return report
+    
+    def _iter_chain_lines(self, offset: int = 0, final: bool = False):
+        """
+        Yield (offset past the line, stripped line) for every newline-ended
+        line from offset on, splitting a read-only mmap of the chain with
+        find(); final=True also yields a trailing line that lacks its newline
+        """
+        size = os.path.getsize(self.chain_file)
+        if size <= offset:
+            return
+        with open(self.chain_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                find = mm.find
+                pos = offset
+                while True:
+                    end = find(b"\n", pos)
+                    if end < 0:
+                        break
+                    yield end + 1, mm[pos:end].strip()
+                    pos = end + 1
+                if final and pos < size:
+                    yield size, mm[pos:size].strip()
+    
+    def _recompute_chain(self) -> Dict:
+        """verify_chain_integrity(recompute=True): rebuild every preimage, then hash them in bulk"""
         violations = []
-        pulse_count = 0
-        expected_hash = hashlib.sha256(b"CALEON_PRIME_GENESIS_0").hexdigest()[:32]
-        
-        with open(self.chain_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    pulse = json.loads(line)
-                    pulse_count += 1
-                    
-                    if pulse.get('chain_hash') != expected_hash:
-                        violations.append({
-                            "line": line_num,
-                            "pulse_id": pulse.get('pulse_id'),
-                            "expected_hash": expected_hash,
-                            "found_hash": pulse.get('chain_hash'),
-                            "violation": "CHAIN_BREAK"
-                        })
-                    
-                    expected_hash = pulse.get('glyph_hash')[:32]
-                    
-                except json.JSONDecodeError as e:
+        pulses = []
+        pulse_pre, glyph_pre, chain_pre = [], [], []
+        last_hash = _GENESIS_HASH.hex()
+        
+        for line_num, (_, line) in enumerate(self._iter_chain_lines(final=True), 1):
+            if not line:
+                continue
+            try:
+                pulse = _loads(line)
+                node_b = pulse['source_node'].encode()
+                if pulse.get('preimage_version', PREIMAGE_TEXT) == PREIMAGE_BINARY:
+                    last_hash_b = bytes.fromhex(last_hash)
+                    preimages = (
+                        _PULSE_FIELDS.pack(pulse['tai_ns'], pulse['utc_unix'],
+                                           pulse['et_s']) + node_b,
+                        bytes.fromhex(pulse['pulse_id']) + last_hash_b +
+                        _F64.pack(pulse['utc_unix']),
+                        _chain_preimage(pulse, last_hash),
+                    )
+                else:
+                    last_hash_b = last_hash.encode()
+                    preimages = (
+                        b"%d:%s:%r:%s" % (pulse['tai_ns'], pulse['utc_iso'].encode(),
+                                          pulse['et_s'], node_b),
+                        b"%s:%s:%r" % (pulse['pulse_id'].encode(), last_hash_b,
+                                       pulse['utc_unix']),
+                        _chain_preimage(pulse, last_hash),
+                    )
+            except (ValueError, KeyError, TypeError, AttributeError, struct.error) as e:
+                violations.append({
+                    "line": line_num,
+                    "error": str(e),
+                    "violation": "CORRUPTION"
+                })
+                continue
+            pulses.append((line_num, pulse))
+            pulse_pre.append(preimages[0])
+            glyph_pre.append(preimages[1])
+            chain_pre.append(preimages[2])
+            last_hash = pulse['glyph_hash'][:32]
+        
+        recomputed = batch_sha256(pulse_pre + glyph_pre + chain_pre, self.hash_workers)
+        n = len(pulses)
+        for i, (line_num, pulse) in enumerate(pulses):
+            checks = (
+                ("pulse_id", recomputed[i][:32], "PULSE_ID_MISMATCH"),
+                ("glyph_hash", recomputed[n + i], "GLYPH_MISMATCH"),
+                ("chain_hash", recomputed[2 * n + i][:32], "CHAIN_BREAK"),
+            )
+            for key, expected, kind in checks:
+                if pulse[key] != expected:
                     violations.append({
                         "line": line_num,
-                        "error": str(e),
-                        "violation": "CORRUPTION"
+                        "pulse_id": pulse['pulse_id'],
+                        "expected_hash": expected,
+                        "found_hash": pulse[key],
+                        "violation": kind
                     })
+        violations.sort(key=lambda v: v["line"])
         
         return {
             "status": "VIOLATED" if violations else "CLEAN",
-            "pulses": pulse_count,
+            "pulses": n,
             "violations": violations,
             "integrity": len(violations) == 0,
-            "last_verified": datetime.now(timezone.utc).isoformat()
+            "last_verified": _iso_utc(time.time_ns())
         }
     
     def get_pulse_history(self, count: int = 100) -> List[Dict]:
         """Retrieve recent pulse history"""
+        self.flush()
         if not self.chain_file.exists():
             return []
         
         pulses = []
-        with open(self.chain_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        pulses.append(json.loads(line))
-                    except:
-                        pass
-        
-        return pulses[-count:] if count else pulses
+        for line in self._tail_lines(count):
+            try:
+                pulses.append(_loads(line))
+            except ValueError:
+                pass
+        
+        return pulses
+    
+    def snapshot_json(self, history: int = 10) -> bytes:
+        """
+        Latest pulse, integrity report and recent history as JSON bytes,
+        the payload DashboardRenderer.generate_static_shell() polls for
+        """
+        return _dumps({
+            "pulse": (self.latest_pulse() or self.generate_pulse()).to_dict(),
+            "integrity": self.verify_chain_integrity(cache_ttl=2.0),
+            "history": self.get_pulse_history(history)
+        })
 
 # Dashboard HTML Generator
-class DashboardRenderer:
-    """Renders forensic time dashboard with glyph trace visualization"""
-    
-    @staticmethod
-    def generate_dashboard(keeper: ForensicTimeKeeper, refresh_interval: int = 1000) -> str:
-        """Generate standalone HTML dashboard"""
-        
-        pulse = keeper.generate_pulse()
-        integrity = keeper.verify_chain_integrity()
-        history = keeper.get_pulse_history(10)
-        
-        html = f'''<!DOCTYPE html>
+# Constant part of the dashboard page (document head, styles, banner);
+# generate_dashboard only formats the cards after it
+_DASHBOARD_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Forensic Time Dashboard | Caleon Prime ISS</title>
     <style>
-        :root {{
+        :root {
             --bg-primary: #0a0a0f;
             --bg-secondary: #12121a;
             --accent-cyan: #00f0ff;
@@ -249,23 +642,23 @@ class DashboardRenderer:
             --text-secondary: #888;
             --border: #2a2a3a;
             --glyph-glow: 0 0 20px rgba(0, 240, 255, 0.3);
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Courier New', monospace;
             background: var(--bg-primary);
             color: var(--text-primary);
             min-height: 100vh;
             padding: 2rem;
-        }}
+        }
         
-        .constitutional-banner {{
+        .constitutional-banner {
             background: linear-gradient(90deg, #1a1a2e 0%, #16213e 100%);
             border: 1px solid var(--accent-gold);
             border-radius: 8px;
@@ -275,76 +668,76 @@ class DashboardRenderer:
             font-size: 0.85rem;
             color: var(--accent-gold);
             letter-spacing: 2px;
-        }}
+        }
         
-        .dashboard-grid {{
+        .dashboard-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
             gap: 1.5rem;
             max-width: 1600px;
             margin: 0 auto;
-        }}
+        }
         
-        .card {{
+        .card {
             background: var(--bg-secondary);
             border: 1px solid var(--border);
             border-radius: 12px;
             padding: 1.5rem;
             box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-        }}
+        }
         
-        .card-header {{
+        .card-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 1rem;
             padding-bottom: 0.5rem;
             border-bottom: 1px solid var(--border);
-        }}
+        }
         
-        .card-title {{
+        .card-title {
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 2px;
             color: var(--accent-cyan);
-        }}
+        }
         
-        .status-badge {{
+        .status-badge {
             padding: 0.25rem 0.75rem;
             border-radius: 20px;
             font-size: 0.75rem;
             font-weight: bold;
-        }}
+        }
         
-        .status-clean {{
+        .status-clean {
             background: rgba(0, 217, 163, 0.2);
             color: var(--accent-green);
             border: 1px solid var(--accent-green);
-        }}
+        }
         
-        .status-violated {{
+        .status-violated {
             background: rgba(255, 56, 96, 0.2);
             color: var(--accent-red);
             border: 1px solid var(--accent-red);
-        }}
+        }
         
-        .time-display {{
+        .time-display {
             font-size: 2rem;
             font-weight: bold;
             color: var(--accent-cyan);
             text-shadow: var(--glyph-glow);
             margin: 0.5rem 0;
             word-break: break-all;
-        }}
+        }
         
-        .time-label {{
+        .time-label {
             font-size: 0.75rem;
             color: var(--text-secondary);
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
         
-        .glyph-hash {{
+        .glyph-hash {
             font-family: monospace;
             font-size: 0.8rem;
             color: var(--accent-gold);
@@ -353,31 +746,31 @@ class DashboardRenderer:
             border-radius: 4px;
             word-break: break-all;
             margin-top: 0.5rem;
-        }}
+        }
         
-        .metric-row {{
+        .metric-row {
             display: flex;
             justify-content: space-between;
             padding: 0.75rem 0;
             border-bottom: 1px solid var(--border);
-        }}
+        }
         
-        .metric-row:last-child {{
+        .metric-row:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .metric-label {{
+        .metric-label {
             color: var(--text-secondary);
             font-size: 0.85rem;
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             color: var(--text-primary);
             font-weight: bold;
             font-family: monospace;
-        }}
+        }
         
-        .chain-visual {{
+        .chain-visual {
             display: flex;
             align-items: center;
             gap: 0.5rem;
@@ -386,9 +779,9 @@ class DashboardRenderer:
             padding: 0.5rem;
             background: rgba(0,0,0,0.3);
             border-radius: 8px;
-        }}
+        }
         
-        .chain-link {{
+        .chain-link {
             min-width: 60px;
             padding: 0.5rem;
             background: var(--bg-primary);
@@ -397,13 +790,13 @@ class DashboardRenderer:
             font-size: 0.7rem;
             text-align: center;
             color: var(--accent-cyan);
-        }}
+        }
         
-        .chain-arrow {{
+        .chain-arrow {
             color: var(--text-secondary);
-        }}
+        }
         
-        .audit-log {{
+        .audit-log {
             max-height: 200px;
             overflow-y: auto;
             font-size: 0.8rem;
@@ -411,15 +804,15 @@ class DashboardRenderer:
             padding: 1rem;
             border-radius: 8px;
             margin-top: 1rem;
-        }}
+        }
         
-        .audit-entry {{
+        .audit-entry {
             padding: 0.25rem 0;
             border-bottom: 1px solid var(--border);
             color: var(--text-secondary);
-        }}
+        }
         
-        .pulse-indicator {{
+        .pulse-indicator {
             display: inline-block;
             width: 8px;
             height: 8px;
@@ -427,19 +820,19 @@ class DashboardRenderer:
             border-radius: 50%;
             margin-right: 0.5rem;
             animation: pulse 2s infinite;
-        }}
+        }
         
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 1; }}
-            50% {{ opacity: 0.3; }}
-        }}
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.3; }
+        }
         
-        .refresh-info {{
+        .refresh-info {
             text-align: center;
             margin-top: 2rem;
             color: var(--text-secondary);
             font-size: 0.8rem;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -447,7 +840,21 @@ class DashboardRenderer:
         ⚖️ CONSTITUTIONAL LAW ARTICLE VII — ALL MEMORY IS IMMUTABLE AND AUDITABLE ⚖️
     </div>
     
-    <div class="dashboard-grid">
+'''
+
+class DashboardRenderer:
+    """Renders forensic time dashboard with glyph trace visualization"""
+    
+    @staticmethod
+    def generate_dashboard(keeper: ForensicTimeKeeper, refresh_interval: int = 1000) -> str:
+        """Generate standalone HTML dashboard"""
+        
+        # Rendering reads the chain; only an empty chain gets a first pulse
+        pulse = keeper.latest_pulse() or keeper.generate_pulse()
+        integrity = keeper.verify_chain_integrity(cache_ttl=2.0)
+        history = keeper.get_pulse_history(10)
+        
+        return ''.join((_DASHBOARD_HEAD, f'''    <div class="dashboard-grid">
         <!-- Primary Time Domains -->
         <div class="card">
             <div class="card-header">
@@ -547,7 +954,7 @@ class DashboardRenderer:
                 </span>
             </div>
             
-            {'<div class="audit-log">' + ''.join([f'<div class="audit-entry">⚠️ {v["violation"]} at line {v["line"]}</div>' for v in integrity['violations']]) + '</div>' if integrity['violations'] else ''}
+            {'<div class="audit-log">' + ''.join(f'<div class="audit-entry">⚠️ {v["violation"]} at line {v["line"]}</div>' for v in integrity['violations']) + '</div>' if integrity['violations'] else ''}
         </div>
         
         <!-- Recent History -->
@@ -589,9 +996,174 @@ class DashboardRenderer:
         console.log('Glyph Hash: {pulse.glyph_hash}');
     </script>
 </body>
-</html>'''
+</html>'''))
+    
+    @staticmethod
+    def generate_static_shell(refresh_interval: int = 1000, snapshot_url: str = "/pulse.json") -> str:
+        """
+        Dashboard page without pulse data, served once: it polls snapshot_url
+        (ForensicTimeKeeper.snapshot_json()) and fills in the fields in place
+        """
+        return ''.join((_DASHBOARD_HEAD, f'''    <div class="dashboard-grid">
+        <!-- Primary Time Domains -->
+        <div class="card">
+            <div class="card-header">
+                <span class="card-title">🌌 Star Date Pulse (ISS)</span>
+                <span class="status-badge" data-field="badge"></span>
+            </div>
+            
+            <div class="time-label">TAI Nanoseconds (Monotonic Truth)</div>
+            <div class="time-display" data-field="tai_ns"></div>
+            
+            <div class="time-label" style="margin-top: 1rem;">UTC ISO (Human Display)</div>
+            <div class="time-display" style="font-size: 1.2rem;" data-field="utc_iso"></div>
+            
+            <div class="time-label" style="margin-top: 1rem;">ET Seconds Past J2000 (Space Time)</div>
+            <div class="time-display" style="font-size: 1.5rem;" data-field="et_s"></div>
+        </div>
+        
+        <!-- Extended Timestamps -->
+        <div class="card">
+            <div class="card-header">
+                <span class="card-title">📊 Extended Temporal Reference</span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">UTC Unix Timestamp</span>
+                <span class="metric-value" data-field="utc_unix"></span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Epoch Days (J2000)</span>
+                <span class="metric-value" data-field="epoch_days"></span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Julian Date</span>
+                <span class="metric-value" data-field="julian_date"></span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Source Node</span>
+                <span class="metric-value" style="color: var(--accent-gold);" data-field="source_node"></span>
+            </div>
+        </div>
         
-        return html
+        <!-- Glyph Trace -->
+        <div class="card">
+            <div class="card-header">
+                <span class="card-title">🔗 Glyph Trace Chain</span>
+                <span class="status-badge status-clean">IMMUTABLE</span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Pulse ID</span>
+                <span class="metric-value" data-field="pulse_id"></span>
+            </div>
+            
+            <div class="time-label">Glyph Hash (SHA256)</div>
+            <div class="glyph-hash" data-field="glyph_hash"></div>
+            
+            <div class="time-label" style="margin-top: 1rem;">Chain Hash</div>
+            <div class="glyph-hash" data-field="chain_hash"></div>
+        </div>
+        
+        <!-- Chain Integrity -->
+        <div class="card">
+            <div class="card-header">
+                <span class="card-title">🔍 Forensic Audit</span>
+                <span class="status-badge" data-field="status"></span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Total Pulses in Chain</span>
+                <span class="metric-value" data-field="pulses"></span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Last Verified</span>
+                <span class="metric-value" data-field="last_verified"></span>
+            </div>
+            
+            <div class="metric-row">
+                <span class="metric-label">Violations Detected</span>
+                <span class="metric-value" data-field="violations"></span>
+            </div>
+            
+            <div class="audit-log" data-field="audit_log" hidden></div>
+        </div>
+        
+        <!-- Recent History -->
+        <div class="card" style="grid-column: 1 / -1;">
+            <div class="card-header">
+                <span class="card-title">📜 Recent Pulse History</span>
+                <span class="pulse-indicator"></span>
+            </div>
+            
+            <div style="background: var(--bg-primary); padding: 1rem; border-radius: 8px; border-left: 3px solid var(--accent-cyan);">
+                <div style="font-size: 0.75rem; color: var(--text-secondary);">
+                    Recent pulses loaded: <span data-field="history"></span>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="refresh-info">
+        <span class="pulse-indicator"></span>
+        Dashboard refreshes every {refresh_interval/1000:.1f}s | Caleon Prime ISS Forensic Timekeeping System
+    </div>
+    
+    <script>
+        const SNAPSHOT_URL = {_dumps(snapshot_url).decode()};
+        const set = (name, text) => {{
+            document.querySelector('[data-field="' + name + '"]').textContent = text;
+        }};
+        
+        async function refresh() {{
+            const body = await (await fetch(SNAPSHOT_URL, {{cache: 'no-store'}})).text();
+            const {{pulse, integrity, history}} = JSON.parse(body);
+            // tai_ns exceeds 2^53, so format it from the raw JSON digits
+            set('tai_ns', BigInt(body.match(/"tai_ns":(\\d+)/)[1]).toLocaleString('en-US'));
+            set('utc_iso', pulse.utc_iso);
+            set('et_s', pulse.et_s.toFixed(6));
+            for (const key of ['utc_unix', 'epoch_days', 'julian_date']) {{
+                set(key, pulse[key].toFixed(6));
+            }}
+            for (const key of ['source_node', 'pulse_id', 'glyph_hash', 'chain_hash']) {{
+                set(key, pulse[key]);
+            }}
+            
+            const state = integrity.integrity ? 'clean' : 'violated';
+            for (const name of ['badge', 'status']) {{
+                const badge = document.querySelector('[data-field="' + name + '"]');
+                badge.className = 'status-badge status-' + state;
+            }}
+            set('badge', integrity.integrity ? '✓ CLEAN' : '✗ VIOLATED');
+            set('status', integrity.status);
+            set('pulses', integrity.pulses);
+            set('last_verified', integrity.last_verified);
+            set('violations', integrity.violations.length);
+            
+            const log = document.querySelector('[data-field="audit_log"]');
+            log.hidden = integrity.violations.length === 0;
+            log.replaceChildren(...integrity.violations.map(v => {{
+                const entry = document.createElement('div');
+                entry.className = 'audit-entry';
+                entry.textContent = '⚠️ ' + v.violation + ' at line ' + v.line;
+                return entry;
+            }}));
+            set('history', history.length);
+        }}
+        
+        refresh();
+        setInterval(() => refresh().catch(console.error), {refresh_interval});
+        
+        // Console glyph trace
+        console.log('%c🔷 CALEON PRIME FORENSIC TIME', 'color: #00f0ff; font-size: 20px; font-weight: bold;');
+        console.log('%cConstitutional Article VII: All memory is immutable and auditable', 'color: #ffd700;');
+    </script>
+</body>
+</html>'''))
 
 # Generate and save dashboard - commented out to avoid import issues
 """
@@ -1,17 +1,223 @@
+import atexit
 import json
 import hashlib
+import mmap
 import os
 import stat
+import struct
+import sys
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from pathlib import Path
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows, which gets read-only attributes instead
+    fcntl = None
+
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 is optional; the "blake3" chain hash then uses BLAKE2b
+    blake3 = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only the "msgpack" record format needs it
+    msgpack = None
+
+try:
+    from .batch_hashing import batch_sha256
+except ImportError:  # loaded as a top-level module, with src/ on sys.path
+    from batch_hashing import batch_sha256
+
 # IMMUTABLE SPICE DESCRIPTOR LAYER v2.0
 # ACTUAL immutability - no file rewrites, computed indices, OS-level protection
 
+# hashlib's sha256 is OpenSSL's, which picks its SHA-NI/AVX2 code path from
+# CPUID at load time; bind it once instead of looking it up per descriptor
+_sha256 = hashlib.sha256
+
+def _hash_content(descriptor_id: str, process_name: str, assessed_at: str,
+                  prev_descriptor_hash: str) -> bytes:
+    """Preimage of a descriptor's self-hash"""
+    return f"{descriptor_id}:{process_name}:{assessed_at}:{prev_descriptor_hash}".encode()
+
+def _descriptor_hash(descriptor_id: str, process_name: str, assessed_at: str,
+                     prev_descriptor_hash: str) -> str:
+    """Self-hash of a descriptor, shared by compute_hash and chain verification"""
+    return _sha256(_hash_content(descriptor_id, process_name, assessed_at,
+                                 prev_descriptor_hash)).hexdigest()
+
+# Constructors for the index chain_hash, the aggregate over all descriptor
+# hashes; descriptor_hash itself (and so chain linking) is always SHA-256
+_CHAIN_HASHERS = {
+    "sha256": _sha256,
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+}
+if blake3 is not None:
+    _CHAIN_HASHERS["blake3"] = blake3
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Match orjson's output: no whitespace, raw UTF-8
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# (Unix second, "YYYY-MM-DDTHH:MM:SS") of the last _now_iso call
+_iso_second = (None, "")
+
+def _now_iso() -> str:
+    """
+    Current UTC time as ISO 8601 with microseconds, formatting the date and
+    time of day only once per second
+    """
+    global _iso_second
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = "%04d-%02d-%02dT%02d:%02d:%02d" % time.gmtime(sec)[:6]
+        _iso_second = (sec, prefix)
+    return "%s.%06d+00:00" % (prefix, frac // 1000)
+
+def _iter_lines_mmap(path: Path, offset: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset past the line, stripped line) for each line of an
+    append-only JSONL file from offset on, split on a read-only mmap with
+    find() instead of decoding the file line by line
+    """
+    size = os.path.getsize(path)
+    if size <= offset:
+        return
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):  # Python 3.8+ on platforms with madvise()
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            find = mm.find
+            pos = offset
+            while pos < size:
+                end = find(b"\n", pos)
+                if end < 0:
+                    end = size
+                yield end + 1 if end < size else size, mm[pos:end].strip()
+                pos = end + 1
+
+_RECORD_HEADER = struct.Struct('<I')
+
+def _iter_records_mmap(path: Path, offset: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset past the record, payload) for each length-prefixed record
+    of an append-only chain file from offset on; a truncated last record
+    yields what is left of it and ends the iteration
+    """
+    size = os.path.getsize(path)
+    if size <= offset:
+        return
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            pos = offset
+            while pos + _RECORD_HEADER.size <= size:
+                start = pos + _RECORD_HEADER.size
+                pos = start + _RECORD_HEADER.unpack_from(mm, pos)[0]
+                if pos > size:
+                    yield size, mm[start:size]
+                    return
+                yield pos, mm[start:pos]
+            if pos < size:
+                yield size, mm[pos:size]
+
+def _pack_record(record: Dict) -> bytes:
+    payload = msgpack.packb(record)
+    return _RECORD_HEADER.pack(len(payload)) + payload
+
+def _unpack_record(payload: bytes) -> Any:
+    return msgpack.unpackb(payload)
+
+@dataclass(frozen=True)
+class _RecordFormat:
+    """How descriptor records are framed in the chain file"""
+    file_name: str
+    header_size: int  # Framing bytes before each payload
+    encode: Callable[[Dict], bytes]  # Record -> framed bytes to append
+    iterate: Callable[[Path, int], Iterator[Tuple[int, bytes]]]  # (end offset, payload)
+    decode: Callable[[bytes], Any]  # Payload -> record; ValueError if malformed
+
+_RECORD_FORMATS = {
+    "jsonl": _RecordFormat("spice_chain.jsonl", 0, lambda record: _dumps(record) + b"\n",
+                           _iter_lines_mmap, _loads),
+    # Keys and numbers without JSON's quoting and separators: fewer bytes to
+    # read and cheaper to parse on verify/index passes bound by the file
+    "msgpack": _RecordFormat("spice_chain.msgpack", _RECORD_HEADER.size, _pack_record,
+                             _iter_records_mmap, _unpack_record),
+}
+
+# Record fields the computed index reads
+_INDEX_FIELDS = ('descriptor_id', 'capability_level', 'process_name', 'descriptor_hash',
+                 'glyph_range_start', 'glyph_range_end', 'aposteriori_refs', 'apriori_refs')
+
+# os.writev (POSIX only) and the most buffers one call may take
+_writev = getattr(os, "writev", None)
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in getattr(os, "sysconf_names", {}) else 16
+
+# Smallest chain worth parsing for the index in worker processes
+_PARALLEL_INDEX_MIN_BYTES = 16 << 20
+
+def _parse_index_range(path: Path, start: int, end: int,
+                       record_format: str = "jsonl") -> List[Tuple[int, int, Dict]]:
+    """
+    (payload offset, payload length, indexed fields) of each parseable record
+    that starts in [start, end); start must be a record start
+    """
+    fmt = _RECORD_FORMATS[record_format]
+    records = []
+    line_start = start
+    for line_end, line in fmt.iterate(path, start):
+        offset, line_start = line_start, line_end
+        if offset >= end:
+            break
+        if not line:
+            continue
+        try:
+            data = fmt.decode(line)
+        except ValueError:  # Malformed record (for JSONL, also bytes that aren't UTF-8)
+            continue
+        records.append((offset + fmt.header_size, line_end - offset - fmt.header_size,
+                        {k: data[k] for k in _INDEX_FIELDS if k in data}))
+    return records
+
+def _shard_bounds(path: Path, size: int, shards: int) -> List[int]:
+    """Split [0, size) of a JSONL file into up to shards ranges at line starts"""
+    bounds = [0]
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, shards):
+                newline = mm.find(b"\n", max(size * i // shards, bounds[-1]))
+                if newline < 0 or newline + 1 >= size:
+                    break
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return bounds
+
 class CapabilityLevel(Enum):
     LEVEL_0 = 0
     LEVEL_1 = 1
@@ -20,13 +226,42 @@ class CapabilityLevel(Enum):
     LEVEL_4 = 4
     LEVEL_5 = 5
 
+class Durability(Enum):
+    """
+    When appended descriptors are synced to disk. With NONE or FSYNC_BATCH
+    a crash can lose the last appends, but not the verifiability of the
+    chain before them: a torn final line fails to parse and is reported by
+    chain verification
+    """
+    NONE = "none"                          # Leave write-back to the OS
+    FSYNC_BATCH = "fsync_batch"            # Background fdatasync every sync_interval_s / sync_every_n appends
+    FSYNC_PER_APPEND = "fsync_per_append"  # fsync before create_descriptor(s) returns
+
+# Linux inode flag ioctls (linux/fs.h); FS_APPEND_FL is what `chattr +a` sets
+FS_IOC_GETFLAGS = 0x80086601
+FS_IOC_SETFLAGS = 0x40086602
+FS_APPEND_FL = 0x00000020
+
+# Distinct (process_name, process_version) id prefixes kept hashed
+_ID_PREFIX_CACHE_MAX = 1024
+
+# Audit trails kept built; descriptors never change, so only chain_linked
+# (which looks at the chain length for a genesis descriptor) can go stale
+_TRAIL_CACHE_MAX = 256
+
+# No fdatasync on macOS/Windows
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
 class ProcessOutcome(Enum):
     COMPLIANT = "compliant"
     NON_COMPLIANT = "non_compliant"
     PARTIAL = "partial"
     NOT_ASSESSED = "not_assessed"
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older interpreters get dict-backed descriptors
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class SPICEDescriptor:
     descriptor_id: str
     process_name: str
@@ -50,37 +285,97 @@ class SPICEDescriptor:
     prev_descriptor_hash: str = ""  # Links to previous descriptor
     descriptor_hash: str = ""      # Self-hash
 
+    @classmethod
+    def new(cls, prev_descriptor_hash: str, **kwargs) -> "SPICEDescriptor":
+        """Build a descriptor chained to prev_descriptor_hash, self-hash included"""
+        descriptor_hash = _descriptor_hash(kwargs['descriptor_id'], kwargs['process_name'],
+                                           kwargs['assessed_at'], prev_descriptor_hash)
+        return cls(**kwargs, prev_descriptor_hash=prev_descriptor_hash,
+                   descriptor_hash=descriptor_hash)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'descriptor_id': self.descriptor_id,
-            'process_name': self.process_name,
-            'process_version': self.process_version,
-            'capability_level': self.capability_level,
-            'process_outcome': self.process_outcome,
-            'compliance_score': self.compliance_score,
-            'apriori_refs': self.apriori_refs,
-            'aposteriori_refs': self.aposteriori_refs,
-            'glyph_range_start': self.glyph_range_start,
-            'glyph_range_end': self.glyph_range_end,
-            'glyph_count': self.glyph_count,
-            'evidence_required': self.evidence_required,
-            'evidence_provided': self.evidence_provided,
-            'assessed_by': self.assessed_by,
-            'assessed_at': self.assessed_at,
-            'assessment_method': self.assessment_method,
-            'active_constraints': self.active_constraints,
-            'advisory_notes': self.advisory_notes,
-            'prev_descriptor_hash': self.prev_descriptor_hash,
-            'descriptor_hash': self.descriptor_hash
-        }
+        """Field dict; list values are the descriptor's own, so treat it as read-only"""
+        return dict(zip(_DESCRIPTOR_FIELDS, _get_descriptor_fields(self)))
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), separators=(',', ':'))
+        return _dumps(self.to_dict()).decode()
 
     def compute_hash(self) -> str:
         """Compute SHA256 hash of descriptor content"""
-        content = f"{self.descriptor_id}:{self.process_name}:{self.assessed_at}:{self.prev_descriptor_hash}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _descriptor_hash(self.descriptor_id, self.process_name, self.assessed_at,
+                                self.prev_descriptor_hash)
+
+# Field names in declaration order, and one getter returning all their values
+_DESCRIPTOR_FIELDS = tuple(f.name for f in fields(SPICEDescriptor))
+_get_descriptor_fields = attrgetter(*_DESCRIPTOR_FIELDS)
+
+
+class ChainIndex:
+    """
+    Column-oriented lookup index over the descriptor chain: one row per
+    descriptor, in chain order, giving where its line sits in the JSONL,
+    plus inverted lists from glyph and apriori references to rows
+    """
+
+    def __init__(self):
+        self.descriptor_ids: List[str] = []
+        self.rows_by_id: Dict[str, int] = {}  # First row of each descriptor_id
+        self.offsets = array('q')  # Byte offset of each descriptor's line
+        self.lengths = array('q')  # Byte length of the line, newline included
+        self.end = 0  # Bytes of the chain covered by the index
+        self.glyph_rows: Dict[str, List[int]] = {}
+        self.apriori_rows: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.descriptor_ids)
+
+    def add(self, data: Dict, offset: int, length: int):
+        """Append the row of one descriptor record stored at offset"""
+        row = len(self.descriptor_ids)
+        descriptor_id = data.get('descriptor_id')
+        self.descriptor_ids.append(descriptor_id)
+        self.rows_by_id.setdefault(descriptor_id, row)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.end = max(self.end, offset + length)
+
+        glyphs = {data.get('glyph_range_start'), data.get('glyph_range_end')}
+        glyphs.update(data.get('aposteriori_refs') or ())
+        glyphs.discard(None)
+        glyphs.discard('')
+        for glyph in glyphs:
+            self.glyph_rows.setdefault(glyph, []).append(row)
+        for ref in set(data.get('apriori_refs') or ()):
+            self.apriori_rows.setdefault(ref, []).append(row)
+
+
+class MerkleAccumulator:
+    """
+    Append-only Merkle tree over descriptor hashes, in the RFC 6962 layout
+    (0x00-prefixed leaves, 0x01-prefixed nodes). Only the root of each
+    complete subtree is kept, so an append promotes at most log2(N) nodes
+    and the root folds those O(log N) peaks
+    """
+
+    def __init__(self):
+        self._peaks: List[Tuple[int, bytes]] = []  # (height, subtree root), tallest first
+
+    def add(self, leaf: bytes):
+        node = _sha256(b"\x00" + leaf).digest()
+        height = 0
+        while self._peaks and self._peaks[-1][0] == height:
+            node = _sha256(b"\x01" + self._peaks.pop()[1] + node).digest()
+            height += 1
+        self._peaks.append((height, node))
+
+    def root(self) -> str:
+        """Hex root; empty string for an empty tree"""
+        if not self._peaks:
+            return ""
+        node = self._peaks[-1][1]
+        for _, peak in reversed(self._peaks[:-1]):
+            node = _sha256(b"\x01" + peak + node).digest()
+        return node.hex()
 
 
 class ImmutableSPICELayer:
@@ -88,7 +383,7 @@ class ImmutableSPICELayer:
     ACTUALLY IMMUTABLE SPICE Descriptor Layer
 
     Guarantees:
-    1. NO file rewrites - append-only JSONL
+    1. NO file rewrites - append-only JSONL (or length-prefixed msgpack)
     2. NO persistent index files - computed in-memory only
     3. OS-level immutability (where supported)
     4. Cryptographic chain linking descriptors
@@ -99,12 +394,27 @@ class ImmutableSPICELayer:
     Constitutional Article VII: ACTUALLY enforced, not aspirational
     """
 
-    def __init__(self, storage_path: str = "./spice_layer_immutable"):
+    def __init__(self, storage_path: str = "./spice_layer_immutable",
+                 chain_hash_algorithm: str = "sha256",
+                 durability: Durability = Durability.FSYNC_BATCH,
+                 sync_interval_s: float = 0.05, sync_every_n: int = 64,
+                 record_format: str = "jsonl", workers: int = 1):
         self.storage_path = Path(storage_path)
+        # Worker processes for whole-chain hashing and index parsing. The
+        # default keeps everything in-process, as a threaded server must;
+        # offline tools may pass os.cpu_count()
+        self.workers = max(1, workers)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
-        # SINGLE SOURCE OF TRUTH: append-only JSONL file
-        self.descriptor_file = self.storage_path / "spice_chain.jsonl"
+        # SINGLE SOURCE OF TRUTH: append-only chain file, JSONL by default;
+        # "msgpack" stores length-prefixed msgpack records in its own file
+        if record_format not in _RECORD_FORMATS:
+            raise ValueError(f"Unknown record_format: {record_format!r}")
+        if record_format == "msgpack" and msgpack is None:
+            raise ValueError("record_format 'msgpack' requires the msgpack package")
+        self.record_format = record_format
+        self._record_format = _RECORD_FORMATS[record_format]
+        self.descriptor_file = self.storage_path / self._record_format.file_name
 
         # Integrity manifest (append-only, never rewritten)
         self.integrity_file = self.storage_path / "integrity_manifest.jsonl"
@@ -112,10 +422,53 @@ class ImmutableSPICELayer:
         # Constitutional binding log (append-only)
         self.constitutional_file = self.storage_path / "constitutional_log.jsonl"
 
+        # Long-lived O_APPEND descriptors per log file, opened on first write
+        self._fds: Dict[Path, int] = {}
+        atexit.register(self.close)
+
+        # Chain sync policy; under FSYNC_BATCH a background thread syncs the
+        # chain once sync_interval_s passes or sync_every_n appends are unsynced
+        self.durability = Durability(durability)
+        self.sync_interval_s = sync_interval_s
+        self.sync_every_n = max(1, sync_every_n)
+        self._unsynced = 0
+        self._sync_lock = threading.Lock()
+        self._sync_wakeup = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
+        self._closing = False
+
         # NO persistent index file - computed in-memory only
         self._computed_index: Optional[Dict] = None
+        # Algorithm of the index chain_hash, recorded in every manifest entry;
+        # "blake3" without the blake3 package falls back to BLAKE2b
+        if chain_hash_algorithm == "blake3" and blake3 is None:
+            chain_hash_algorithm = "blake2b"
+        if chain_hash_algorithm not in _CHAIN_HASHERS:
+            raise ValueError(f"Unknown chain_hash_algorithm: {chain_hash_algorithm!r}")
+        self.chain_hash_algorithm = chain_hash_algorithm
+        self._new_chain_hasher = _CHAIN_HASHERS[chain_hash_algorithm]
+
+        # Running hash over every descriptor_hash, so chain_hash can be
+        # extended on append instead of re-hashing the whole chain
+        self._chain_hasher = self._new_chain_hasher()
+        # Merkle tree over the same hashes, for merkle_root
+        self._merkle = MerkleAccumulator()
+        # Row-wise lookups for find_by_*, built and extended with the index
+        self._chain_index = ChainIndex()
+        # SHA-256 state after each "process_name:process_version:" id prefix
+        self._id_prefix_cache: Dict[Tuple[Any, Any], Any] = {}
+        # descriptor_id -> (descriptor count when built, audit trail)
+        self._trail_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # (index, descriptor count, report) of the last capability report
+        self._capability_cache: Optional[Tuple[Dict, int, Dict[str, Any]]] = None
         self._last_hash: str = "0" * 64  # Genesis hash
 
+        # Verified tip: byte offset and line count of the chain checked so
+        # far, and the descriptor hash it ends with
+        self._verified_tip_offset = 0
+        self._verified_lines = 0
+        self._verified_last_hash = self._last_hash
+
         # Initialize with integrity verification
         self._initialize_chain()
         self._log_constitutional_binding()
@@ -130,7 +483,7 @@ class ImmutableSPICELayer:
             if file.exists():
                 try:
                     os.chmod(file, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
-                except:
+                except OSError:
                     pass  # Ignore if can't change permissions
 
         if self.descriptor_file.exists():
@@ -140,55 +493,142 @@ class ImmutableSPICELayer:
                 raise IntegrityViolationError(
                     f"Chain integrity violation detected: {integrity['errors']}"
                 )
+            self._advance_verified_tip(integrity)
             self._last_hash = integrity["last_hash"]
 
+    def _append(self, path: Path, data: bytes, *more: bytes) -> int:
+        """
+        Append data (and any more buffers after it) to one of the log files;
+        returns the offset it was written at
+        """
+        fd = self._fds.get(path)
+        if fd is None:
+            fd = self._fds[path] = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if more and _writev is not None and len(more) < _IOV_MAX:
+            # One gathering write, without joining the buffers first
+            buffers = (data,) + more
+            size = sum(map(len, buffers))
+            written = _writev(fd, buffers)
+            view = memoryview(b"".join(buffers))[written:] if written < size else None
+        else:
+            if more:
+                data = b"".join((data,) + more)
+            size = len(data)
+            view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # With O_APPEND the position after the write is the end of this data,
+        # even if another writer appended in between
+        return os.lseek(fd, 0, os.SEEK_CUR) - size
+
+    def _appended_descriptors(self, count: int):
+        """Apply the durability mode to count descriptors just appended to the chain"""
+        if self.durability is Durability.FSYNC_PER_APPEND:
+            os.fsync(self._fds[self.descriptor_file])  # Force to disk
+        elif self.durability is Durability.FSYNC_BATCH:
+            with self._sync_lock:
+                self._unsynced += count
+                if self._sync_thread is None:
+                    self._sync_thread = threading.Thread(
+                        target=self._sync_loop, name="spice-fsync", daemon=True)
+                    self._sync_thread.start()
+            if self._unsynced >= self.sync_every_n:
+                self._sync_wakeup.set()
+
+    def _sync_chain(self):
+        """fdatasync the chain if appends are unsynced"""
+        with self._sync_lock:
+            fd = self._fds.get(self.descriptor_file)
+            if self._unsynced and fd is not None:
+                _fdatasync(fd)
+            self._unsynced = 0
+
+    def _sync_loop(self):
+        """FSYNC_BATCH background thread"""
+        while not self._closing:
+            self._sync_wakeup.wait(self.sync_interval_s)
+            self._sync_wakeup.clear()
+            self._sync_chain()
+
+    def close(self):
+        """Sync pending appends (unless durability is NONE) and close the log file descriptors"""
+        self._closing = True
+        if self._sync_thread is not None:
+            self._sync_wakeup.set()
+            self._sync_thread.join()
+            self._sync_thread = None
+        self._closing = False
+        self._sync_chain()
+        with self._sync_lock:
+            fds, self._fds = self._fds, {}
+        for fd in fds.values():
+            os.close(fd)
+        atexit.unregister(self.close)
+
     def _compute_index(self) -> Dict:
         """
         Compute index from immutable JSONL data
-        NEVER persisted - rebuilt on every initialization
+        NEVER persisted - rebuilt on every initialization, then kept up to
+        date by create_descriptor (together with _chain_hasher and _merkle)
         """
         index = {
             "descriptors": [],
             "process_types": {},
             "capability_distribution": {str(i): 0 for i in range(6)},
             "total_descriptors": 0,
-            "computed_at": datetime.now(timezone.utc).isoformat(),
-            "chain_hash": ""
+            "computed_at": _now_iso(),
+            "chain_hash": "",
+            "merkle_root": ""
         }
 
+        self._chain_hasher = self._new_chain_hasher()
+        self._merkle = MerkleAccumulator()
+        self._chain_index = ChainIndex()
         if not self.descriptor_file.exists():
             return index
 
-        chain_hashes = []
-
-        with open(self.descriptor_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    desc_id = data.get('descriptor_id')
+        # With workers > 1, parsing is split across processes on large
+        # chains; the records are then added in chain order, since the chain
+        # hashes are sequential
+        size = os.path.getsize(self.descriptor_file)
+        # (shard boundaries are found by newline, so only for JSONL)
+        workers = self.workers
+        if workers > 1 and size >= _PARALLEL_INDEX_MIN_BYTES and self.record_format == "jsonl":
+            bounds = _shard_bounds(self.descriptor_file, size, workers)
+            with ProcessPoolExecutor(max_workers=len(bounds) - 1) as pool:
+                parts = list(pool.map(_parse_index_range, [self.descriptor_file] * (len(bounds) - 1),
+                                      bounds[:-1], bounds[1:]))
+        else:
+            parts = [_parse_index_range(self.descriptor_file, 0, size, self.record_format)]
+
+        for part in parts:
+            for offset, length, data in part:
+                self._index_add(index, data, offset, length)
+        self._chain_index.end = size
 
-                    index["descriptors"].append(desc_id)
-                    index["total_descriptors"] += 1
-                    index["capability_distribution"][str(data.get('capability_level', 0))] += 1
+        return index
 
-                    process_name = data.get('process_name', 'unknown')
-                    if process_name not in index["process_types"]:
-                        index["process_types"][process_name] = []
-                    index["process_types"][process_name].append(desc_id)
+    def _index_add(self, index: Dict, data: Dict, offset: int, length: int):
+        """Add one descriptor record, stored at offset, to a computed index"""
+        desc_id = data.get('descriptor_id')
 
-                    chain_hashes.append(data.get('descriptor_hash', ''))
+        index["descriptors"].append(desc_id)
+        index["total_descriptors"] += 1
+        index["capability_distribution"][str(data.get('capability_level', 0))] += 1
 
-                except json.JSONDecodeError:
-                    continue
+        process_name = data.get('process_name', 'unknown')
+        if process_name not in index["process_types"]:
+            index["process_types"][process_name] = []
+        index["process_types"][process_name].append(desc_id)
 
-        # Compute chain hash
-        if chain_hashes:
-            index["chain_hash"] = hashlib.sha256(''.join(chain_hashes).encode()).hexdigest()
+        # Chain hash: hash of all descriptor hashes concatenated
+        descriptor_hash = data.get('descriptor_hash', '').encode()
+        self._chain_hasher.update(descriptor_hash)
+        index["chain_hash"] = self._chain_hasher.hexdigest()
+        self._merkle.add(descriptor_hash)
+        index["merkle_root"] = self._merkle.root()
 
-        return index
+        self._chain_index.add(data, offset, length)
 
     @property
     def index(self) -> Dict:
@@ -201,86 +641,129 @@ class ImmutableSPICELayer:
         """Invalidate computed index after append operations"""
         self._computed_index = None
 
-    def _verify_pre_operation_integrity(self) -> bool:
-        """Verify integrity before any operation"""
+    def _advance_verified_tip(self, integrity: Dict):
+        """Record a valid verification result as the new verified tip"""
+        self._verified_tip_offset = integrity["offset"]
+        self._verified_lines = integrity["lines"]
+        self._verified_last_hash = integrity["last_hash"]
+
+    def _verify_tail_integrity(self) -> bool:
+        """
+        Verify only what was appended after the verified tip (normally no
+        bytes before an append, one line after it); a chain that shrank is
+        verified again from the start
+        """
         if not self.descriptor_file.exists():
             return True
 
-        # Check file hasn't been tampered with
-        integrity = self._verify_chain_integrity()
+        size = self.descriptor_file.stat().st_size
+        if size == self._verified_tip_offset:
+            return True
+        if size < self._verified_tip_offset:
+            integrity = self._verify_chain_integrity()
+        else:
+            integrity = self._verify_chain_integrity(self._verified_tip_offset, self._verified_lines,
+                                                     self._verified_last_hash)
+        if integrity["valid"]:
+            self._advance_verified_tip(integrity)
         return integrity["valid"]
 
+    def _verify_pre_operation_integrity(self) -> bool:
+        """Verify integrity before any operation"""
+        # Check lines appended since the last check haven't been tampered with
+        tip_offset = self._verified_tip_offset
+        if not self._verify_tail_integrity():
+            return False
+        if self._verified_tip_offset != tip_offset:
+            # Another writer appended; the incrementally kept index lacks those lines
+            self._invalidate_index()
+        # Link new descriptors to the verified tip, including other writers' appends
+        self._last_hash = self._verified_last_hash
+        return True
+
     def _verify_post_operation_integrity(self) -> bool:
         """Verify integrity after operation completes"""
-        return self._verify_chain_integrity()["valid"]
+        return self._verify_tail_integrity()
 
-    def _verify_chain_integrity(self) -> Dict:
+    def _verify_chain_integrity(self, start_offset: int = 0, start_line: int = 0,
+                                expected_prev_hash: str = "0" * 64) -> Dict:
         """
-        Verify entire chain cryptographic integrity
-        Returns: {"valid": bool, "last_hash": str, "errors": []}
+        Verify entire chain cryptographic integrity, or the part of it after
+        start_offset (start_line lines, ending with expected_prev_hash)
+        Returns: {"valid": bool, "last_hash": str, "errors": [], "offset": int, "lines": int}
         """
         if not self.descriptor_file.exists():
-            return {"valid": True, "last_hash": "0" * 64, "errors": []}
+            return {"valid": True, "last_hash": "0" * 64, "errors": [], "offset": 0, "lines": 0}
 
         errors = []
-        expected_prev_hash = "0" * 64
         last_hash = expected_prev_hash
-
-        with open(self.descriptor_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-
-                    # Verify prev_hash linkage
-                    actual_prev = data.get('prev_descriptor_hash', '')
-                    if actual_prev != expected_prev_hash:
-                        errors.append({
-                            "line": line_num,
-                            "error": "HASH_CHAIN_BREAK",
-                            "expected": expected_prev_hash[:16],
-                            "found": actual_prev[:16]
-                        })
-
-                    # Verify self-hash
-                    computed = hashlib.sha256(
-                        f"{data.get('descriptor_id')}:{data.get('process_name')}:{data.get('assessed_at')}:{actual_prev}".encode()
-                    ).hexdigest()
-
-                    stored_hash = data.get('descriptor_hash', '')
-                    if stored_hash != computed:
-                        errors.append({
-                            "line": line_num,
-                            "error": "HASH_MISMATCH",
-                            "descriptor": data.get('descriptor_id')
-                        })
-
-                    expected_prev_hash = stored_hash
-                    last_hash = stored_hash
-
-                except json.JSONDecodeError as e:
+        offset = start_offset
+        line_num = start_line
+        # (line, descriptor_id, stored hash) and self-hash preimage per descriptor
+        stored = []
+        preimages = []
+
+        fmt = self._record_format
+        for line_num, (offset, line) in enumerate(fmt.iterate(self.descriptor_file, start_offset),
+                                                  start_line + 1):
+            if not line:
+                continue
+            try:
+                data = fmt.decode(line)
+
+                # Verify prev_hash linkage
+                actual_prev = data.get('prev_descriptor_hash', '')
+                if actual_prev != expected_prev_hash:
                     errors.append({
                         "line": line_num,
-                        "error": f"JSON_PARSE_ERROR: {str(e)[:50]}"
+                        "error": "HASH_CHAIN_BREAK",
+                        "expected": expected_prev_hash[:16],
+                        "found": actual_prev[:16]
                     })
 
+                # Self-hash, verified below in one batch
+                stored_hash = data.get('descriptor_hash', '')
+                stored.append((line_num, data.get('descriptor_id'), stored_hash))
+                preimages.append(_hash_content(data.get('descriptor_id'), data.get('process_name'),
+                                               data.get('assessed_at'), actual_prev))
+
+                expected_prev_hash = stored_hash
+                last_hash = stored_hash
+
+            except ValueError as e:  # Malformed record (for JSONL, also bytes that aren't UTF-8)
+                errors.append({
+                    "line": line_num,
+                    "error": f"JSON_PARSE_ERROR: {str(e)[:50]}"
+                })
+
+        for (stored_line, descriptor_id, stored_hash), computed in zip(stored, batch_sha256(preimages, self.workers)):
+            if stored_hash != computed:
+                errors.append({
+                    "line": stored_line,
+                    "error": "HASH_MISMATCH",
+                    "descriptor": descriptor_id
+                })
+        errors.sort(key=lambda e: e["line"])
+
         return {
             "valid": len(errors) == 0,
             "last_hash": last_hash,
-            "errors": errors[:5]  # Limit error reporting
+            "errors": errors[:5],  # Limit error reporting
+            "offset": offset,
+            "lines": line_num
         }
 
     def _apply_os_immutability(self):
         """Apply OS-level immutability where supported"""
         try:
-            # Linux: chattr +i (requires root)
-            if os.name == 'posix' and os.geteuid() == 0:
-                # Make descriptor file immutable (append-only via code)
-                if self.descriptor_file.exists():
-                    os.system(f"chattr +i {self.descriptor_file}")
-                    print(f"Applied OS immutability: {self.descriptor_file}")
+            # Linux: append-only inode flag, as `chattr +a` (requires
+            # CAP_LINUX_IMMUTABLE and ext*/xfs/btrfs). Not +i: that would
+            # also refuse the appends this layer makes
+            if fcntl is not None and os.geteuid() == 0:
+                for file in [self.descriptor_file, self.integrity_file]:
+                    if file.exists():
+                        self._set_append_only(file)
+                        print(f"Applied OS immutability: {file}")
 
             # Windows: Set read-only and system attributes (but not for constitutional log)
             elif os.name == 'nt':
@@ -291,6 +774,17 @@ class ImmutableSPICELayer:
         except Exception as e:
             print(f"OS immutability not applied (non-critical): {e}")
 
+    @staticmethod
+    def _set_append_only(path: Path):
+        """Add FS_APPEND_FL to a file's inode flags"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            flags = struct.unpack('I', fcntl.ioctl(fd, FS_IOC_GETFLAGS, struct.pack('I', 0)))[0]
+            if not flags & FS_APPEND_FL:
+                fcntl.ioctl(fd, FS_IOC_SETFLAGS, struct.pack('I', flags | FS_APPEND_FL))
+        finally:
+            os.close(fd)
+
     def _log_constitutional_binding(self):
         """Log Article VII binding - append only"""
         binding = {
@@ -304,31 +798,35 @@ class ImmutableSPICELayer:
                 "OS_IMMUTABILITY",
                 "PRE_POST_VERIFICATION"
             ],
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         }
 
         # Append to constitutional log
-        with open(self.constitutional_file, 'a') as f:
-            f.write(json.dumps(binding, separators=(',', ':')) + "\n")
+        self._append(self.constitutional_file, _dumps(binding) + b"\n")
 
         # Log integrity manifest
+        index = self.index
         manifest = {
             "timestamp": binding["timestamp"],
             "operation": "CONSTITUTIONAL_BINDING",
-            "chain_hash": self.index.get("chain_hash", ""),
-            "descriptor_count": self.index["total_descriptors"]
+            "chain_hash": index.get("chain_hash", ""),
+            "chain_hash_algorithm": self.chain_hash_algorithm,
+            "descriptor_count": index["total_descriptors"]
         }
-        with open(self.integrity_file, 'a') as f:
-            f.write(json.dumps(manifest, separators=(',', ':')) + "\n")
+        self._append(self.integrity_file, _dumps(manifest) + b"\n")
 
     def create_descriptor(self, **kwargs) -> SPICEDescriptor:
         """
         Create descriptor with ACTUAL immutability guarantees
         """
-        # PRE-OPERATION INTEGRITY CHECK
-        if not self._verify_pre_operation_integrity():
-            raise IntegrityViolationError("Pre-operation integrity check failed")
+        return self.create_descriptors_batch([kwargs])[0]
 
+    def _build_descriptor(self, prev_hash: str, kwargs: Dict[str, Any],
+                          now_iso: str) -> SPICEDescriptor:
+        """
+        Descriptor for one set of create_descriptor arguments, chained to
+        prev_hash; now_iso is the default assessed_at
+        """
         # Convert enums
         capability_level = kwargs.get('capability_level', 0)
         if isinstance(capability_level, CapabilityLevel):
@@ -338,12 +836,21 @@ class ImmutableSPICELayer:
         if isinstance(process_outcome, ProcessOutcome):
             process_outcome = process_outcome.value
 
-        # Generate descriptor ID
-        content = f"{kwargs.get('process_name')}:{kwargs.get('process_version')}:{time.time()}"
-        descriptor_id = hashlib.sha256(content.encode()).hexdigest()[:16]
-
-        # Create descriptor with hash chaining
-        descriptor = SPICEDescriptor(
+        # Generate descriptor ID: sha256("name:version:time"), resuming from
+        # the cached hash state after the "name:version:" prefix
+        key = (kwargs.get('process_name'), kwargs.get('process_version'))
+        prefix = self._id_prefix_cache.get(key)
+        if prefix is None:
+            if len(self._id_prefix_cache) >= _ID_PREFIX_CACHE_MAX:
+                self._id_prefix_cache.clear()
+            prefix = self._id_prefix_cache[key] = _sha256(f"{key[0]}:{key[1]}:".encode())
+        id_hasher = prefix.copy()
+        id_hasher.update(str(time.time()).encode())
+        descriptor_id = id_hasher.hexdigest()[:16]
+
+        # Create descriptor with hash chaining and its self-hash
+        return SPICEDescriptor.new(
+            prev_hash,
             descriptor_id=descriptor_id,
             process_name=kwargs.get('process_name', 'unknown'),
             process_version=kwargs.get('process_version', '1.0.0'),
@@ -358,52 +865,102 @@ class ImmutableSPICELayer:
             evidence_required=kwargs.get('evidence_required', []),
             evidence_provided=kwargs.get('evidence_provided', []),
             assessed_by=kwargs.get('assessed_by', 'SYSTEM'),
-            assessed_at=kwargs.get('assessed_at', datetime.now(timezone.utc).isoformat()),
+            assessed_at=kwargs.get('assessed_at', now_iso),
             assessment_method=kwargs.get('assessment_method', 'unknown'),
             active_constraints=kwargs.get('active_constraints', []),
-            advisory_notes=kwargs.get('advisory_notes'),
-            prev_descriptor_hash=self._last_hash,
-            descriptor_hash=""  # Will be computed
+            advisory_notes=kwargs.get('advisory_notes')
         )
 
-        # Compute self-hash
-        descriptor.descriptor_hash = descriptor.compute_hash()
+    def create_descriptors_batch(self, items: List[Dict[str, Any]]) -> List[SPICEDescriptor]:
+        """
+        Create several descriptors (each a dict of create_descriptor
+        arguments) as one group commit: a single write and fsync of the
+        chain, and a single write of their integrity manifest entries
+        """
+        if not items:
+            return []
+
+        # PRE-OPERATION INTEGRITY CHECK
+        if not self._verify_pre_operation_integrity():
+            raise IntegrityViolationError("Pre-operation integrity check failed")
+
+        # One timestamp for the whole operation
+        now_iso = _now_iso()
+        descriptors = []
+        records = []
+        lines = []
+        prev_hash = self._last_hash
+        for kwargs in items:
+            descriptor = self._build_descriptor(prev_hash, kwargs, now_iso)
+            prev_hash = descriptor.descriptor_hash
+            record = descriptor.to_dict()
+            descriptors.append(descriptor)
+            records.append(record)
+            lines.append(self._record_format.encode(record))
+
+        # Manifest entries carry the chain hash after each descriptor
+        index = self.index
 
         # ATOMIC APPEND OPERATION
         try:
-            with open(self.descriptor_file, 'a') as f:
-                f.write(descriptor.to_json() + "\n")
-                f.flush()
-                os.fsync(f.fileno())  # Force to disk
+            offset = self._append(self.descriptor_file, *lines)
+            self._appended_descriptors(len(lines))
 
             # Update chain state
-            self._last_hash = descriptor.descriptor_hash
-
-            # Invalidate computed index
-            self._invalidate_index()
+            self._last_hash = prev_hash
+
+            # Extend the computed index with the new descriptors
+            manifests = []
+            for record, line in zip(records, lines):
+                header = self._record_format.header_size
+                self._index_add(index, record, offset + header, len(line) - header)
+                offset += len(line)
+                manifests.append(_dumps({
+                    "timestamp": now_iso,
+                    "operation": "CREATE_DESCRIPTOR",
+                    "descriptor_id": record["descriptor_id"],
+                    "chain_hash": index["chain_hash"],
+                    "chain_hash_algorithm": self.chain_hash_algorithm,
+                    "descriptor_count": index["total_descriptors"]
+                }) + b"\n")
 
             # POST-OPERATION INTEGRITY CHECK
             if not self._verify_post_operation_integrity():
                 raise IntegrityViolationError("Post-operation integrity check failed")
 
             # Log to integrity manifest
-            manifest = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "operation": "CREATE_DESCRIPTOR",
-                "descriptor_id": descriptor_id,
-                "chain_hash": self.index["chain_hash"],
-                "descriptor_count": self.index["total_descriptors"]
-            }
-            with open(self.integrity_file, 'a') as f:
-                f.write(json.dumps(manifest, separators=(',', ':')) + "\n")
-
-            return descriptor
+            self._append(self.integrity_file, *manifests)
+
+            return descriptors
 
         except Exception as e:
             # ROLLBACK: Remove partially written data
             self._rollback_append()
             raise IntegrityViolationError(f"Atomic append failed: {e}")
 
+    def create_descriptor_from_template(self, template: Dict[str, Any], first_ref: str,
+                                        last_ref: Optional[str] = None,
+                                        glyph_count: int = 1) -> SPICEDescriptor:
+        """
+        Create descriptor from precomputed invariant fields
+        Only the aposteriori refs and glyph range are filled in per call
+        """
+        return self.create_descriptor(**self.template_args(template, first_ref, last_ref,
+                                                           glyph_count))
+
+    @staticmethod
+    def template_args(template: Dict[str, Any], first_ref: str,
+                      last_ref: Optional[str] = None,
+                      glyph_count: int = 1) -> Dict[str, Any]:
+        """create_descriptor arguments for a template and a glyph ref range"""
+        return {
+            **template,
+            "aposteriori_refs": [first_ref] if last_ref is None else [first_ref, last_ref],
+            "glyph_range_start": first_ref,
+            "glyph_range_end": first_ref if last_ref is None else last_ref,
+            "glyph_count": glyph_count
+        }
+
     def _rollback_append(self):
         """Rollback partial write (emergency use only)"""
         # In a truly immutable system, rollback is only for corruption recovery
@@ -415,87 +972,181 @@ class ImmutableSPICELayer:
         if not self.descriptor_file.exists():
             return None
 
-        with open(self.descriptor_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    if data.get('descriptor_id') == descriptor_id:
-                        return SPICEDescriptor(**data)
-                except:
-                    continue
-        return None
+        self.index  # Builds the chain index on first use
+        row = self._chain_index.rows_by_id.get(descriptor_id)
+        if row is None and self.descriptor_file.stat().st_size > self._chain_index.end:
+            # Another writer appended after the index was built
+            self._invalidate_index()
+            self.index
+            row = self._chain_index.rows_by_id.get(descriptor_id)
+        if row is None:
+            return None
+        descriptor = self._read_row(row)
+        if descriptor is None or descriptor.descriptor_id != descriptor_id:
+            # The line moved under the index (chain rewritten since it was built)
+            self._invalidate_index()
+            self.index
+            row = self._chain_index.rows_by_id.get(descriptor_id)
+            descriptor = None if row is None else self._read_row(row)
+        return descriptor
+
+    def _read_row(self, row: int) -> Optional[SPICEDescriptor]:
+        """One chain index row's descriptor, or None if its record no longer parses"""
+        try:
+            return self._read_rows([row])[0]
+        except ValueError:  # Malformed record (for JSONL, also bytes that aren't UTF-8)
+            return None
+
+    def _read_rows(self, rows: List[int]) -> List[SPICEDescriptor]:
+        """Load the descriptors of chain index rows, reading only their records"""
+        if not rows:
+            return []
+        chain = self._chain_index
+        descriptors = []
+        fd = os.open(self.descriptor_file, os.O_RDONLY)
+        try:
+            for row in rows:
+                if hasattr(os, "pread"):
+                    line = os.pread(fd, chain.lengths[row], chain.offsets[row])
+                else:  # Windows
+                    os.lseek(fd, chain.offsets[row], os.SEEK_SET)
+                    line = os.read(fd, chain.lengths[row])
+                descriptors.append(SPICEDescriptor(**self._record_format.decode(line)))
+        finally:
+            os.close(fd)
+        return descriptors
+
+    def find_by_glyph(self, glyph_hash: str) -> List[SPICEDescriptor]:
+        """Descriptors whose glyph range or aposteriori refs include glyph_hash"""
+        self.index  # Builds the chain index on first use
+        return self._read_rows(self._chain_index.glyph_rows.get(glyph_hash, []))
+
+    def find_by_apriori_ref(self, apriori_id: str) -> List[SPICEDescriptor]:
+        """Descriptors constrained by the apriori entry apriori_id"""
+        self.index  # Builds the chain index on first use
+        return self._read_rows(self._chain_index.apriori_rows.get(apriori_id, []))
+
+    def export_jsonl(self, path: str) -> int:
+        """
+        Write the chain as JSONL for external audit tools, whatever the
+        record format; returns the number of records written
+        """
+        count = 0
+        fmt = self._record_format
+        with open(path, 'wb') as out:
+            if self.descriptor_file.exists():
+                for _, payload in fmt.iterate(self.descriptor_file, 0):
+                    if payload:
+                        out.write(_dumps(fmt.decode(payload)) + b"\n")
+                        count += 1
+        return count
 
     def reconstruct_audit_trail(self, descriptor_id: str) -> Dict[str, Any]:
-        """Full audit trail with cryptographic verification"""
+        """Full audit trail with cryptographic verification; treat it as read-only"""
+        total = self.index["total_descriptors"]
+        cached = self._trail_cache.get(descriptor_id)
+        if cached is not None and (cached[0] == total or
+                                   cached[1]["descriptor"]["prev_descriptor_hash"] != "0" * 64):
+            return cached[1]
+
+        trail = dict(self.iter_audit_trail(descriptor_id))
+        if "error" not in trail:
+            if len(self._trail_cache) >= _TRAIL_CACHE_MAX:
+                self._trail_cache.clear()
+            self._trail_cache[descriptor_id] = (total, trail)
+        return trail
+
+    def iter_audit_trail(self, descriptor_id: str) -> Iterator[Tuple[str, Any]]:
+        """
+        (section, content) pairs of the audit trail, for streaming it out a
+        section at a time. The descriptor is read and verified before this
+        returns; the sections are then built lazily from it alone
+        """
         descriptor = self.get_descriptor(descriptor_id)
         if not descriptor:
-            return {"error": "Descriptor not found"}
+            return iter([("error", "Descriptor not found")])
 
         # Verify this descriptor's integrity
         computed_hash = descriptor.compute_hash()
-        hash_valid = computed_hash == descriptor.descriptor_hash
-
-        return {
-            "descriptor": descriptor.to_dict(),
-            "cryptographic_verification": {
-                "hash_valid": hash_valid,
-                "chain_linked": descriptor.prev_descriptor_hash != "0" * 64 or
-                               self.index["total_descriptors"] == 1,
-                "tamper_evident": True
-            },
-            "what_happened": {
-                "process": descriptor.process_name,
-                "version": descriptor.process_version,
-                "outcome": descriptor.process_outcome,
-                "glyph_range": f"{descriptor.glyph_range_start}...{descriptor.glyph_range_end}",
-                "glyph_count": descriptor.glyph_count
-            },
-            "why_it_happened": {
-                "apriori_constraints": descriptor.apriori_refs,
-                "active_constraints": descriptor.active_constraints,
-                "evidence_required": descriptor.evidence_required,
-                "evidence_provided": descriptor.evidence_provided
-            },
-            "how_it_happened": {
-                "capability_level": descriptor.capability_level,
-                "assessment_method": descriptor.assessment_method,
-                "assessed_by": descriptor.assessed_by,
-                "assessed_at": descriptor.assessed_at,
-                "compliance_score": descriptor.compliance_score
-            },
-            "what_was_learned": {
-                "aposteriori_refs": descriptor.aposteriori_refs,
-                "advisory_notes": descriptor.advisory_notes
-            }
+        verification = {
+            "hash_valid": computed_hash == descriptor.descriptor_hash,
+            "chain_linked": descriptor.prev_descriptor_hash != "0" * 64 or
+                           self.index["total_descriptors"] == 1,
+            "tamper_evident": True
+        }
+        return self._audit_sections(descriptor, verification)
+
+    @staticmethod
+    def _audit_sections(descriptor: SPICEDescriptor,
+                        verification: Dict[str, bool]) -> Iterator[Tuple[str, Any]]:
+        yield "descriptor", descriptor.to_dict()
+        yield "cryptographic_verification", verification
+        yield "what_happened", {
+            "process": descriptor.process_name,
+            "version": descriptor.process_version,
+            "outcome": descriptor.process_outcome,
+            "glyph_range": f"{descriptor.glyph_range_start}...{descriptor.glyph_range_end}",
+            "glyph_count": descriptor.glyph_count
+        }
+        yield "why_it_happened", {
+            "apriori_constraints": descriptor.apriori_refs,
+            "active_constraints": descriptor.active_constraints,
+            "evidence_required": descriptor.evidence_required,
+            "evidence_provided": descriptor.evidence_provided
+        }
+        yield "how_it_happened", {
+            "capability_level": descriptor.capability_level,
+            "assessment_method": descriptor.assessment_method,
+            "assessed_by": descriptor.assessed_by,
+            "assessed_at": descriptor.assessed_at,
+            "compliance_score": descriptor.compliance_score
+        }
+        yield "what_was_learned", {
+            "aposteriori_refs": descriptor.aposteriori_refs,
+            "advisory_notes": descriptor.advisory_notes
         }
 
     def get_capability_report(self) -> Dict[str, Any]:
-        """Generate capability maturity report from computed index"""
-        total = self.index["total_descriptors"]
+        """Generate capability maturity report from computed index; treat it as read-only"""
+        index = self.index
+        total = index["total_descriptors"]
         if total == 0:
             return {"status": "NO_DATA"}
+        # Reused until a descriptor is added or the index is rebuilt
+        cached = self._capability_cache
+        if cached is not None and cached[0] is index and cached[1] == total:
+            return cached[2]
 
-        distribution = self.index["capability_distribution"]
+        distribution = index["capability_distribution"]
         percentages = {k: (v/total)*100 for k, v in distribution.items()}
 
         avg_capability = sum(int(k)*v for k, v in distribution.items()) / total
 
-        return {
+        report = {
             "total_processes": total,
-            "capability_distribution": distribution,
+            "capability_distribution": dict(distribution),
             "percentages": percentages,
             "average_capability": avg_capability,
-            "process_types": list(self.index["process_types"].keys()),
-            "computed_at": self.index["computed_at"],
-            "chain_hash": self.index["chain_hash"]
+            "process_types": list(index["process_types"].keys()),
+            "computed_at": index["computed_at"],
+            "chain_hash": index["chain_hash"]
         }
+        self._capability_cache = (index, total, report)
+        return report
+
+    def verify_recent_integrity(self) -> bool:
+        """
+        Cheap integrity check for frequent polling: the chain up to the
+        verified tip is taken as checked, so only lines appended since are
+        verified (none, usually, which is a single stat). Use
+        verify_system_integrity for a full re-hash
+        """
+        return self._verify_tail_integrity()
 
     def verify_system_integrity(self) -> Dict[str, Any]:
         """Complete system integrity verification"""
         chain_integrity = self._verify_chain_integrity()
+        index = self.index
 
         return {
             "system": "ImmutableSPICELayer",
@@ -503,8 +1154,10 @@ class ImmutableSPICELayer:
             "constitutional_article": "VII",
             "enforcement": "ACTUAL",
             "chain_integrity": chain_integrity,
-            "total_descriptors": self.index["total_descriptors"],
-            "chain_hash": self.index.get("chain_hash", ""),
+            "total_descriptors": index["total_descriptors"],
+            "chain_hash": index.get("chain_hash", ""),
+            "chain_hash_algorithm": self.chain_hash_algorithm,
+            "merkle_root": index.get("merkle_root", ""),
             "immutability_guarantees": {
                 "no_file_rewrites": True,
                 "no_persistent_index": True,
@@ -512,8 +1165,11 @@ class ImmutableSPICELayer:
                 "pre_post_verification": True,
                 "os_immutability_applied": os.name == 'posix' and os.geteuid() == 0
             },
-            "verified_at": datetime.now(timezone.utc).isoformat()
+            "verified_at": _now_iso()
         }
+
+
+class IntegrityViolationError(Exception):
     """Raised when immutability guarantees are violated"""
     pass
 
@@ -6,17 +6,23 @@ Main FastAPI application for the Inventory Service System
 """
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from typing import List, Optional, Dict, Any
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
+import asyncio
+import itertools
+import orjson
 import uvicorn
 import os
+import sys
+import time
 
 # Import services and models
 from .services import ForensicService, SPICEService
-from .dashboard_service import DashboardService
+from .dashboard_service import DashboardService, RecordWriteCoalescer
 from .models import (
     ProcessData, DescriptorResponse, AuditTrailResponse,
     IntegrityResponse, HealthResponse,
@@ -28,6 +34,61 @@ from .models import (
 forensic_service = ForensicService()
 spice_service = SPICEService()
 dashboard_service = DashboardService()
+# Record POSTs arriving together share one append; DALS_BATCH_SIZE caps a batch
+record_writer = RecordWriteCoalescer(dashboard_service,
+                                     max_batch=int(os.getenv("DALS_BATCH_SIZE", 500)))
+
+# Short-TTL response cache for the polled status endpoints (dashboards,
+# liveness probes); key -> (monotonic expiry, response). Writes through the
+# API clear it, so a cached integrity result never hides the API's own appends
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+
+async def _cached(key: str, ttl_s: float, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """compute()'s response, reused for ttl_s seconds; errors aren't cached"""
+    now = time.monotonic()
+    hit = _response_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    response = await compute()
+    _response_cache[key] = (now + ttl_s, response)
+    return response
+
+def _invalidate_cached():
+    _response_cache.clear()
+
+def _utc_second_iso() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
+# Response timestamps: the current UTC second, refreshed twice a second by
+# _tick_now_iso so handlers don't format a datetime per request
+_now_iso = _utc_second_iso()
+_tick_task: Optional[asyncio.Task] = None
+
+async def _tick_now_iso():
+    global _now_iso
+    while True:
+        _now_iso = _utc_second_iso()
+        await asyncio.sleep(0.5)
+
+def _json_body(body: bytes, next_cursor: Optional[int] = None) -> Response:
+    """
+    Serve already-serialized JSON; FastAPI skips response_model validation
+    for it. List pages carry the cursor of their next page in X-Next-Cursor
+    """
+    headers = None if next_cursor is None else {"X-Next-Cursor": str(next_cursor)}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _verify_both(deep: bool = False) -> Tuple[str, bool]:
+    """
+    (forensic chain status, SPICE layer valid), both checks running at once
+    in the threadpool so their file reads don't block the event loop. The
+    quick checks only look at what was appended since the last check;
+    deep=True re-hashes both chains
+    """
+    forensic, spice_ok = await asyncio.gather(
+        run_in_threadpool(forensic_service.verify_chain_integrity, deep),
+        run_in_threadpool(spice_service.verify_integrity, deep))
+    return forensic["status"], spice_ok
 
 # FastAPI app
 app = FastAPI(
@@ -35,7 +96,8 @@ app = FastAPI(
     description="Digital Asset Ledger System (DALS) core implementation with Level-3 tamper-evident guarantees. All DALS subsystems must comply with this architecture.",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -55,6 +117,9 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 async def startup_event():
     """Initialize DALS core architecture and verify Level-3 compliance"""
     print("🔄 Initializing DALS Core Architecture - Level-3 Tamper-Evident Ledger...")
+    global _tick_task
+    _tick_task = asyncio.get_running_loop().create_task(_tick_now_iso())
+    record_writer.start()
 
     # Verify forensic chain integrity
     chain_status = forensic_service.verify_chain_integrity()
@@ -75,13 +140,21 @@ async def startup_event():
     print("🔒 DALS vault contamination prevention: ACTIVE")
     print("🏛️  All DALS subsystems must implement Level-3 guarantees")
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write queued records, flush queued SPICE descriptors and close dashboard file handles"""
+    if _tick_task is not None:
+        _tick_task.cancel()
+    await record_writer.stop()
+    dashboard_service.close()
+
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """System health check"""
-    try:
-        forensic_status = forensic_service.verify_chain_integrity()["status"]
-        spice_integrity = spice_service.verify_integrity()
+    async def compute():
+        forensic_status, spice_integrity = await _verify_both()
         spice_status = "VERIFIED" if spice_integrity else "FAILED"
 
         return HealthResponse(
@@ -90,8 +163,11 @@ async def health_check():
             spice_layer_integrity=spice_status,
             vault_contamination="NONE",
             constitutional_compliance="VERIFIED",
-            timestamp=datetime.utcnow().isoformat() + "Z"
+            timestamp=_now_iso
         )
+
+    try:
+        return await _cached("health", 5, compute)
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Health check failed: {str(e)}")
 
@@ -135,9 +211,10 @@ async def create_descriptor(data: ProcessData):
     """Create new SPICE descriptor"""
     try:
         descriptor = spice_service.create_descriptor(data)
+        _invalidate_cached()
         return DescriptorResponse(
             descriptor_id=descriptor.descriptor_id,
-            created_at=datetime.utcnow().isoformat() + "Z",
+            created_at=_now_iso,
             constitutional_binding="VERIFIED"
         )
     except Exception as e:
@@ -183,9 +260,11 @@ async def find_by_apriori(apriori_id: str):
 @app.get("/spice/capability/report")
 async def get_capability_report():
     """Get process maturity report"""
+    async def compute():
+        return spice_service.get_capability_report()
+
     try:
-        report = spice_service.get_capability_report()
-        return report
+        return await _cached("capability_report", 15, compute)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get capability report: {str(e)}")
 
@@ -202,23 +281,56 @@ async def reconstruct_audit_trail(descriptor_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to reconstruct audit trail: {str(e)}")
 
+@app.get("/audit/trail/{descriptor_id}/stream")
+async def stream_audit_trail(descriptor_id: str):
+    """Stream the audit trail as NDJSON, one {"section", "content"} line per section"""
+    try:
+        sections = await run_in_threadpool(spice_service.iter_audit_trail, descriptor_id)
+        first = next(sections)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to reconstruct audit trail: {str(e)}")
+    if first[0] == "error":
+        raise HTTPException(status_code=404, detail=first[1])
+    return StreamingResponse(
+        (orjson.dumps({"section": section, "content": content}) + b"\n"
+         for section, content in itertools.chain([first], sections)),
+        media_type="application/x-ndjson")
+
 @app.get("/audit/verify/integrity", response_model=IntegrityResponse)
 async def verify_system_integrity():
     """Verify entire system integrity"""
-    try:
-        forensic_status = forensic_service.verify_chain_integrity()["status"]
-        spice_integrity = "VERIFIED" if spice_service.verify_integrity() else "FAILED"
+    async def compute():
+        forensic_status, spice_ok = await _verify_both()
+        spice_integrity = "VERIFIED" if spice_ok else "FAILED"
 
         return IntegrityResponse(
             forensic_chain=forensic_status,
             spice_layer=spice_integrity,
             vault_contamination="NONE",
             constitutional_compliance="VERIFIED",
-            last_verified=datetime.utcnow().isoformat() + "Z"
+            last_verified=_now_iso
         )
+
+    try:
+        return await _cached("integrity", 5, compute)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Integrity verification failed: {str(e)}")
 
+@app.get("/audit/verify/integrity/deep", response_model=IntegrityResponse)
+async def verify_system_integrity_deep():
+    """Re-hash both chains end to end, for scheduled audits"""
+    try:
+        forensic_status, spice_ok = await _verify_both(deep=True)
+        return IntegrityResponse(
+            forensic_chain=forensic_status,
+            spice_layer="VERIFIED" if spice_ok else "FAILED",
+            vault_contamination="NONE",
+            constitutional_compliance="VERIFIED",
+            last_verified=_now_iso
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Deep integrity verification failed: {str(e)}")
+
 # =============================================================================
 # VAULT REFERENCE ENDPOINTS (/vault/*) - Read-only access
 # =============================================================================
@@ -226,14 +338,17 @@ async def verify_system_integrity():
 @app.get("/vault/status")
 async def get_vault_status():
     """Get vault reference status (read-only)"""
-    try:
+    async def compute():
         return {
             "apriori_vault": "READ_ONLY_ACCESS",
             "aposteriori_vault": "READ_ONLY_ACCESS",
             "trace_vault": "READ_ONLY_ACCESS",
             "contamination_status": "NONE",
-            "last_checked": datetime.utcnow().isoformat() + "Z"
+            "last_checked": _now_iso
         }
+
+    try:
+        return await _cached("vault_status", 5, compute)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to check vault status: {str(e)}")
 
@@ -244,8 +359,11 @@ async def get_vault_status():
 @app.get("/dashboard/summary", response_model=DashboardSummary)
 async def get_dashboard_summary():
     """Get dashboard summary statistics"""
-    try:
+    async def compute():
         return dashboard_service.get_dashboard_summary()
+
+    try:
+        return await _cached("dashboard_summary", 5, compute)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get dashboard summary: {str(e)}")
 
@@ -261,10 +379,21 @@ async def get_system_statuses():
 async def get_dashboard_data():
     """Get complete dashboard data"""
     try:
-        return dashboard_service.get_dashboard_data()
+        summary, statuses, activities = await asyncio.gather(
+            run_in_threadpool(dashboard_service.get_dashboard_summary),
+            run_in_threadpool(dashboard_service.get_system_statuses),
+            run_in_threadpool(dashboard_service.get_recent_activities))
+        return DashboardData(summary=summary, system_statuses=statuses,
+                             recent_activities=activities, alerts=[])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get dashboard data: {str(e)}")
 
+@app.get("/dashboard/data/stream")
+async def stream_dashboard_data():
+    """Stream complete dashboard data as NDJSON, one section per line"""
+    return StreamingResponse(dashboard_service.iter_dashboard_data(),
+                             media_type="application/x-ndjson")
+
 @app.get("/dashboard/activities")
 async def get_recent_activities(limit: int = Query(10, ge=1, le=100)):
     """Get recent activities across all systems"""
@@ -278,15 +407,18 @@ async def get_recent_activities(limit: int = Query(10, ge=1, le=100)):
 async def create_dals_record(record: DALSRecord):
     """Create a new DALS record"""
     try:
-        return dashboard_service.create_dals_record(record)
+        record_id = await record_writer.submit(dashboard_service.dals_file, record.model_dump())
+        _invalidate_cached()
+        return record_id
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create DALS record: {str(e)}")
 
 @app.get("/dashboard/dals/records", response_model=List[DALSRecord])
-async def get_dals_records(limit: Optional[int] = Query(None, ge=1, le=1000)):
+async def get_dals_records(limit: Optional[int] = Query(None, ge=1, le=1000),
+                           cursor: int = Query(0, ge=0)):
     """Get DALS records"""
     try:
-        return dashboard_service.get_dals_records(limit)
+        return _json_body(*dashboard_service.get_records_json(dashboard_service.dals_file, limit, cursor))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get DALS records: {str(e)}")
 
@@ -295,15 +427,18 @@ async def get_dals_records(limit: Optional[int] = Query(None, ge=1, le=1000)):
 async def create_goat_record(record: GOATRecord):
     """Create a new GOAT record"""
     try:
-        return dashboard_service.create_goat_record(record)
+        record_id = await record_writer.submit(dashboard_service.goat_file, record.model_dump())
+        _invalidate_cached()
+        return record_id
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create GOAT record: {str(e)}")
 
 @app.get("/dashboard/goat/records", response_model=List[GOATRecord])
-async def get_goat_records(limit: Optional[int] = Query(None, ge=1, le=1000)):
+async def get_goat_records(limit: Optional[int] = Query(None, ge=1, le=1000),
+                           cursor: int = Query(0, ge=0)):
     """Get GOAT records"""
     try:
-        return dashboard_service.get_goat_records(limit)
+        return _json_body(*dashboard_service.get_records_json(dashboard_service.goat_file, limit, cursor))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get GOAT records: {str(e)}")
 
@@ -312,6 +447,7 @@ async def update_goat_status(record_id: str, status: str, result: Optional[Dict[
     """Update GOAT record status"""
     try:
         success = dashboard_service.update_goat_status(record_id, status, result)
+        _invalidate_cached()
         return {"success": success, "record_id": record_id, "new_status": status}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update GOAT status: {str(e)}")
@@ -321,15 +457,18 @@ async def update_goat_status(record_id: str, status: str, result: Optional[Dict[
 async def create_nft_mint(mint: TrueMarkNFTMint):
     """Create a new NFT mint record"""
     try:
-        return dashboard_service.create_nft_mint(mint)
+        record_id = await record_writer.submit(dashboard_service.nft_mint_file, mint.model_dump())
+        _invalidate_cached()
+        return record_id
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create NFT mint: {str(e)}")
 
 @app.get("/dashboard/nft/mints", response_model=List[TrueMarkNFTMint])
-async def get_nft_mints(limit: Optional[int] = Query(None, ge=1, le=1000)):
+async def get_nft_mints(limit: Optional[int] = Query(None, ge=1, le=1000),
+                        cursor: int = Query(0, ge=0)):
     """Get NFT mint records"""
     try:
-        return dashboard_service.get_nft_mints(limit)
+        return _json_body(*dashboard_service.get_records_json(dashboard_service.nft_mint_file, limit, cursor))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get NFT mints: {str(e)}")
 
@@ -338,15 +477,18 @@ async def get_nft_mints(limit: Optional[int] = Query(None, ge=1, le=1000)):
 async def create_nft_record(record: NFTRecord):
     """Create a new NFT record with internal serial numbers"""
     try:
-        return dashboard_service.create_nft_record(record)
+        record_id = await record_writer.submit(dashboard_service.nft_records_file, record.model_dump())
+        _invalidate_cached()
+        return record_id
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create NFT record: {str(e)}")
 
 @app.get("/dashboard/nft/records", response_model=List[NFTRecord])
-async def get_nft_records(limit: Optional[int] = Query(None, ge=1, le=1000)):
+async def get_nft_records(limit: Optional[int] = Query(None, ge=1, le=1000),
+                          cursor: int = Query(0, ge=0)):
     """Get NFT records"""
     try:
-        return dashboard_service.get_nft_records(limit)
+        return _json_body(*dashboard_service.get_records_json(dashboard_service.nft_records_file, limit, cursor))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get NFT records: {str(e)}")
 
@@ -375,10 +517,20 @@ if __name__ == "__main__":
     print("🔄 DALS Dashboard: http://localhost:8000/dashboard")
     print("🏛️  Level-3 Tamper-Evident Ledger Active")
 
+    # uvloop and httptools ship with uvicorn[standard] (uvloop not on
+    # Windows); name them so a missing install is a startup error rather than
+    # a silent fallback to asyncio/h11. RELOAD=1 is for development only.
+    # One worker process only: each worker would extend its own copy of the
+    # forensic and SPICE chain tips and fork the chains
+    if int(os.getenv("WORKERS", 1)) != 1:
+        sys.exit("WORKERS must be 1: the forensic and SPICE chains are owned by one process")
+    reload = os.getenv("RELOAD", "0") == "1"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=reload,
         log_level="info"
     )
\ No newline at end of file
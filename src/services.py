@@ -5,10 +5,11 @@ ISS MODULE V2 - Service Layer
 Service classes for forensic timekeeping and SPICE descriptor management
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import os
 import sys
+import threading
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,80 +17,117 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .forensic_timekeeper import ForensicTimeKeeper, StarDatePulse
 from .immutable_spice_layer import ImmutableSPICELayer, SPICEDescriptor, ProcessOutcome, CapabilityLevel
 
+# How long a quick forensic chain check is reused while no pulse is generated
+QUICK_CHECK_TTL_S = 30.0
+
 class ForensicService:
     """Service for forensic timekeeping operations"""
 
     def __init__(self):
         self.service = ForensicTimeKeeper(
             node_id="ISS_MODULE_V2",
-            storage_path="./forensic_logs"
+            storage_path="./forensic_logs",
+            # A pulse returned by the API must already be in the chain file
+            flush_every_n=1
         )
+        # Endpoints call in from worker threads as well as the event loop
+        self._lock = threading.RLock()
 
     def generate_pulse(self) -> StarDatePulse:
         """Generate new forensic time pulse"""
-        return self.service.generate_pulse()
+        with self._lock:
+            return self.service.generate_pulse()
+
+    def verify_chain_integrity(self, deep: bool = False) -> Dict[str, Any]:
+        """Verify glyph chain integrity
 
-    def verify_chain_integrity(self) -> Dict[str, Any]:
-        """Verify glyph chain integrity"""
-        return self.service.verify_chain_integrity()
+        The quick check only reads pulses appended since the last one and is
+        reused for QUICK_CHECK_TTL_S while no pulse is generated; deep=True
+        re-derives every pulse's hashes from the whole chain
+        """
+        with self._lock:
+            if deep:
+                return self.service.verify_chain_integrity(recompute=True)
+            return self.service.verify_chain_integrity(cache_ttl=QUICK_CHECK_TTL_S)
 
     def get_pulse_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get pulse history"""
-        return self.service.get_pulse_history(limit)
+        with self._lock:
+            return self.service.get_pulse_history(limit)
 
 class SPICEService:
     """Service for SPICE descriptor operations with actual immutability"""
 
     def __init__(self):
         self.service = ImmutableSPICELayer(storage_path="./data/spice_layer_immutable")
+        # Endpoints call in from worker threads as well as the event loop
+        self._lock = threading.RLock()
 
     def create_descriptor(self, data) -> SPICEDescriptor:
         """Create new SPICE descriptor"""
         # Convert string outcome to enum
         outcome_enum = ProcessOutcome(data.process_outcome.lower())
 
-        return self.service.create_descriptor(
-            process_name=data.process_name,
-            process_version=data.process_version,
-            capability_level=CapabilityLevel(data.capability_level),
-            process_outcome=outcome_enum,
-            compliance_score=data.compliance_score,
-            apriori_refs=data.apriori_refs,
-            aposteriori_refs=data.aposteriori_refs,
-            glyph_range_start=data.glyph_range_start,
-            glyph_range_end=data.glyph_range_end,
-            glyph_count=data.glyph_count,
-            evidence_required=data.evidence_required,
-            evidence_provided=data.evidence_provided,
-            assessed_by=data.assessed_by,
-            assessment_method=data.assessment_method,
-            active_constraints=data.active_constraints
-        )
+        with self._lock:
+            return self.service.create_descriptor(
+                process_name=data.process_name,
+                process_version=data.process_version,
+                capability_level=CapabilityLevel(data.capability_level),
+                process_outcome=outcome_enum,
+                compliance_score=data.compliance_score,
+                apriori_refs=data.apriori_refs,
+                aposteriori_refs=data.aposteriori_refs,
+                glyph_range_start=data.glyph_range_start,
+                glyph_range_end=data.glyph_range_end,
+                glyph_count=data.glyph_count,
+                evidence_required=data.evidence_required,
+                evidence_provided=data.evidence_provided,
+                assessed_by=data.assessed_by,
+                assessment_method=data.assessment_method,
+                active_constraints=data.active_constraints
+            )
 
     def get_descriptor(self, descriptor_id: str) -> Optional[SPICEDescriptor]:
         """Get SPICE descriptor by ID"""
-        return self.service.get_descriptor(descriptor_id)
+        with self._lock:
+            return self.service.get_descriptor(descriptor_id)
 
     def find_by_glyph(self, glyph_hash: str) -> List[SPICEDescriptor]:
         """Find descriptors referencing specific glyph"""
-        return self.service.find_by_glyph(glyph_hash)
+        with self._lock:
+            return self.service.find_by_glyph(glyph_hash)
 
     def find_by_apriori(self, apriori_id: str) -> List[SPICEDescriptor]:
         """Find descriptors referencing apriori entry"""
-        return self.service.find_by_apriori_ref(apriori_id)
+        with self._lock:
+            return self.service.find_by_apriori_ref(apriori_id)
 
     def reconstruct_audit_trail(self, descriptor_id: str) -> Dict[str, Any]:
         """Full audit trail reconstruction"""
-        return self.service.reconstruct_audit_trail(descriptor_id)
+        with self._lock:
+            return self.service.reconstruct_audit_trail(descriptor_id)
+
+    def iter_audit_trail(self, descriptor_id: str) -> Iterator[Tuple[str, Any]]:
+        """Audit trail sections; only building the iterator touches the layer"""
+        with self._lock:
+            return self.service.iter_audit_trail(descriptor_id)
 
     def get_capability_report(self) -> Dict[str, Any]:
         """Get process maturity report"""
-        return self.service.get_capability_report()
+        with self._lock:
+            return self.service.get_capability_report()
+
+    def verify_integrity(self, deep: bool = False) -> bool:
+        """Verify SPICE layer integrity with actual immutability guarantees
 
-    def verify_integrity(self) -> bool:
-        """Verify SPICE layer integrity with actual immutability guarantees"""
+        The quick check verifies only descriptors appended since the last
+        verified tip; deep=True re-hashes the whole chain
+        """
         try:
-            integrity_report = self.service.verify_system_integrity()
+            with self._lock:
+                if not deep:
+                    return self.service.verify_recent_integrity()
+                integrity_report = self.service.verify_system_integrity()
             return integrity_report["chain_integrity"]["valid"]
         except Exception:
             return False
\ No newline at end of file
@@ -135,7 +135,10 @@ class SPICEDescriptorLayer:
         self.index_file = self.storage_path / "spice_index.json"
         
         self.index = self._load_index()
+        if "glyph_index" not in self.index:
+            self._rebuild_lookup_index()  # Index file from before the lookup maps
         self._last_descriptor_id = None
+        self._capability_cache: Optional[Dict[str, Any]] = None  # Cleared on create
         
         self._log_binding()
     
@@ -148,9 +151,44 @@ class SPICEDescriptorLayer:
             "process_types": {},
             "capability_distribution": {str(i): 0 for i in range(6)},
             "total_descriptors": 0,
-            "last_updated": datetime.now(timezone.utc).isoformat()
+            "last_updated": datetime.now(timezone.utc).isoformat(),
+            # Lookup maps: glyph / apriori ref -> descriptor ids, and the
+            # byte offset of each descriptor's line in the JSONL
+            "glyph_index": {},
+            "apriori_index": {},
+            "offsets": {}
         }
     
+    def _index_lookups(self, data: Dict[str, Any], offset: int):
+        """Add one descriptor record, stored at offset, to the lookup maps"""
+        descriptor_id = data['descriptor_id']
+        self.index["offsets"].setdefault(descriptor_id, offset)
+        glyphs = {data.get('glyph_range_start'), data.get('glyph_range_end')}
+        glyphs.update(data.get('aposteriori_refs') or ())
+        glyphs.discard(None)
+        glyphs.discard('')
+        for glyph in glyphs:
+            self.index["glyph_index"].setdefault(glyph, []).append(descriptor_id)
+        for ref in set(data.get('apriori_refs') or ()):
+            self.index["apriori_index"].setdefault(ref, []).append(descriptor_id)
+    
+    def _rebuild_lookup_index(self):
+        """Build the lookup maps from the descriptor file in one pass"""
+        self.index["glyph_index"] = {}
+        self.index["apriori_index"] = {}
+        self.index["offsets"] = {}
+        if self.descriptor_file.exists():
+            offset = 0
+            with open(self.descriptor_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            self._index_lookups(json.loads(line), offset)
+                        except (ValueError, KeyError):
+                            pass  # Unreadable line; get_descriptor's scan still sees it
+                    offset += len(line)
+        self._save_index()
+    
     def _save_index(self):
         self.index["last_updated"] = datetime.now(timezone.utc).isoformat()
         with open(self.index_file, 'w') as f:
@@ -207,8 +245,9 @@ class SPICEDescriptorLayer:
         )
         
         # Append to immutable chain
-        with open(self.descriptor_file, 'a') as f:
-            f.write(descriptor.to_json() + "\n")
+        with open(self.descriptor_file, 'ab') as f:
+            offset = f.tell()  # Append mode starts at the end of the file
+            f.write((descriptor.to_json() + "\n").encode())
         
         # Update index
         self.index["descriptors"].append(descriptor_id)
@@ -218,9 +257,11 @@ class SPICEDescriptorLayer:
         if descriptor.process_name not in self.index["process_types"]:
             self.index["process_types"][descriptor.process_name] = []
         self.index["process_types"][descriptor.process_name].append(descriptor_id)
+        self._index_lookups(descriptor.to_dict(), offset)
         
         self._save_index()
         self._last_descriptor_id = descriptor_id
+        self._capability_cache = None
         
         return descriptor
     
@@ -229,6 +270,17 @@ class SPICEDescriptorLayer:
         if not self.descriptor_file.exists():
             return None
         
+        offset = self.index["offsets"].get(descriptor_id)
+        if offset is not None:
+            with open(self.descriptor_file, 'rb') as f:
+                f.seek(offset)
+                try:
+                    data = json.loads(f.readline())
+                except ValueError:
+                    data = {}
+            if data.get('descriptor_id') == descriptor_id:
+                return SPICEDescriptor(**data)
+        
         with open(self.descriptor_file, 'r') as f:
             for line in f:
                 line = line.strip()
@@ -242,6 +294,18 @@ class SPICEDescriptorLayer:
                     continue
         return None
     
+    def find_by_glyph(self, glyph_hash: str) -> List[SPICEDescriptor]:
+        """Descriptors whose glyph range or aposteriori refs include glyph_hash"""
+        return self._lookup(self.index["glyph_index"].get(glyph_hash, []))
+    
+    def find_by_apriori_ref(self, apriori_id: str) -> List[SPICEDescriptor]:
+        """Descriptors constrained by the apriori entry apriori_id"""
+        return self._lookup(self.index["apriori_index"].get(apriori_id, []))
+    
+    def _lookup(self, descriptor_ids: List[str]) -> List[SPICEDescriptor]:
+        descriptors = [self.get_descriptor(d) for d in descriptor_ids]
+        return [d for d in descriptors if d is not None]
+    
     def reconstruct_audit_trail(self, descriptor_id: str) -> Dict[str, Any]:
         """
         Full audit trail reconstruction:
@@ -287,20 +351,23 @@ class SPICEDescriptorLayer:
         total = self.index["total_descriptors"]
         if total == 0:
             return {"status": "NO_DATA"}
+        if self._capability_cache is not None:
+            return self._capability_cache
         
         distribution = self.index["capability_distribution"]
         percentages = {k: (v/total)*100 for k, v in distribution.items()}
         
         avg_capability = sum(int(k)*v for k, v in distribution.items()) / total
         
-        return {
+        self._capability_cache = {
             "total_processes": total,
-            "capability_distribution": distribution,
+            "capability_distribution": dict(distribution),
             "percentages": percentages,
             "average_capability": avg_capability,
             "process_types": list(self.index["process_types"].keys()),
             "last_updated": self.index["last_updated"]
         }
+        return self._capability_cache
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""Shared fixtures for the ISS Module v2 tests"""
+
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.immutable_spice_layer import FS_APPEND_FL, FS_IOC_GETFLAGS, FS_IOC_SETFLAGS, fcntl
+
+
+def _clear_append_only(root: Path):
+    """Drop the append-only flag the SPICE layer sets as root, so tmp dirs can be removed"""
+    if fcntl is None or os.geteuid() != 0:
+        return
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            flags = struct.unpack('I', fcntl.ioctl(fd, FS_IOC_GETFLAGS, struct.pack('I', 0)))[0]
+            if flags & FS_APPEND_FL:
+                fcntl.ioctl(fd, FS_IOC_SETFLAGS, struct.pack('I', flags & ~FS_APPEND_FL))
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in tmp_path, where services create their relative storage dirs"""
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    _clear_append_only(tmp_path)
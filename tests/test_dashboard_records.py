@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+ISS Module v2 - Dashboard Record Tests
+======================================
+
+Record cache consistency and cursor paging of the dashboard service
+"""
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from src.dashboard_service import DashboardService, RecordWriteCoalescer
+from src.models import GOATRecord, NFTRecord, TrueMarkNFTMint
+
+
+@pytest.fixture
+def service(workdir):
+    service = DashboardService(data_dir=str(workdir / "dashboard"))
+    yield service
+    service.close()
+
+
+def _entry(value):
+    return {"record_id": value, "timestamp": "2025-01-01T00:00:00", "data": {"value": value}}
+
+
+def _write_records(path, values):
+    path.write_text("".join(json.dumps(_entry(v)) + "\n" for v in values))
+
+
+def test_load_records_sees_appends(service):
+    path = service.dals_file
+    _write_records(path, ["a", "b"])
+    assert [r["data"]["value"] for r in service._load_records(path)] == ["a", "b"]
+    with open(path, "a") as f:
+        f.write(json.dumps(_entry("c")) + "\n")
+    assert [r["data"]["value"] for r in service._load_records(path)] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("rewrite", [["x", "y"], ["xx", "yy", "zz"]])
+def test_load_records_sees_in_place_rewrite(service, rewrite):
+    path = service.dals_file
+    _write_records(path, ["a", "b"])
+    assert [r["data"]["value"] for r in service._load_records(path)] == ["a", "b"]
+    mtime_ns = path.stat().st_mtime_ns
+    _write_records(path, rewrite)
+    # Same or larger size; make sure the rewrite carries a new mtime
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert [r["data"]["value"] for r in service._load_records(path)] == rewrite
+    assert [r["data"]["value"] for r in service._load_records(path, min_count=1)][:1] == rewrite[:1]
+
+
+def test_records_json_cache_is_bounded(service, monkeypatch):
+    monkeypatch.setattr("src.dashboard_service._JSON_CACHE_MAX", 4)
+    _write_records(service.dals_file, [str(i) for i in range(20)])
+    for cursor in range(10):
+        body, next_cursor = service.get_records_json(service.dals_file, 1, cursor)
+        assert json.loads(body) == [{"value": str(cursor)}]
+        assert next_cursor == cursor + 1
+    assert len(service._json_cache) == 4
+
+
+def test_records_json_cache_drops_stale_parses(service):
+    path = service.dals_file
+    _write_records(path, ["a", "b"])
+    service.get_records_json(path, 1, 0)
+    service.get_records_json(path, 1, 1)
+    mtime_ns = path.stat().st_mtime_ns
+    _write_records(path, ["x", "y"])
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    body, _ = service.get_records_json(path, 1, 0)
+    assert json.loads(body) == [{"value": "x"}]
+    assert list(service._json_cache) == [(path, 1, 0)]
+
+
+def test_coalescer_batches_writes_off_the_loop(service, monkeypatch):
+    calls = []
+    append_records = service.append_records
+
+    def counting_append(file_path, records):
+        calls.append((threading.current_thread(), len(records)))
+        return append_records(file_path, records)
+
+    monkeypatch.setattr(service, "append_records", counting_append)
+
+    async def burst():
+        writer = RecordWriteCoalescer(service, max_batch=500, max_delay_s=0.01)
+        writer.start()
+        ids = await asyncio.gather(*(writer.submit(service.dals_file, {"value": str(i)})
+                                     for i in range(50)))
+        await writer.stop()
+        return ids, threading.current_thread()
+
+    ids, loop_thread = asyncio.run(burst())
+    assert len(set(ids)) == 50
+    assert calls and sum(n for _, n in calls) == 50 and len(calls) < 50
+    assert all(thread is not loop_thread for thread, _ in calls)
+    records = service._load_records(service.dals_file)
+    assert [r["record_id"] for r in records] == ids
+    assert [r["data"]["value"] for r in records] == [str(i) for i in range(50)]
+
+
+def test_coalescer_reports_write_errors(service, monkeypatch):
+    def failing_append(file_path, records):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(service, "append_records", failing_append)
+
+    async def submit_one():
+        writer = RecordWriteCoalescer(service)
+        writer.start()
+        try:
+            with pytest.raises(OSError):
+                await writer.submit(service.dals_file, {"value": "a"})
+        finally:
+            await writer.stop()
+
+    asyncio.run(submit_one())
+
+
+def test_cursor_pages_cover_the_file_once(service):
+    _write_records(service.dals_file, [str(i) for i in range(23)])
+    seen, cursor = [], 0
+    while True:
+        body, next_cursor = service.get_records_json(service.dals_file, 5, cursor)
+        page = json.loads(body)
+        if not page:
+            assert next_cursor == cursor
+            break
+        assert next_cursor == cursor + len(page)
+        seen.extend(row["value"] for row in page)
+        cursor = next_cursor
+    assert seen == [str(i) for i in range(23)]
+
+
+def test_cursor_stays_stable_under_appends(service):
+    path = service.dals_file
+    _write_records(path, [str(i) for i in range(6)])
+    body, cursor = service.get_records_json(path, 4, 0)
+    assert [row["value"] for row in json.loads(body)] == ["0", "1", "2", "3"]
+    service.append_records(path, [{"value": "6"}, {"value": "7"}])
+    body, cursor = service.get_records_json(path, 4, cursor)
+    assert [row["value"] for row in json.loads(body)] == ["4", "5", "6", "7"]
+    assert cursor == 8
+    # A full page is served from the cache, a short one sees new records
+    body, _ = service.get_records_json(path, 4, 8)
+    assert json.loads(body) == []
+    service.append_records(path, [{"value": "8"}])
+    body, cursor = service.get_records_json(path, 4, 8)
+    assert [row["value"] for row in json.loads(body)] == ["8"]
+    assert cursor == 9
+
+
+@pytest.mark.parametrize("count", [3, 2500])
+def test_bulk_append_keeps_cache_warm(service, count):
+    path = service.dals_file
+    service.append_records(path, [{"value": "first"}])
+    cached = service._load_records(path)
+    record_ids = service.bulk_append_records(path, [{"value": str(i)} for i in range(count)],
+                                             workers=2, log_spice=False)
+    assert len(record_ids) == count
+    records = service._load_records(path)
+    assert records is cached  # extended in place, not parsed again
+    assert [r["record_id"] for r in records[1:]] == record_ids
+    assert [r["data"]["value"] for r in records[1:]] == [str(i) for i in range(count)]
+    # A cold parse of the file agrees with the warm cache
+    service._cache.clear()
+    assert service._load_records(path) == records
+
+
+def test_bulk_append_logs_one_descriptor_per_batch(service):
+    path = service.goat_file
+    before = service.spice_layer.index["total_descriptors"]
+    record_ids = service.bulk_append_records(path, [{"value": str(i)} for i in range(3)])
+    assert service.spice_layer.index["total_descriptors"] == before + 1
+    assert service.spice_layer.find_by_glyph(record_ids[0])
+    assert service.spice_layer.find_by_glyph(record_ids[-1])
+
+
+def _goat(record_id, status="pending"):
+    return GOATRecord(record_id=record_id, operation_type="data_processing", status=status,
+                      created_at="2025-01-01T00:00:00")
+
+
+def _nft(record_id, dals_serials, truemark_serials):
+    mint = TrueMarkNFTMint(mint_id="m", nft_contract="0x1", token_id="1", serial_number="TM-1",
+                           metadata_uri="ipfs://x", minter_address="0x2",
+                           royalty_percentage=1.0, created_at="2025-01-01T00:00:00")
+    return NFTRecord(record_id=record_id, nft_info=mint, dals_serial_numbers=dals_serials,
+                     truemark_serial_numbers=truemark_serials, verification_status="verified",
+                     last_verified="2025-01-01T00:00:00")
+
+
+def test_goat_status_overrides_base_records(service):
+    entry_ids = [service.create_goat_record(_goat(f"goat-{i}")) for i in range(3)]
+    assert service.get_dashboard_summary().active_operations == 3
+
+    assert service.update_goat_status(entry_ids[1], "completed", {"rows": 7})
+    service.update_goat_status("goat-2", "failed")  # GOAT record id works too
+    rows = {r.record_id: r for r in service.get_goat_records()}
+    assert rows["goat-0"].status == "pending"
+    assert (rows["goat-1"].status, rows["goat-1"].result) == ("completed", {"rows": 7})
+    assert rows["goat-2"].status == "failed"
+    assert service.get_dashboard_summary().active_operations == 1
+
+    # A cached list body sees a new status although the file did not change
+    service.get_records_json(service.goat_file, 10, 0)
+    service.update_goat_status(entry_ids[0], "running")
+    body, _ = service.get_records_json(service.goat_file, 10, 0)
+    assert [row["status"] for row in json.loads(body)] == ["running", "completed", "failed"]
+    # Base records stay as written
+    assert [r["data"]["status"] for r in service._load_records(service.goat_file)] == ["pending"] * 3
+
+
+def test_goat_statuses_persist_across_restart(workdir):
+    service = DashboardService(data_dir=str(workdir / "dashboard"))
+    entry_id = service.create_goat_record(_goat("goat-0"))
+    service.update_goat_status(entry_id, "completed")
+    service.close()
+    service = DashboardService(data_dir=str(workdir / "dashboard"))
+    assert [r.status for r in service.get_goat_records()] == ["completed"]
+    service.close()
+
+
+def test_legacy_goat_status_rows_still_apply(service):
+    entry_id = service.create_goat_record(_goat("goat-0"))
+    service.append_records(service.goat_file, [{
+        "operation_type": "status_update", "original_record_id": entry_id,
+        "new_status": "completed", "result": {"ok": True}}])
+    rows = service.get_goat_records()
+    assert [(r.status, r.result) for r in rows] == [("completed", {"ok": True})]
+
+
+def test_find_nft_by_serial_follows_appends(service):
+    service.create_nft_record(_nft("nft-1", ["DALS-1", "DALS-2"], ["TM-1"]))
+    service.create_nft_record(_nft("nft-2", ["DALS-3"], ["TM-1", "TM-2"]))
+    assert [r.record_id for r in service.find_nft_by_serial("DALS-2")] == ["nft-1"]
+    assert [r.record_id for r in service.find_nft_by_serial("TM-1")] == ["nft-1", "nft-2"]
+    assert service.find_nft_by_serial("missing") == []
+
+    service.create_nft_record(_nft("nft-3", ["DALS-2"], []))
+    assert [r.record_id for r in service.find_nft_by_serial("DALS-2")] == ["nft-1", "nft-3"]
+
+
+def test_find_nft_by_serial_after_rewrite(service):
+    service.create_nft_record(_nft("nft-1", ["DALS-1"], []))
+    assert [r.record_id for r in service.find_nft_by_serial("DALS-1")] == ["nft-1"]
+    path = service.nft_records_file
+    mtime_ns = path.stat().st_mtime_ns
+    line = json.dumps({"record_id": "e", "timestamp": "t",
+                       "data": _nft("nft-9", ["DALS-9"], []).model_dump()})
+    path.write_text(line + "\n")
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert service.find_nft_by_serial("DALS-1") == []
+    assert [r.record_id for r in service.find_nft_by_serial("DALS-9")] == ["nft-9"]
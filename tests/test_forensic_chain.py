@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+ISS Module v2 - Forensic Chain Tests
+====================================
+
+Tamper detection and verification consistency for the forensic chains
+"""
+
+import ast
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from src.forensic_timekeeper import ForensicTimeKeeper
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def _load_plugin_module():
+    """Build the plugin module from its template without writing it out"""
+    tree = ast.parse((SRC / "forensic_time_plugin.py").read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "plugin_interface":
+            source = ast.literal_eval(node.value)
+            break
+    module = types.ModuleType("forensic_time_plugin_generated")
+    sys.modules[module.__name__] = module  # dataclasses resolve their module
+    exec(compile(source, "forensic_time_plugin_generated", "exec"), module.__dict__)
+    return module
+
+
+plugin_module = _load_plugin_module()
+
+
+def _make_plugin(tmp_path, **overrides):
+    config = plugin_module.ForensicConfig(
+        node_id="TEST_NODE", storage_path=str(tmp_path),
+        enable_console_trace=False, auto_verify=False, **overrides)
+    return plugin_module.ForensicTimePlugin(config)
+
+
+def _flip_hex_digit(path: Path, line_no: int, field: str):
+    """Change one hex digit of a field on the given line, keeping it valid JSON"""
+    lines = path.read_bytes().splitlines(keepends=True)
+    line = lines[line_no]
+    key = b'"' + field.encode() + b'":"'
+    pos = line.index(key) + len(key)
+    digit = b"0" if line[pos:pos + 1] != b"0" else b"1"
+    lines[line_no] = line[:pos] + digit + line[pos + 1:]
+    path.write_bytes(b"".join(lines))
+
+
+@pytest.mark.parametrize("legacy", [False, True])
+def test_plugin_verify_clean(tmp_path, legacy):
+    plugin = _make_plugin(tmp_path, legacy_hashing=legacy)
+    for _ in range(5):
+        plugin.pulse()
+    assert plugin.verify()["status"] == "CLEAN"
+    assert plugin.verify(full=True)["status"] == "CLEAN"
+    plugin.close()
+
+
+def test_plugin_verify_detects_jsonl_tamper(tmp_path):
+    plugin = _make_plugin(tmp_path)
+    for _ in range(5):
+        plugin.pulse()
+    plugin.flush()
+    _flip_hex_digit(plugin.chain_path, 2, "chain_hash")
+    assert plugin.verify()["status"] == "VIOLATED"
+    plugin.close()
+
+
+@pytest.mark.parametrize("legacy", [False, True])
+def test_keeper_fresh_chain_clean_in_both_modes(tmp_path, legacy):
+    keeper = ForensicTimeKeeper(node_id="TEST_NODE", storage_path=str(tmp_path),
+                                legacy_preimages=legacy)
+    for _ in range(3):
+        keeper.generate_pulse()
+    quick = keeper.verify_chain_integrity(full=True)
+    deep = keeper.verify_chain_integrity(recompute=True)
+    assert (quick["status"], quick["pulses"]) == ("CLEAN", 3)
+    assert (deep["status"], deep["pulses"]) == ("CLEAN", 3)
+    keeper.close()
+
+
+def test_keeper_detects_tamper_in_both_modes(tmp_path):
+    keeper = ForensicTimeKeeper(node_id="TEST_NODE", storage_path=str(tmp_path))
+    for _ in range(3):
+        keeper.generate_pulse()
+    keeper.flush()
+    _flip_hex_digit(keeper.chain_file, 1, "glyph_hash")
+    assert keeper.verify_chain_integrity(full=True)["status"] == "VIOLATED"
+    assert keeper.verify_chain_integrity(recompute=True)["status"] == "VIOLATED"
+    keeper.close()
+
+
+def test_plugin_verify_incremental_checks_new_pulses(tmp_path):
+    plugin = _make_plugin(tmp_path)
+    for _ in range(3):
+        plugin.pulse()
+    assert plugin.verify_incremental()["status"] == "CLEAN"
+    for _ in range(3):
+        plugin.pulse()
+    plugin.flush()
+    _flip_hex_digit(plugin.chain_path, 4, "chain_hash")
+    report = plugin.verify_incremental()
+    assert report["status"] == "VIOLATED"
+    assert report["pulses"] == 6
+    plugin.close()
+
+
+def test_plugin_columns_detect_tamper_without_jsonl(tmp_path):
+    plugin = _make_plugin(tmp_path, write_jsonl=False)
+    for _ in range(4):
+        plugin.pulse()
+    assert plugin.verify()["status"] == "CLEAN"
+    plugin.flush()
+    chain_column = plugin._columns.paths["chain"]
+    data = bytearray(chain_column.read_bytes())
+    data[16] ^= 0xFF  # first byte of the second pulse's chain hash
+    chain_column.write_bytes(bytes(data))
+    assert plugin.verify()["status"] == "VIOLATED"
+    plugin.close()
+
+
+def test_plugin_restart_continues_chain(tmp_path):
+    plugin = _make_plugin(tmp_path)
+    for _ in range(3):
+        plugin.pulse()
+    plugin.close()
+    plugin = _make_plugin(tmp_path)
+    for _ in range(2):
+        plugin.pulse()
+    report = plugin.verify()
+    assert (report["status"], report["pulses"]) == ("CLEAN", 5)
+    plugin.close()
+
+
+def test_keeper_restart_continues_chain(tmp_path):
+    keeper = ForensicTimeKeeper(node_id="TEST_NODE", storage_path=str(tmp_path))
+    for _ in range(3):
+        keeper.generate_pulse()
+    keeper.close()
+    keeper = ForensicTimeKeeper(node_id="TEST_NODE", storage_path=str(tmp_path))
+    for _ in range(2):
+        keeper.generate_pulse()
+    assert keeper.verify_chain_integrity()["status"] == "CLEAN"
+    deep = keeper.verify_chain_integrity(recompute=True)
+    assert (deep["status"], deep["pulses"]) == ("CLEAN", 5)
+    keeper.close()
+
+
+def _wait_for_lines(path: Path, n: int, timeout_s: float = 2.0) -> int:
+    """Lines on disk once n have arrived or timeout_s has passed, without flushing"""
+    deadline = time.monotonic() + timeout_s
+    while True:
+        lines = len(path.read_bytes().splitlines()) if path.exists() else 0
+        if lines >= n or time.monotonic() >= deadline:
+            return lines
+        time.sleep(0.01)
+
+
+def test_append_log_flushes_idle_lines_by_deadline(tmp_path):
+    log = plugin_module.AppendLog(tmp_path / "audit.jsonl", flush_interval_s=0.05)
+    for i in range(3):
+        log.append_json({"event": i})
+    assert _wait_for_lines(log.path, 3) == 3
+    log.close()
+
+
+def test_plugin_without_writer_thread_writes_idle_pulses(tmp_path):
+    plugin = _make_plugin(tmp_path, writer_thread=False, flush_interval_s=0.05)
+    for _ in range(3):
+        plugin.pulse()
+    assert _wait_for_lines(plugin.chain_path, 3) == 3
+    assert plugin.verify()["status"] == "CLEAN"
+    plugin.close()
+
+
+def test_plugin_mixed_hashing_chain_verifies(tmp_path):
+    plugin = _make_plugin(tmp_path, legacy_hashing=True)
+    for _ in range(2):
+        plugin.pulse()
+    plugin.close()
+    plugin = _make_plugin(tmp_path)
+    for _ in range(2):
+        plugin.pulse()
+    report = plugin.verify()
+    assert (report["status"], report["pulses"]) == ("CLEAN", 4)
+    plugin.close()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+ISS Module v2 - Immutable SPICE Layer Tests
+===========================================
+
+Chain and Merkle digests, tamper detection, incremental verification,
+durability modes and restart consistency of the immutable SPICE layer,
+and the glyph / apriori lookups of both SPICE layers
+"""
+
+import hashlib
+import json
+import time
+
+import pytest
+
+import src.immutable_spice_layer as immutable_spice_layer
+from src.immutable_spice_layer import (
+    Durability, ImmutableSPICELayer, IntegrityViolationError, MerkleAccumulator
+)
+from src.spice_descriptor_layer import SPICEDescriptorLayer
+
+
+def _reference_merkle_root(leaves):
+    """RFC 6962 Merkle tree hash, computed recursively"""
+    if len(leaves) == 1:
+        return hashlib.sha256(b"\x00" + leaves[0]).digest()
+    split = 1
+    while split * 2 < len(leaves):
+        split *= 2
+    return hashlib.sha256(b"\x01" + _reference_merkle_root(leaves[:split]) +
+                          _reference_merkle_root(leaves[split:])).digest()
+
+
+def _make_layer(path):
+    return ImmutableSPICELayer(storage_path=str(path), durability=Durability.NONE)
+
+
+def _fill(layer, n, name="TestProcess"):
+    return [layer.create_descriptor(process_name=name, capability_level=i % 6,
+                                    glyph_range_start=f"g{i}", glyph_range_end=f"g{i}")
+            for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 13])
+def test_merkle_accumulator_matches_rfc6962(n):
+    leaves = [hashlib.sha256(b"%d" % i).hexdigest().encode() for i in range(n)]
+    accumulator = MerkleAccumulator()
+    for leaf in leaves:
+        accumulator.add(leaf)
+    assert accumulator.root() == _reference_merkle_root(leaves).hex()
+
+
+def test_index_digests_cover_every_descriptor(workdir):
+    layer = _make_layer(workdir / "spice")
+    hashes = [d.descriptor_hash.encode() for d in _fill(layer, 7)]
+    report = layer.verify_system_integrity()
+    assert report["chain_integrity"]["valid"]
+    assert report["total_descriptors"] == 7
+    assert report["chain_hash"] == hashlib.sha256(b"".join(hashes)).hexdigest()
+    assert report["merkle_root"] == _reference_merkle_root(hashes).hex()
+    layer.close()
+
+
+def test_restart_replays_the_same_chain(workdir):
+    layer = _make_layer(workdir / "spice")
+    _fill(layer, 5)
+    before = layer.verify_system_integrity()
+    last = layer.index["descriptors"][-1]
+    layer.close()
+
+    layer = _make_layer(workdir / "spice")
+    after = layer.verify_system_integrity()
+    assert after["chain_integrity"]["valid"]
+    for key in ("total_descriptors", "chain_hash", "merkle_root"):
+        assert after[key] == before[key]
+
+    appended = layer.create_descriptor(process_name="AfterRestart")
+    assert appended.prev_descriptor_hash == layer.get_descriptor(last).descriptor_hash
+    assert layer.verify_system_integrity()["chain_integrity"]["valid"]
+    layer.close()
+
+
+def test_full_verification_detects_rewritten_descriptor(workdir):
+    layer = _make_layer(workdir / "spice")
+    _fill(layer, 6)
+    lines = layer.descriptor_file.read_text().splitlines()
+    record = json.loads(lines[2])
+    record["process_name"] = "Tampered"
+    lines[2] = json.dumps(record)
+    layer.descriptor_file.write_text("\n".join(lines) + "\n")
+
+    integrity = layer.verify_system_integrity()["chain_integrity"]
+    assert not integrity["valid"]
+    assert [e["line"] for e in integrity["errors"]] == [3]
+    layer.close()
+    with pytest.raises(IntegrityViolationError):
+        _make_layer(workdir / "spice")
+
+
+def test_recent_integrity_checks_appended_lines(workdir):
+    layer = _make_layer(workdir / "spice")
+    _fill(layer, 4)
+    assert layer.verify_recent_integrity()
+    _fill(layer, 2)
+    assert layer.verify_recent_integrity()
+
+    with open(layer.descriptor_file, "a") as f:
+        f.write(json.dumps({"descriptor_id": "forged", "descriptor_hash": "0" * 64}) + "\n")
+    assert not layer.verify_recent_integrity()
+    with pytest.raises(IntegrityViolationError):
+        layer.create_descriptor(process_name="AfterForgery")
+    layer.close()
+
+
+def test_batch_hashing_stays_in_process_by_default(workdir, monkeypatch):
+    import src.batch_hashing as batch_hashing
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker processes started")
+
+    monkeypatch.setattr(batch_hashing, "PARALLEL_HASH_MIN", 1)
+    monkeypatch.setattr(batch_hashing, "ProcessPoolExecutor", no_pool)
+    layer = _make_layer(workdir / "spice")
+    _fill(layer, 4)
+    layer.close()
+    layer = _make_layer(workdir / "spice")  # re-verifies the chain on open
+    assert layer.verify_system_integrity()["chain_integrity"]["valid"]
+    layer.close()
+
+
+def test_batch_hashing_workers_match_in_process(monkeypatch):
+    import src.batch_hashing as batch_hashing
+
+    monkeypatch.setattr(batch_hashing, "PARALLEL_HASH_MIN", 1)
+    monkeypatch.setattr(batch_hashing, "PARALLEL_HASH_CHUNK", 2)
+    inputs = [b"%d" % i for i in range(9)]
+    assert batch_hashing.batch_sha256(inputs, workers=3) == batch_hashing.sha256_hex(inputs)
+
+
+def _make_msgpack_layer(path):
+    pytest.importorskip("msgpack")
+    return ImmutableSPICELayer(storage_path=str(path), durability=Durability.NONE,
+                               record_format="msgpack")
+
+
+def test_msgpack_chain_round_trip(workdir):
+    layer = _make_msgpack_layer(workdir / "spice")
+    created = _fill(layer, 5)
+    assert layer.descriptor_file.name == "spice_chain.msgpack"
+    assert layer.verify_system_integrity()["chain_integrity"]["valid"]
+    before = layer.verify_system_integrity()
+    layer.close()
+
+    layer = _make_msgpack_layer(workdir / "spice")
+    after = layer.verify_system_integrity()
+    assert after["chain_integrity"]["valid"]
+    for key in ("total_descriptors", "chain_hash", "merkle_root"):
+        assert after[key] == before[key]
+    for descriptor in created:
+        found = layer.get_descriptor(descriptor.descriptor_id)
+        assert found.descriptor_hash == descriptor.descriptor_hash
+    assert [d.descriptor_id for d in layer.find_by_glyph("g3")] == [created[3].descriptor_id]
+
+    appended = layer.create_descriptor(process_name="AfterRestart")
+    assert appended.prev_descriptor_hash == created[-1].descriptor_hash
+
+    export = workdir / "export.jsonl"
+    assert layer.export_jsonl(str(export)) == 6
+    exported = [json.loads(line) for line in export.read_text().splitlines()]
+    assert [r["descriptor_hash"] for r in exported] == \
+        [d.descriptor_hash for d in created] + [appended.descriptor_hash]
+    layer.close()
+
+
+def test_msgpack_truncated_tail_is_reported(workdir):
+    layer = _make_msgpack_layer(workdir / "spice")
+    _fill(layer, 3)
+    data = layer.descriptor_file.read_bytes()
+    with open(layer.descriptor_file, "ab") as f:
+        f.write(data[:len(data) // 6])  # a torn copy of the first record
+    integrity = layer.verify_system_integrity()["chain_integrity"]
+    assert not integrity["valid"]
+    assert integrity["errors"][-1]["line"] == 4
+    layer.close()
+
+
+def _lookup_fixture(layer):
+    """Three descriptors sharing glyphs and apriori refs; returns their ids"""
+    return [
+        layer.create_descriptor(process_name="Lookup0", process_outcome="compliant",
+                                capability_level=1, glyph_range_start="g-a",
+                                glyph_range_end="g-b", apriori_refs=["rule-1"]).descriptor_id,
+        layer.create_descriptor(process_name="Lookup1", process_outcome="compliant",
+                                capability_level=2, glyph_range_start="g-b",
+                                glyph_range_end="g-c", aposteriori_refs=["g-x"],
+                                apriori_refs=["rule-1", "rule-2"]).descriptor_id,
+        layer.create_descriptor(process_name="Lookup2", process_outcome="compliant",
+                                capability_level=3, glyph_range_start="g-d",
+                                glyph_range_end="g-d").descriptor_id,
+    ]
+
+
+def _check_lookups(layer, ids):
+    def found(descriptors):
+        return [d.descriptor_id for d in descriptors]
+
+    assert found(layer.find_by_glyph("g-a")) == [ids[0]]
+    assert found(layer.find_by_glyph("g-b")) == [ids[0], ids[1]]
+    assert found(layer.find_by_glyph("g-x")) == [ids[1]]
+    assert found(layer.find_by_glyph("g-d")) == [ids[2]]
+    assert found(layer.find_by_apriori_ref("rule-1")) == [ids[0], ids[1]]
+    assert found(layer.find_by_apriori_ref("rule-2")) == [ids[1]]
+    assert layer.find_by_glyph("missing") == []
+    assert layer.find_by_apriori_ref("missing") == []
+
+
+def test_immutable_layer_lookups(workdir):
+    layer = _make_layer(workdir / "spice")
+    ids = _lookup_fixture(layer)
+    _check_lookups(layer, ids)
+    layer.close()
+    layer = _make_layer(workdir / "spice")  # index rebuilt from the chain
+    _check_lookups(layer, ids)
+    layer.close()
+
+
+def test_descriptor_layer_lookups(workdir):
+    layer = SPICEDescriptorLayer(storage_path=str(workdir / "spice_v1"))
+    ids = _lookup_fixture(layer)
+    _check_lookups(layer, ids)
+    layer = SPICEDescriptorLayer(storage_path=str(workdir / "spice_v1"))
+    _check_lookups(layer, ids)
+
+    # An index file saved before the lookup maps is rebuilt on open
+    index = json.loads(layer.index_file.read_text())
+    for key in ("glyph_index", "apriori_index", "offsets"):
+        del index[key]
+    layer.index_file.write_text(json.dumps(index))
+    layer = SPICEDescriptorLayer(storage_path=str(workdir / "spice_v1"))
+    _check_lookups(layer, ids)
+
+
+@pytest.mark.parametrize("mode", list(Durability))
+def test_durability_modes_sync_the_chain(workdir, monkeypatch, mode):
+    syncs = []
+    monkeypatch.setattr(immutable_spice_layer.os, "fsync", lambda fd: syncs.append(("fsync", fd)))
+    monkeypatch.setattr(immutable_spice_layer, "_fdatasync",
+                        lambda fd: syncs.append(("fdatasync", fd)))
+    layer = ImmutableSPICELayer(storage_path=str(workdir / "spice"), durability=mode,
+                                sync_interval_s=60.0, sync_every_n=2)
+    _fill(layer, 1)
+    chain_fd = layer._fds[layer.descriptor_file]
+
+    def chain_syncs():
+        return [kind for kind, fd in syncs if fd == chain_fd]
+
+    if mode is Durability.FSYNC_PER_APPEND:
+        assert chain_syncs() == ["fsync"]
+        layer.create_descriptors_batch([{"process_name": "A"}, {"process_name": "B"}])
+        assert chain_syncs() == ["fsync", "fsync"]  # one per group commit
+    elif mode is Durability.FSYNC_BATCH:
+        assert chain_syncs() == []  # below sync_every_n, before sync_interval_s
+        _fill(layer, 1)  # reaches sync_every_n: the sync thread wakes up
+        deadline = time.monotonic() + 2.0
+        while not chain_syncs() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert chain_syncs() == ["fdatasync"]
+        _fill(layer, 1)
+        layer.close()  # close syncs what is still unsynced
+        assert chain_syncs() == ["fdatasync", "fdatasync"]
+    else:
+        _fill(layer, 3)
+        assert chain_syncs() == []
+    layer.close()
+    assert layer.verify_system_integrity()["chain_integrity"]["valid"]